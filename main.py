@@ -1,14 +1,61 @@
+import argparse
+import os
+from time import perf_counter
+
 import pygame
-from pygame.sprite import Group
 
 from src.gui.settings import Settings
 from src.gui.button import Button
+from src.gui.renderer import Renderer
 
 from src.statistics.game_stats import GameStats
 from src.statistics.scoreboard import Scoreboard
 from src.characters.ship import Ship
+from src.characters.fleet import Fleet
+from src.characters.bullet_pool import BulletPool
 
 import src.utils.game_functions as gf
+from src.engine.core import Actions
+from src.utils.assets import assets
+from src.utils.frame_pacer import FramePacer
+from src.utils.replay import InputRecorder, decode_event, load_recording, state_hash
+from src.utils.savestate import restore
+from src.utils.sim_clock import SimulationClock
+
+
+def parse_args(ai_settings):
+    """Applies the command line options to the settings.
+
+    Args:
+        ai_settings (Settings): An object containing the game settings.
+
+    """
+
+    parser = argparse.ArgumentParser(description="Alien Invasion")
+    parser.add_argument('--headless', action='store_true',
+                        help="run the simulation on SDL's dummy video driver "
+                             "without drawing")
+    parser.add_argument('--render-every', type=int, default=0, metavar='N',
+                        help="in headless mode, draw every Nth tick offscreen "
+                             "(default: never)")
+    parser.add_argument('--ticks', type=int, default=0, metavar='N',
+                        help="in headless mode, stop after N ticks "
+                             "(default: when the game is over)")
+    parser.add_argument('--record', metavar='FILE',
+                        help="record the inputs of the game and hashes of its state to FILE")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="replay the inputs recorded in FILE as fast as possible, "
+                             "without drawing, and report the first state that differs")
+    args = parser.parse_args()
+
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be used together")
+
+    ai_settings.headless = args.headless
+    ai_settings.headless_render_every = args.render_every
+    ai_settings.headless_max_ticks = args.ticks
+    ai_settings.record_path = args.record
+    ai_settings.replay_path = args.replay
 
 
 def main():
@@ -16,14 +63,28 @@ def main():
 
     """
 
-    pygame.init()
     ai_settings = Settings()
+    parse_args(ai_settings)
+
+    # a replay plays with the settings of the recording, without drawing
+    if ai_settings.replay_path:
+        start_state, records = load_recording(ai_settings.replay_path, ai_settings)
+        ai_settings.headless = True
+
+    # the dummy driver must be selected before the display is initialized
+    if ai_settings.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    pygame.init()
 
     screen = pygame.display.set_mode(
         (ai_settings.screen_width, ai_settings.screen_height))
 
     pygame.display.set_caption("Alien Invasion")
 
+    # creates the object that presents each frame
+    renderer = Renderer(ai_settings, screen)
+
     # creates the play button
     play_button = Button(ai_settings, screen, "Play")
 
@@ -32,31 +93,182 @@ def main():
     stats = GameStats(ai_settings)
     sb = Scoreboard(ai_settings, screen, stats)
 
-    # creates a spaceship, a group of projectiles and
-    # a group of aliens
+    # creates the game with its fleet of aliens, and the inputs of the player
+    core = gf.create_core(ai_settings, stats, screen)
+    actions = Actions()
+
+    # creates the sprites that draw the spaceship, the projectiles
+    # and the aliens
     ship = Ship(ai_settings, screen)
-    bullets = Group()
-    aliens = Group()
-
-    # creates the fleet of aliengens
-    gf.create_fleet(ai_settings, screen, ship, aliens)
-
-    # starts the main game loop
-    while True:
-        gf.check_events(ai_settings, screen, stats, sb, play_button,
-                        ship, aliens, bullets)
-
-        if stats.game_active:
-            ship.update()
-            # get rid of projectiles and aliens that have
-            # disappeared
-            gf.update_bullets(ai_settings, screen, stats, sb, ship, aliens,
-                              bullets)
-            gf.update_aliens(ai_settings, screen, stats, sb, ship, aliens,
-                             bullets)
-
-        gf.update_screen(ai_settings, screen, stats, sb, ship, aliens, bullets,
-                         play_button)
+    bullets = BulletPool(ai_settings, screen)
+    aliens = Fleet(ai_settings, screen)
+
+    if ai_settings.replay_path:
+        run_replay(ai_settings, stats, sb, play_button, core, actions, start_state, records)
+    elif ai_settings.headless:
+        run_headless(ai_settings, stats, sb, play_button, core, actions, ship, aliens,
+                     bullets, renderer)
+    else:
+        run_window(ai_settings, stats, sb, play_button, core, actions, ship, aliens,
+                   bullets, renderer)
+
+
+def run_window(ai_settings, stats, sb, play_button, core, actions, ship, aliens, bullets,
+               renderer):
+    """Runs the main game loop in a window, pacing frames in real time.
+
+    """
+
+    # creates the frame limiter, the fixed-timestep simulation clock
+    # and draws the first frame
+    pacer = FramePacer(ai_settings)
+    sim_clock = SimulationClock(ai_settings)
+    frame_time = 0.0
+    gf.update_screen(ai_settings, stats, sb, core, ship, aliens, bullets,
+                     play_button, renderer, 1.0)
+
+    ticks = 0
+    recorder = None
+    if ai_settings.record_path:
+        recorder = InputRecorder(ai_settings.record_path, ai_settings, stats, core, actions)
+
+    # starts the main game loop; quitting exits from check_events, so the
+    # recording is closed on the way out
+    try:
+        while True:
+            # nothing moves on the Play screen, so wait for an event there
+            if not stats.game_active and ai_settings.idle_wait:
+                events = pacer.wait_events()
+            else:
+                events = pygame.event.get()
+            if recorder:
+                recorder.record_events(ticks, events)
+            gf.check_events(stats, sb, play_button, core, actions, events)
+            renderer.check_events(events)
+
+            if stats.game_active:
+                # runs as many fixed ticks as the real time elapsed requires
+                for tick in range(sim_clock.advance(frame_time)):
+                    gf.update_game(stats, sb, core, actions)
+                    ticks += 1
+                    if recorder:
+                        recorder.record_tick(ticks, ai_settings, stats, core, actions)
+                    if not stats.game_active:
+                        break
+
+            # draws the frame between the last two ticks
+            gf.update_screen(ai_settings, stats, sb, core, ship, aliens, bullets,
+                             play_button, renderer, sim_clock.alpha())
+            frame_time = pacer.tick() / 1000.0
+    finally:
+        if recorder:
+            recorder.close(ticks, ai_settings, stats, core, actions)
+        if pacer.frames:
+            print("{} frames: {:.2f} ms apart, {:.2f} ms of work, {:.0%} of the {:.2f} ms "
+                  "budget".format(pacer.frames, pacer.frame_time, pacer.work_time,
+                                  pacer.budget_used(), pacer.budget()))
+
+
+def run_headless(ai_settings, stats, sb, play_button, core, actions, ship, aliens, bullets,
+                 renderer):
+    """Runs the simulation as fast as possible, without pacing and without drawing.
+
+    The game starts right away. Events are still processed, so that bots can
+    drive the ship by posting events, and a frame is drawn offscreen every
+    headless_render_every ticks.
+
+    """
+
+    gf.start_game(sb, core)
+
+    recorder = None
+    if ai_settings.record_path:
+        recorder = InputRecorder(ai_settings.record_path, ai_settings, stats, core, actions)
+
+    ticks = 0
+    start = perf_counter()
+    while stats.game_active:
+        events = pygame.event.get()
+        if recorder:
+            recorder.record_events(ticks, events)
+        gf.check_events(stats, sb, play_button, core, actions, events)
+        gf.update_game(stats, sb, core, actions)
+        ticks += 1
+        if recorder:
+            recorder.record_tick(ticks, ai_settings, stats, core, actions)
+
+        if ai_settings.headless_render_every and ticks % ai_settings.headless_render_every == 0:
+            gf.update_screen(ai_settings, stats, sb, core, ship, aliens, bullets,
+                             play_button, renderer, 1.0)
+
+        if ticks == ai_settings.headless_max_ticks:
+            break
+
+    elapsed = perf_counter() - start
+    if recorder:
+        recorder.close(ticks, ai_settings, stats, core, actions)
+    print("{} ticks in {:.2f} s ({:.0f} ticks/s), score {}, level {}, {} ships left".format(
+        ticks, elapsed, ticks / elapsed, stats.score, stats.level, stats.ships_left))
+
+    # the images of the sprites are decoded once and shared
+    report = assets.report()
+    print("assets: {} images, {} KiB, {} hits, {} misses".format(
+        report['images'], report['bytes'] // 1024, report['hits'], report['misses']))
+
+
+def run_replay(ai_settings, stats, sb, play_button, core, actions, start_state, records):
+    """Replays a recording as fast as possible, without pacing and without drawing.
+
+    The game is restored to the state the recording starts from, then the
+    records are played in order: the simulation runs until the tick of each
+    record, each event is passed to check_events() and each state hash is
+    compared with the hash of the replayed game. The replay stops at the
+    first hash that differs.
+
+    Args:
+        start_state (bytes): The snapshot the recording starts from.
+        records (list): The records of the recording, after its header.
+
+    Returns:
+        str: The first divergence from the recording, or None if there is none.
+
+    """
+
+    restore(start_state, ai_settings, stats, core, actions)
+    gf.prep_scoreboard(sb)
+
+    ticks = hashes = 0
+    mismatch = None
+    start = perf_counter()
+    for record in records:
+        while ticks < record['tick'] and stats.game_active:
+            gf.update_game(stats, sb, core, actions)
+            ticks += 1
+
+        # a game over before the tick of the record is a divergence too
+        if ticks < record['tick']:
+            mismatch = "the game is over at tick {}, the recording goes on to tick {}".format(
+                ticks, record['tick'])
+            break
+
+        if 'event' in record:
+            gf.check_events(stats, sb, play_button, core, actions,
+                            [decode_event(record['event'])])
+            continue
+
+        expected = record['hash'] if 'hash' in record else record['end']
+        found = state_hash(ai_settings, stats, core, actions)
+        hashes += 1
+        if found != expected:
+            mismatch = "state hash {} instead of {} at tick {}".format(found, expected, ticks)
+            break
+
+    elapsed = perf_counter() - start
+    print("{} ticks in {:.2f} s ({:.0f} ticks/s), {} state hashes checked, score {}, "
+          "level {}".format(ticks, elapsed, ticks / max(elapsed, 1e-9), hashes,
+                            stats.score, stats.level))
+    print("diverged: {}".format(mismatch) if mismatch else "same states as the recording")
+    return mismatch
 
 
 if __name__ == '__main__':
@@ -1,55 +1,69 @@
-import pygame
 from pygame.sprite import Sprite
 
+from src.utils.assets import assets
+
 
 class Alien(Sprite):
-    """A class representing a single alien in the fleet.
+    """A class that draws a single alien of the fleet.
+
+    The alien is moved by the game core; the sprite draws its entity and
+    sync() copies the position of the entity into the rect.
 
     Attributes:
         screen (pygame.Surface): The game screen on which the alien will be displayed.
         ai_settings (Settings): An object containing the game settings.
+        entity (AlienEntity): The alien of the game core drawn by the sprite.
         image (pygame.Surface): The image of the alien.
         rect (pygame.Rect): The rectangle representing the alien's position on the screen.
-        x (float): The exact horizontal position of the alien.
+        column (int): The column of the alien in the fleet grid.
+        row (int): The row of the alien in the fleet grid.
 
     Methods:
-        __init__(self, ai_settings, screen):
-            Initializes an alien object and sets its initial position.
+        __init__(self, ai_settings, screen, entity):
+            Initializes the sprite of an alien entity.
+
+        sync(self):
+            Moves the rect to the position of the entity.
 
         blitme(self):
             Draws the alien at its current position.
 
-        check_edges(self):
-            Returns True if the alien is at the edge of the screen.
-
-        update(self):
-            Moves the alien to the right.
+        render_position(self, alpha):
+            Returns the position of the alien between the previous and the current tick.
 
     """
 
-    def __init__(self, ai_settings, screen):
-        """Initializes an alien object and sets its initial position.
+    def __init__(self, ai_settings, screen, entity):
+        """Initializes the sprite of an alien entity.
 
         Args:
             ai_settings (Settings): An object containing the game settings.
             screen (pygame.Surface): The game screen on which the alien will be displayed.
+            entity (AlienEntity): The alien of the game core drawn by the sprite.
 
         """
 
         super(Alien, self).__init__()
         self.screen = screen
         self.ai_settings = ai_settings
+        self.entity = entity
 
         # load the alien image and set its rect attribute
-        self.image = pygame.image.load('assets/images/alien.png')     # err
+        self.image = assets.load_image('assets/images/alien.png')
         self.rect = self.image.get_rect()
+        self.sync()
+
+        # the cell of the alien in the fleet grid
+        self.column = entity.column
+        self.row = entity.row
 
-        # start each new alien near the top left of the screen
-        self.rect.x = self.rect.width
-        self.rect.y = self.rect.height
+    def sync(self):
+        """Moves the rect to the position of the entity.
 
-        # store the exact position of the alien
-        self.x = float(self.rect.x)
+        """
+
+        self.rect.x = self.entity.left
+        self.rect.y = self.entity.top
 
     def blitme(self):
         """Draws the alien at its current position on the screen.
@@ -58,20 +72,18 @@ class Alien(Sprite):
 
         self.screen.blit(self.image, self.rect)
 
-    def check_edges(self):
-        """Returns True if the alien is at the edge of the screen.
-
-        """
+    def render_position(self, alpha):
+        """Returns the position of the alien between the previous and the current tick.
 
-        screen_rect = self.screen.get_rect()
-        if self.rect.right >= screen_rect.right:
-            return True
-        elif self.rect.left <= 0:
-            return True
+        Args:
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
 
-    def update(self):
-        """Moves the alien to the right.
+        Returns:
+            tuple: The top-left corner at which the alien is drawn.
 
         """
-        self.x += self.ai_settings.alien_speed_factor * self.ai_settings.fleet_direction
-        self.rect.x = self.x
+
+        entity = self.entity
+        offset_x = (entity.x - entity.prev_x) * (1.0 - alpha)
+        offset_y = (entity.y - entity.prev_y) * (1.0 - alpha)
+        return self.rect.x - round(offset_x), self.rect.y - round(offset_y)
@@ -3,66 +3,83 @@ from pygame.sprite import Sprite
 
 
 class Bullet(Sprite):
-    """A class that manages projectiles fired by the spaceship.
+    """A class that draws a projectile fired by the spaceship.
+
+    The bullet is moved by the game core; the sprite draws its entity and
+    sync() copies the position of the entity into the rect.
 
     Attributes:
+        ai_settings (Settings): An object containing the game settings.
         screen (pygame.Surface): The game screen on which the bullet will be displayed.
+        entity (BulletEntity): The bullet of the game core drawn by the sprite.
         rect (pygame.Rect): The rectangle representing the bullet's position on the screen.
-        y (float): The vertical position of the bullet.
         color (tuple): The color of the bullet.
-        speed_factor (float): The speed factor at which the bullet moves.
 
     Methods:
-        __init__(self, ai_settings, screen, ship):
-            Creates a bullet object at the current position of the spaceship.
+        __init__(self, ai_settings, screen, entity):
+            Initializes the sprite of a bullet entity.
+
+        sync(self):
+            Moves the rect to the position of the entity.
 
-        update(self):
-            Moves the bullet upward on the screen.
+        render_position(self, alpha):
+            Returns the position of the bullet between the previous and the current tick.
 
         draw_bullet(self):
             Draws the bullet on the screen.
 
     """
 
-    def __init__(self, ai_settings, screen, ship):
-        """Creates a bullet object at the current position of the spaceship.
+    def __init__(self, ai_settings, screen, entity):
+        """Initializes the sprite of a bullet entity.
 
         Args:
             ai_settings (Settings): An object containing the game settings.
             screen (pygame.Surface): The game screen on which the bullet will be displayed.
-            ship (Ship): The spaceship object from which the bullet is fired.
+            entity (BulletEntity): The bullet of the game core drawn by the sprite.
 
         """
 
         super(Bullet, self).__init__()  # testar super().__init__()
+        self.ai_settings = ai_settings
         self.screen = screen
+        self.entity = entity
 
         # create a rectangle for the bullet at (0, 0) and then set the correct position
         self.rect = pygame.Rect(0, 0, ai_settings.bullet_width,
                                 ai_settings.bullet_height)
-        self.rect.centerx = ship.rect.centerx
-        self.rect.top = ship.rect.top
-
-        # store the position of the bullet as a decimal value
-        self.y = float(self.rect.y)
+        self.sync()
 
         self.color = ai_settings.bullet_color
-        self.speed_factor = ai_settings.bullet_speed_factor
 
-    def update(self):
-        """Moves the bullet upward on the screen.
+    def sync(self):
+        """Moves the rect to the position of the entity.
 
         """
 
-        # update the decimal position of the bullet
-        self.y -= self.speed_factor
+        self.rect.x = self.entity.left
+        self.rect.y = self.entity.top
+
+    def render_position(self, alpha):
+        """Returns the position of the bullet between the previous and the current tick.
+
+        Args:
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            tuple: The top-left corner at which the bullet is drawn.
 
-        # update the position of rect
-        self.rect.y = self.y
+        """
+
+        offset = (self.entity.y - self.entity.prev_y) * (1.0 - alpha)
+        return self.rect.x, self.rect.y - round(offset)
 
     def draw_bullet(self):
         """Draws the bullet on the screen.
 
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+
         """
 
-        pygame.draw.rect(self.screen, self.color, self.rect)
+        return pygame.draw.rect(self.screen, self.color, self.rect)
@@ -0,0 +1,82 @@
+from pygame.sprite import Group
+
+from src.characters.bullet import Bullet
+
+
+class BulletPool(Group):
+    """A group of the bullet sprites that draw the bullets of a GameCore.
+
+    The core recycles its bullet entities through a free list, so the pool
+    keeps the sprite of every entity it has drawn: a bullet fired again is
+    drawn by the sprite it already had. Once bullets_allowed bullets have
+    been fired, sync() no longer creates anything.
+
+    Attributes:
+        ai_settings (Settings): An object containing the game settings.
+        screen (pygame.Surface): The game screen on which the bullets will be displayed.
+        sprites_of (dict): The sprite of each bullet entity drawn so far.
+
+    Methods:
+        __init__(self, ai_settings, screen):
+            Initializes an empty pool.
+
+        copy(self):
+            Returns a new pool holding the same bullets.
+
+        sync(self, entities):
+            Brings the group up to date with the bullets of the game core.
+
+    """
+
+    def __init__(self, ai_settings, screen):
+        """Initializes an empty pool.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            screen (pygame.Surface): The game screen on which the bullets will be displayed.
+
+        """
+
+        super(BulletPool, self).__init__()
+        self.ai_settings = ai_settings
+        self.screen = screen
+        self.sprites_of = {}
+
+    def copy(self):
+        """Returns a new pool holding the same bullets.
+
+        Group.copy() would call BulletPool(sprites), without the settings and the screen.
+
+        Returns:
+            BulletPool: The copy, which keeps the sprites of the entities drawn so far.
+
+        """
+
+        pool = BulletPool(self.ai_settings, self.screen)
+        pool.add(self.sprites())
+        pool.sprites_of.update(self.sprites_of)
+        return pool
+
+    def sync(self, entities):
+        """Brings the group up to date with the bullets of the game core.
+
+        Args:
+            entities (Components): The bullet entities of the game core.
+
+        """
+
+        spritedict, sprites_of = self.spritedict, self.sprites_of
+        for entity in entities:
+            bullet = sprites_of.get(entity)
+            if bullet is None:
+                bullet = sprites_of[entity] = Bullet(self.ai_settings, self.screen, entity)
+            if bullet not in spritedict:
+                self.add_internal(bullet)
+                bullet.add_internal(self)
+            bullet.sync()
+
+        # takes out the bullets the core removed, whose handles left their table
+        if len(spritedict) != len(entities):
+            for bullet in [bullet for bullet in spritedict if bullet.entity.index < 0]:
+                bullet.remove_internal(self)
+                self.remove_internal(bullet)
@@ -0,0 +1,193 @@
+def round_coordinate(value):
+    """Rounds a coordinate the way pygame.Rect rounds float coordinates.
+
+    Args:
+        value (float): The exact coordinate.
+
+    Returns:
+        int: The coordinate rounded half away from zero.
+
+    """
+
+    if value >= 0:
+        return int(value + 0.5)
+    return -int(0.5 - value)
+
+
+class Entity:
+    """A lightweight handle to one row of a component table, for stress-scale counts.
+
+    Sprites carry an instance dict, a dict of the groups they belong to and
+    a pygame.Rect. The components of an entity are stored in the lists of
+    its table, one list per component, and the handle only holds the table
+    and the row: the systems of the game core update a component of every
+    entity at once, while the collision tests and the sprite classes read
+    an entity as an object. Entities do not depend on pygame.
+
+    Attributes:
+        components (Components): The component table the entity belongs to.
+        index (int): The row of the entity in its table, or -1 once it was despawned.
+
+    Methods:
+        __init__(self, components, index):
+            Initializes a handle to a row of a component table.
+
+        x, y, prev_x, prev_y, vx, vy:
+            The position, previous position and velocity components of the entity.
+
+        width, height:
+            The collider of the entity, shared by the entities of its table.
+
+        left, top, right, bottom:
+            The edges of the entity, rounded as pygame.Rect rounds them.
+
+        overlaps(self, other):
+            Returns True if the two entities overlap.
+
+    """
+
+    __slots__ = ('components', 'index')
+
+    def __init__(self, components, index):
+        """Initializes a handle to a row of a component table.
+
+        Entities are created by Components.spawn().
+
+        Args:
+            components (Components): The component table the entity belongs to.
+            index (int): The row of the entity in its table.
+
+        """
+
+        self.components = components
+        self.index = index
+
+    @property
+    def x(self):
+        """The exact horizontal position of the entity."""
+        return self.components.x[self.index]
+
+    @x.setter
+    def x(self, value):
+        self.components.x[self.index] = value
+
+    @property
+    def y(self):
+        """The exact vertical position of the entity."""
+        return self.components.y[self.index]
+
+    @y.setter
+    def y(self, value):
+        self.components.y[self.index] = value
+
+    @property
+    def prev_x(self):
+        """The horizontal position of the entity on the previous tick."""
+        return self.components.prev_x[self.index]
+
+    @prev_x.setter
+    def prev_x(self, value):
+        self.components.prev_x[self.index] = value
+
+    @property
+    def prev_y(self):
+        """The vertical position of the entity on the previous tick."""
+        return self.components.prev_y[self.index]
+
+    @prev_y.setter
+    def prev_y(self, value):
+        self.components.prev_y[self.index] = value
+
+    @property
+    def vx(self):
+        """The horizontal velocity of the entity, in pixels per second."""
+        return self.components.vx[self.index]
+
+    @property
+    def vy(self):
+        """The vertical velocity of the entity, in pixels per second."""
+        return self.components.vy[self.index]
+
+    @property
+    def width(self):
+        """The width of the entity."""
+        return self.components.width
+
+    @property
+    def height(self):
+        """The height of the entity."""
+        return self.components.height
+
+    @property
+    def left(self):
+        """The left edge of the entity."""
+        return round_coordinate(self.components.x[self.index])
+
+    @property
+    def top(self):
+        """The top edge of the entity."""
+        return round_coordinate(self.components.y[self.index])
+
+    @property
+    def right(self):
+        """The right edge of the entity."""
+        components = self.components
+        return round_coordinate(components.x[self.index]) + components.width
+
+    @property
+    def bottom(self):
+        """The bottom edge of the entity."""
+        components = self.components
+        return round_coordinate(components.y[self.index]) + components.height
+
+    def overlaps(self, other):
+        """Returns True if the two entities overlap, as pygame.Rect.colliderect() does.
+
+        Args:
+            other (Entity): The other entity.
+
+        """
+
+        left, top = self.left, self.top
+        other_left, other_top = other.left, other.top
+        return (left < other_left + other.width and other_left < left + self.width
+                and top < other_top + other.height and other_top < top + self.height)
+
+
+class AlienEntity(Entity):
+    """A lightweight alien of the fleet.
+
+    Methods:
+        column, row:
+            The cell of the alien in the fleet lattice.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def column(self):
+        """The column of the alien in the fleet lattice."""
+        return self.components.column[self.index]
+
+    @property
+    def row(self):
+        """The row of the alien in the fleet lattice."""
+        return self.components.row[self.index]
+
+
+class BulletEntity(Entity):
+    """A lightweight bullet fired by the spaceship.
+
+    Methods:
+        speed:
+            The speed, in pixels per second, at which the bullet moves up.
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def speed(self):
+        """The speed, in pixels per second, at which the bullet moves up."""
+        return -self.components.vy[self.index]
@@ -0,0 +1,103 @@
+from pygame.sprite import Group
+
+from src.characters.alien import Alien
+
+
+class Fleet(Group):
+    """A group of the alien sprites that draw the fleet of a GameCore.
+
+    The core keeps the living alien entity of each (column, row) cell of its
+    lattice, and sync() gives each one a sprite. The aliens of a new fleet
+    are new entities, so they get new sprites too: the FleetRenderer sees
+    sprites it has not composed and composes the image of the new fleet.
+
+    Attributes:
+        ai_settings (Settings): An object containing the game settings.
+        screen (pygame.Surface): The game screen on which the aliens will be displayed.
+        cells (dict): The sprite of the alien of each (column, row) cell.
+
+    Methods:
+        __init__(self, ai_settings, screen):
+            Initializes an empty fleet.
+
+        add_internal(self, sprite, layer):
+            Adds an alien and records its cell.
+
+        remove_internal(self, sprite):
+            Removes an alien and forgets its cell.
+
+        copy(self):
+            Returns a new fleet holding the same aliens.
+
+        sync(self, aliens):
+            Brings the group up to date with the aliens of the game core.
+
+    """
+
+    def __init__(self, ai_settings, screen):
+        """Initializes an empty fleet.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            screen (pygame.Surface): The game screen on which the aliens will be displayed.
+
+        """
+
+        self.ai_settings = ai_settings
+        self.screen = screen
+        self.cells = {}
+        super(Fleet, self).__init__()
+
+    def add_internal(self, sprite, layer=None):
+        """Adds an alien and records its cell.
+
+        """
+
+        super(Fleet, self).add_internal(sprite, layer)
+        self.cells[(sprite.column, sprite.row)] = sprite
+
+    def remove_internal(self, sprite):
+        """Removes an alien and forgets its cell.
+
+        """
+
+        super(Fleet, self).remove_internal(sprite)
+        if self.cells.get((sprite.column, sprite.row)) is sprite:
+            del self.cells[(sprite.column, sprite.row)]
+
+    def copy(self):
+        """Returns a new fleet holding the same aliens.
+
+        Group.copy() would call Fleet(sprites), without the settings and the screen.
+
+        Returns:
+            Fleet: The copy.
+
+        """
+
+        fleet = Fleet(self.ai_settings, self.screen)
+        fleet.add(self.sprites())
+        return fleet
+
+    def sync(self, aliens):
+        """Brings the group up to date with the aliens of the game core.
+
+        Args:
+            aliens (dict): The living alien entity of each (column, row) cell.
+
+        """
+
+        cells = self.cells
+        for cell, entity in aliens.items():
+            alien = cells.get(cell)
+            if alien is None or alien.entity is not entity:
+                if alien is not None:
+                    self.remove(alien)
+                self.add(Alien(self.ai_settings, self.screen, entity))
+            else:
+                alien.sync()
+
+        # takes out the aliens the core destroyed
+        if len(cells) != len(aliens):
+            for cell in [cell for cell in cells if cell not in aliens]:
+                self.remove(cells[cell])
@@ -1,9 +1,13 @@
-import pygame
 from pygame.sprite import Sprite
 
+from src.utils.assets import assets
+
 
 class Ship(Sprite):
-    """A class representing the player's spaceship.
+    """A class that draws the player's spaceship.
+
+    The spaceship is moved by the game core; sync() copies the position of
+    its entity before the spaceship is drawn.
 
     Attributes:
         screen (pygame.Surface): The game screen on which the spaceship will be displayed.
@@ -12,22 +16,21 @@ class Ship(Sprite):
         rect (pygame.Rect): The rectangle representing the spaceship's position on the screen.
         screen_rect (pygame.Rect): The rectangle representing the dimensions of the game screen.
         center (float): The horizontal position of the spaceship's center.
-        moving_right (bool): A flag indicating whether the spaceship is moving right.
-        moving_left (bool): A flag indicating whether the spaceship is moving left.
+        prev_center (float): The horizontal position of the spaceship's center on the previous tick.
 
     Methods:
         __init__(self, ai_settings, screen):
             Initializes the spaceship and sets its initial position.
 
-        update(self):
-            Updates the spaceship's position based on the movement flags.
+        sync(self, core):
+            Moves the spaceship to the position of the spaceship of the game core.
+
+        render_position(self, alpha):
+            Returns the position of the spaceship between the previous and the current tick.
 
         blitme(self):
             Draws the spaceship at its current position on the screen.
 
-        center_ship(self):
-            Centers the spaceship on the screen horizontally.
-
     """
 
     def __init__(self, ai_settings, screen):
@@ -44,7 +47,7 @@ class Ship(Sprite):
         self.ai_settings = ai_settings
 
         # load the spaceship image and set its rect attribute
-        self.image = pygame.image.load('assets/images/ship.png')  # spaceship image
+        self.image = assets.load_image('assets/images/ship.png')  # spaceship image
         self.rect = self.image.get_rect()   # a rectangle being created from the image's dimensions
         self.screen_rect = screen.get_rect()  # the rectangle is being placed on the screen
 
@@ -54,35 +57,41 @@ class Ship(Sprite):
 
         # store a decimal value for the center of the spaceship
         self.center = float(self.rect.centerx)
+        self.prev_center = self.center
 
-        # movement flags
-        self.moving_right = False
-        self.moving_left = False
+    def sync(self, core):
+        """Moves the spaceship to the position of the spaceship of the game core.
 
-    def update(self):
-        """Updates the spaceship's position based on the movement flags.
+        Args:
+            core (GameCore): The game being drawn.
 
         """
 
-        # update the value of the spaceship's center, not the rectangle
-        if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.center += self.ai_settings.ship_speed_factor
-        if self.moving_left and self.rect.left > 0:
-            self.center -= self.ai_settings.ship_speed_factor
+        self.rect.x = core.ship.left
+        self.rect.y = core.ship.top
+        self.center = core.ship_center
+        self.prev_center = core.prev_ship_center
 
-        # update the rect object based on self.center
-        self.rect.centerx = self.center
+    def render_position(self, alpha):
+        """Returns the position of the spaceship between the previous and the current tick.
 
-    def blitme(self):
-        """Draws the spaceship at its current position on the screen.
+        Args:
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            tuple: The top-left corner at which the spaceship is drawn.
 
         """
 
-        self.screen.blit(self.image, self.rect)  # COINCIDINDO O RETÂNGULO COM A ESPAÇONAVE (OU RETÂNGULO DA ESPAÇONAVE)
+        offset = (self.center - self.prev_center) * (1.0 - alpha)
+        return self.rect.x - round(offset), self.rect.y
+
+    def blitme(self):
+        """Draws the spaceship at its current position on the screen.
 
-    def center_ship(self):
-        """Centers the spaceship on the screen horizontally.
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
 
         """
 
-        self.center = self.screen_rect.centerx
+        return self.screen.blit(self.image, self.rect)  # COINCIDINDO O RETÂNGULO COM A ESPAÇONAVE (OU RETÂNGULO DA ESPAÇONAVE)
@@ -0,0 +1,511 @@
+try:
+    import numpy as np
+except ImportError:     # the batch simulator is optional
+    np = None
+
+from src.statistics.game_stats import GameStats
+
+
+def round_half_away(values):
+    """Rounds an array the way pygame.Rect rounds float coordinates.
+
+    Args:
+        values (numpy.ndarray): The float coordinates.
+
+    Returns:
+        numpy.ndarray: The rounded coordinates, as integers.
+
+    """
+
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+
+class BatchSimulator:
+    """Many independent games advanced in lockstep, one vectorized tick for all.
+
+    Each game plays the rules of GameCore with its own Settings, so
+    speedup_scale, score_scale, fleet_drop_speed and the other settings can
+    differ from one game to the next. The state of every game is a row of
+    stacked arrays. The aliens of a column share their horizontal position
+    and the aliens of a row share their vertical position, so the fleet of a
+    game is an (rows, columns) grid of flags, one position per column and
+    the distance the fleet dropped; the bullets are (games, bullets_allowed)
+    slots. A tick is a fixed number of NumPy operations whatever the number
+    of games, and games that are over stay still.
+
+    Attributes:
+        settings (list): The settings of each game.
+        stats (list): The GameStats of each game, refreshed by sync_stats().
+        number_games (int): The number of games.
+        screen_width (int): The width of the game screen.
+        screen_height (int): The height of the game screen.
+        ship_width (int): The width of the spaceship.
+        ship_height (int): The height of the spaceship.
+        alien_width (int): The width of an alien.
+        alien_height (int): The height of an alien.
+        bullet_width (int): The width of a bullet.
+        bullet_height (int): The height of a bullet.
+        dt (float): The duration, in seconds, of a simulation tick.
+        sweep (bool): A flag indicating whether bullets are tested along their path, as with collision_sweep.
+        columns (int): The number of columns of a fleet.
+        rows (int): The number of rows of a fleet.
+        start_x (numpy.ndarray): The horizontal position of each column of a new fleet.
+        speedup_scale (numpy.ndarray): The speedup_scale of each game.
+        score_scale (numpy.ndarray): The score_scale of each game.
+        fleet_drop_speed (numpy.ndarray): The fleet_drop_speed of each game.
+        ship_limit (numpy.ndarray): The ship_limit of each game.
+        bullets_allowed (numpy.ndarray): The bullets_allowed of each game.
+        respawn_ticks_after_hit (numpy.ndarray): The ticks each game stays still after a hit.
+        ship_speed (numpy.ndarray): The ship_speed_factor of each game.
+        bullet_speed (numpy.ndarray): The bullet_speed_factor of each game.
+        alien_speed (numpy.ndarray): The alien_speed_factor of each game.
+        fleet_direction (numpy.ndarray): The fleet_direction of each game.
+        alien_points (numpy.ndarray): The alien_points of each game.
+        score (numpy.ndarray): The score of each game.
+        high_score (numpy.ndarray): The high score of each game.
+        level (numpy.ndarray): The level of each game.
+        ships_left (numpy.ndarray): The ships left of each game.
+        game_active (numpy.ndarray): A flag per game indicating whether it is still played.
+        respawn_ticks (numpy.ndarray): The ticks each game stays still before it resumes.
+        ticks (numpy.ndarray): The ticks each game has been played.
+        ship_center (numpy.ndarray): The exact center of the spaceship of each game.
+        ship_left (numpy.ndarray): The left edge of the rect of the spaceship of each game.
+        alive (numpy.ndarray): A flag per game, row and column indicating whether the alien lives.
+        column_count (numpy.ndarray): The number of living aliens of each column of each fleet.
+        row_count (numpy.ndarray): The number of living aliens of each row of each fleet.
+        alien_x (numpy.ndarray): The exact horizontal position of each column of each fleet.
+        fleet_drop (numpy.ndarray): The distance each fleet dropped.
+        bullet_active (numpy.ndarray): A flag per bullet slot indicating whether it holds a bullet.
+        bullet_x (numpy.ndarray): The left edge of each bullet.
+        bullet_y (numpy.ndarray): The exact vertical position of each bullet.
+        bullet_prev_y (numpy.ndarray): The vertical position of each bullet on the previous tick.
+        bullet_speed_slots (numpy.ndarray): The speed of each bullet, set when it was fired.
+        bullet_serial (numpy.ndarray): The order in which the bullets were fired.
+        serials (int): The number of bullets fired, used to order them.
+
+    Methods:
+        __init__(self, settings, screen_size, ship_size, alien_size):
+            Allocates the arrays of every game.
+
+        start_games(self):
+            Resets the settings, statistics and entities and starts every game.
+
+        create_fleets(self, games):
+            Gives the games a complete fleet of aliens.
+
+        fire(self, games):
+            Fires a bullet in the games that have not reached their limit.
+
+        collide_bullets(self, running):
+            Removes the bullets and aliens that collided and returns the kills.
+
+        fleet_bottom(self):
+            Returns the bottom edge of the lowest living alien of each game.
+
+        aliens_touching(self, index, left, top, right, bottom):
+            Returns a flag per game indicating whether an alien overlaps the area.
+
+        ship_hit(self, games, ship_hits):
+            Responds to the spaceship of the games being hit by an alien.
+
+        step(self, moving_right, moving_left, fire):
+            Advances every game by one simulation tick.
+
+        sync_stats(self):
+            Copies the arrays into the GameStats and the dynamic settings of each game.
+
+    """
+
+    def __init__(self, settings, screen_size, ship_size, alien_size):
+        """Allocates the arrays of every game.
+
+        The screen, bullet size, tick rate and collision_sweep are the ones
+        of the first settings.
+
+        Args:
+            settings (list): The settings of each game.
+            screen_size (tuple): The width and height of the game screen.
+            ship_size (tuple): The width and height of the spaceship.
+            alien_size (tuple): The width and height of an alien.
+
+        """
+
+        if np is None:
+            raise RuntimeError("the batch simulator requires NumPy")
+        if settings[0].bullet_width > alien_size[0]:
+            raise ValueError("the batch simulator requires bullets narrower than an alien")
+
+        self.settings = list(settings)
+        self.stats = [GameStats(ai_settings) for ai_settings in self.settings]
+        self.number_games = number_games = len(self.settings)
+        first = self.settings[0]
+
+        self.screen_width, self.screen_height = screen_size
+        self.ship_width, self.ship_height = ship_size
+        self.alien_width, self.alien_height = alien_size
+        self.bullet_width, self.bullet_height = first.bullet_width, first.bullet_height
+        self.dt = 1.0 / first.sim_tick_rate
+        self.sweep = first.collision_sweep
+
+        # the fleet grid of game_functions.create_fleet()
+        self.columns = int((self.screen_width - 2 * self.alien_width) / (2 * self.alien_width))
+        self.rows = int((self.screen_height - 3 * self.alien_height - self.ship_height)
+                        / (2 * self.alien_height))
+        self.start_x = (self.alien_width
+                        + 2 * self.alien_width * np.arange(self.columns)).astype(np.float64)
+
+        def per_game(name, dtype):
+            return np.array([getattr(ai_settings, name) for ai_settings in self.settings],
+                            dtype=dtype)
+
+        # the settings that stay the same during a game
+        self.speedup_scale = per_game('speedup_scale', np.float64)
+        self.score_scale = per_game('score_scale', np.float64)
+        self.fleet_drop_speed = per_game('fleet_drop_speed', np.int64)
+        self.ship_limit = per_game('ship_limit', np.int64)
+        self.bullets_allowed = per_game('bullets_allowed', np.int64)
+        self.respawn_ticks_after_hit = np.array(
+            [int(round(ai_settings.respawn_delay * ai_settings.sim_tick_rate))
+             for ai_settings in self.settings], dtype=np.int64)
+
+        # the dynamic settings
+        self.ship_speed = np.zeros(number_games)
+        self.bullet_speed = np.zeros(number_games)
+        self.alien_speed = np.zeros(number_games)
+        self.fleet_direction = np.ones(number_games, dtype=np.int64)
+        self.alien_points = np.zeros(number_games, dtype=np.int64)
+
+        # the statistics
+        self.score = np.zeros(number_games, dtype=np.int64)
+        self.high_score = np.zeros(number_games, dtype=np.int64)
+        self.level = np.ones(number_games, dtype=np.int64)
+        self.ships_left = self.ship_limit.copy()
+        self.game_active = np.zeros(number_games, dtype=bool)
+        self.respawn_ticks = np.zeros(number_games, dtype=np.int64)
+        self.ticks = np.zeros(number_games, dtype=np.int64)
+
+        # the entities
+        self.ship_center = np.full(number_games, float(self.screen_width // 2))
+        self.ship_left = np.full(number_games, self.screen_width // 2 - self.ship_width // 2,
+                                 dtype=np.int64)
+        self.alive = np.zeros((number_games, self.rows, self.columns), dtype=bool)
+        self.column_count = np.zeros((number_games, self.columns), dtype=np.int64)
+        self.row_count = np.zeros((number_games, self.rows), dtype=np.int64)
+        self.alien_x = np.tile(self.start_x, (number_games, 1))
+        self.fleet_drop = np.zeros(number_games, dtype=np.int64)
+
+        slots = (number_games, int(self.bullets_allowed.max()))
+        self.bullet_active = np.zeros(slots, dtype=bool)
+        self.bullet_x = np.zeros(slots, dtype=np.int64)
+        self.bullet_y = np.zeros(slots)
+        self.bullet_prev_y = np.zeros(slots)
+        self.bullet_speed_slots = np.zeros(slots)
+        self.bullet_serial = np.zeros(slots, dtype=np.int64)
+        self.serials = 0
+
+    def start_games(self):
+        """Resets the settings, statistics and entities and starts every game.
+
+        """
+
+        for ai_settings in self.settings:
+            ai_settings.initialize_dynamic_settings()
+        self.ship_speed[:] = [ai_settings.ship_speed_factor for ai_settings in self.settings]
+        self.bullet_speed[:] = [ai_settings.bullet_speed_factor
+                                for ai_settings in self.settings]
+        self.alien_speed[:] = [ai_settings.alien_speed_factor for ai_settings in self.settings]
+        self.fleet_direction[:] = [ai_settings.fleet_direction for ai_settings in self.settings]
+        self.alien_points[:] = [ai_settings.alien_points for ai_settings in self.settings]
+
+        self.score[:] = 0
+        self.level[:] = 1
+        self.ships_left[:] = self.ship_limit
+        self.respawn_ticks[:] = 0
+        self.ticks[:] = 0
+        self.game_active[:] = True
+
+        games = np.ones(self.number_games, dtype=bool)
+        self.bullet_active[:] = False
+        self.create_fleets(games)
+        self.ship_center[:] = float(self.screen_width // 2)
+
+    def create_fleets(self, games):
+        """Gives the games a complete fleet of aliens.
+
+        Args:
+            games (numpy.ndarray): A flag per game indicating whether it gets a new fleet.
+
+        """
+
+        self.alive[games] = True
+        self.column_count[games] = self.rows
+        self.row_count[games] = self.columns
+        self.alien_x[games] = self.start_x
+        self.fleet_drop[games] = 0
+
+    def fire(self, games):
+        """Fires a bullet in the games that have not reached their limit.
+
+        As with GameCore.fire(), the bullet leaves the rect of the spaceship.
+
+        Args:
+            games (numpy.ndarray): A flag per game indicating whether it fires.
+
+        """
+
+        games = games & (self.bullet_active.sum(axis=1) < self.bullets_allowed)
+        if not games.any():
+            return
+        index = np.flatnonzero(games)
+        slot = np.argmin(self.bullet_active[index], axis=1)
+
+        self.bullet_active[index, slot] = True
+        self.bullet_x[index, slot] = (self.ship_left[index] + self.ship_width // 2
+                                      - self.bullet_width // 2)
+        self.bullet_y[index, slot] = self.bullet_prev_y[index, slot] = float(
+            self.screen_height - self.ship_height)
+        self.bullet_speed_slots[index, slot] = self.bullet_speed[index]
+        self.bullet_serial[index, slot] = self.serials + np.arange(len(index))
+        self.serials += len(index)
+
+    def fleet_bottom(self):
+        """Returns the bottom edge of the lowest living alien of each game.
+
+        Returns:
+            numpy.ndarray: The bottom edges; an empty fleet gives its top.
+
+        """
+
+        occupied = self.row_count > 0
+        lowest = np.where(occupied.any(axis=1),
+                          self.rows - 1 - np.argmax(occupied[:, ::-1], axis=1), -1)
+        return 2 * self.alien_height * (lowest + 1) + self.fleet_drop
+
+    def collide_bullets(self, running):
+        """Removes the bullets and aliens that collided and returns the kills.
+
+        The bullets of each game are resolved in the order they were fired,
+        and each one destroys every living alien it overlaps, as
+        GameCore.update_bullets() does; one bullet slot of every game is
+        resolved at a time. Only the games with a bullet above the bottom of
+        their fleet are tested, and a bullet, narrower than the space between
+        two columns, overlaps a single column.
+
+        Args:
+            running (numpy.ndarray): A flag per game indicating whether it is played this tick.
+
+        Returns:
+            numpy.ndarray: The number of aliens destroyed in each game.
+
+        """
+
+        kills = np.zeros(self.number_games, dtype=np.int64)
+        top = round_half_away(self.bullet_y)
+        candidates = (self.bullet_active & running[:, None]
+                      & (top < self.fleet_bottom()[:, None]))
+        index = np.flatnonzero(candidates.any(axis=1))
+        if not len(index):
+            return kills
+
+        top, candidates = top[index], candidates[index]
+        bottom = top + self.bullet_height
+        if self.sweep:
+            bottom = np.maximum(bottom, round_half_away(self.bullet_prev_y[index])
+                                + self.bullet_height)
+        left = self.bullet_x[index]
+        right = left + self.bullet_width
+
+        # the column and the rows each bullet overlaps
+        column_left = round_half_away(self.alien_x[index])
+        row_top = (self.alien_height + 2 * self.alien_height * np.arange(self.rows)[None, :]
+                   + self.fleet_drop[index, None])
+        columns = ((left[:, :, None] < column_left[:, None, :] + self.alien_width)
+                   & (column_left[:, None, :] < right[:, :, None]))
+        rows = ((top[:, :, None] < row_top[:, None, :] + self.alien_height)
+                & (row_top[:, None, :] < bottom[:, :, None]))
+        candidates &= columns.any(axis=2)
+        column = np.argmax(columns, axis=2)
+
+        # the bullet slots of each game, in the order they were fired
+        games = np.arange(len(index))
+        every_row = np.arange(self.rows)[None, :]
+        order = np.argsort(np.where(candidates, self.bullet_serial[index], -1), axis=1)
+        for slot in order.T:
+            testing = candidates[games, slot]
+            if not testing.any():
+                continue
+            hit_column = column[games, slot]
+            column_alive = self.alive[index[:, None], every_row, hit_column[:, None]]
+            hits = column_alive & rows[games, slot] & testing[:, None]
+            if self.sweep:
+                # the bullet goes up, so it meets the lowest aliens first
+                lowest = self.rows - 1 - np.argmax(hits[:, ::-1], axis=1)
+                hits &= every_row == lowest[:, None]
+
+            killed = np.count_nonzero(hits, axis=1)
+            hit = killed > 0
+            if not hit.any():
+                continue
+            self.alive[index[:, None], every_row, hit_column[:, None]] = column_alive & ~hits
+            self.column_count[index, hit_column] -= killed
+            self.row_count[index] -= hits
+            self.bullet_active[index[hit], slot[hit]] = False
+            kills[index] += killed
+        return kills
+
+    def aliens_touching(self, index, left, top, right, bottom):
+        """Returns a flag per game indicating whether an alien overlaps the area.
+
+        Args:
+            index (numpy.ndarray): The indices of the games tested.
+            left (numpy.ndarray): The left edge of the area in each game.
+            top (int): The top edge of the area.
+            right (numpy.ndarray): The right edge of the area in each game.
+            bottom (int): The bottom edge of the area.
+
+        Returns:
+            numpy.ndarray: The flags.
+
+        """
+
+        column_left = round_half_away(self.alien_x[index])
+        row_top = (self.alien_height + 2 * self.alien_height * np.arange(self.rows)[None, :]
+                   + self.fleet_drop[index, None])
+        columns = ((left[:, None] < column_left + self.alien_width)
+                   & (column_left < right[:, None]))
+        rows = (top < row_top + self.alien_height) & (row_top < bottom)
+        return (self.alive[index] & rows[:, :, None] & columns[:, None, :]).any(axis=(1, 2))
+
+    def ship_hit(self, games, ship_hits):
+        """Responds to the spaceship of the games being hit by an alien.
+
+        Args:
+            games (numpy.ndarray): A flag per game indicating whether its spaceship was hit.
+            ship_hits (numpy.ndarray): The number of hits of each game, updated in place.
+
+        """
+
+        if not games.any():
+            return
+        ship_hits += games
+        respawn = games & (self.ships_left > 0)
+        self.ships_left[respawn] -= 1
+
+        # empty the fleet and the bullets, and start again
+        self.bullet_active[respawn] = False
+        self.create_fleets(respawn)
+        self.ship_center[respawn] = float(self.screen_width // 2)
+        self.ship_left[respawn] = self.screen_width // 2 - self.ship_width // 2
+        self.respawn_ticks[respawn] = self.respawn_ticks_after_hit[respawn]
+
+        self.game_active[games & ~respawn] = False
+
+    def step(self, moving_right, moving_left, fire):
+        """Advances every game by one simulation tick.
+
+        Args:
+            moving_right (numpy.ndarray): A flag per game indicating whether its spaceship moves right.
+            moving_left (numpy.ndarray): A flag per game indicating whether its spaceship moves left.
+            fire (numpy.ndarray): A flag per game indicating whether it fires a bullet first.
+
+        Returns:
+            tuple: The number of kills, ship hits and level ups of each game.
+
+        """
+
+        dt, active = self.dt, self.game_active
+        ship_hits = np.zeros(self.number_games, dtype=np.int64)
+        level_ups = np.zeros(self.number_games, dtype=np.int64)
+
+        # the games stay still until their spaceship respawns, and drop their shots
+        waiting = active & (self.respawn_ticks > 0)
+        self.respawn_ticks[waiting] -= 1
+        running = active & ~waiting
+
+        self.fire(fire & running)
+        self.ticks[active] += 1
+
+        # moves the spaceships, from the edges their rects had reached
+        right = running & moving_right & (self.ship_left + self.ship_width < self.screen_width)
+        left = running & moving_left & (self.ship_left > 0)
+        self.ship_center = self.ship_center + np.where(right, self.ship_speed * dt, 0.0)
+        self.ship_center = self.ship_center - np.where(left, self.ship_speed * dt, 0.0)
+        self.ship_left = np.where(running, round_half_away(self.ship_center)
+                                  - self.ship_width // 2, self.ship_left)
+
+        # moves the bullets and checks collisions before culling them
+        moving = self.bullet_active & running[:, None]
+        self.bullet_prev_y = np.where(moving, self.bullet_y, self.bullet_prev_y)
+        self.bullet_y = np.where(moving, self.bullet_y - self.bullet_speed_slots * dt,
+                                 self.bullet_y)
+        kills = self.collide_bullets(running)
+        self.score += self.alien_points * kills
+        np.maximum(self.high_score, self.score, out=self.high_score)
+        self.bullet_active &= ~(running[:, None] & (round_half_away(self.bullet_y)
+                                                    + self.bullet_height <= 0))
+
+        # destroys existing bullets and creates a new fleet
+        cleared = running & (self.row_count.sum(axis=1) == 0)
+        if cleared.any():
+            self.bullet_active[cleared] = False
+            self.ship_speed[cleared] *= self.speedup_scale[cleared]
+            self.bullet_speed[cleared] *= self.speedup_scale[cleared]
+            self.alien_speed[cleared] *= self.speedup_scale[cleared]
+            self.alien_points[cleared] = (self.alien_points[cleared]
+                                          * self.score_scale[cleared]).astype(np.int64)
+            self.level[cleared] += 1
+            level_ups[cleared] += 1
+            self.create_fleets(cleared)
+
+        # the fleets turn around and drop when they touch an edge
+        games = np.arange(self.number_games)
+        occupied = self.column_count > 0
+        first = np.argmax(occupied, axis=1)
+        last = self.columns - 1 - np.argmax(occupied[:, ::-1], axis=1)
+        column_left = round_half_away(self.alien_x)
+        edge = running & occupied.any(axis=1) & (
+            (column_left[games, last] + self.alien_width >= self.screen_width)
+            | (column_left[games, first] <= 0))
+        self.fleet_drop[edge] += self.fleet_drop_speed[edge]
+        self.fleet_direction[edge] *= -1
+
+        velocity = self.alien_speed * self.fleet_direction
+        self.alien_x = np.where(running[:, None], self.alien_x + velocity[:, None] * dt,
+                                self.alien_x)
+
+        # check for collisions between aliens and the spaceship, in the
+        # games whose fleet is as low as the spaceship
+        ship_top = self.screen_height - self.ship_height
+        index = np.flatnonzero(running & (self.fleet_bottom() > ship_top))
+        if len(index):
+            touching = np.zeros(self.number_games, dtype=bool)
+            touching[index] = self.aliens_touching(
+                index, self.ship_left[index], ship_top,
+                self.ship_left[index] + self.ship_width, ship_top + self.ship_height)
+            self.ship_hit(touching, ship_hits)
+
+        # check if any alien has reached the bottom of the screen
+        self.ship_hit(running & (self.row_count.sum(axis=1) > 0)
+                      & (self.fleet_bottom() >= self.screen_height), ship_hits)
+
+        return kills, ship_hits, level_ups
+
+    def sync_stats(self):
+        """Copies the arrays into the GameStats and the dynamic settings of each game.
+
+        Returns:
+            list: The GameStats of each game.
+
+        """
+
+        columns = zip(self.score.tolist(), self.high_score.tolist(), self.level.tolist(),
+                      self.ships_left.tolist(), self.game_active.tolist(),
+                      self.respawn_ticks.tolist(), self.ship_speed.tolist(),
+                      self.bullet_speed.tolist(), self.alien_speed.tolist(),
+                      self.fleet_direction.tolist(), self.alien_points.tolist())
+        for stats, ai_settings, values in zip(self.stats, self.settings, columns):
+            (stats.score, stats.high_score, stats.level, stats.ships_left, stats.game_active,
+             stats.respawn_ticks, ai_settings.ship_speed_factor,
+             ai_settings.bullet_speed_factor, ai_settings.alien_speed_factor,
+             ai_settings.fleet_direction, ai_settings.alien_points) = values
+        return self.stats
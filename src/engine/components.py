@@ -0,0 +1,617 @@
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:     # the 'numpy' fleet backend is optional
+    np = None
+
+from src.characters.entities import AlienEntity, Entity, round_coordinate
+
+
+class Components:
+    """The components of every entity of one kind, one list per component.
+
+    An entity is a row of the lists, and the Entity handed out by spawn() is
+    a handle to its row. The systems of the game core update a component of
+    every entity with one pass over its list, so a new kind of entity only
+    needs a new table, not new loops. The rows are kept packed: despawn()
+    moves the last row into the hole, and compact() drops many rows at once
+    while keeping the order of the others.
+
+    The lists are replaced rather than updated by move(), translate(),
+    set_velocity() and compact(), so they must be read from the table.
+
+    Attributes:
+        width (int): The width of the collider shared by the entities.
+        height (int): The height of the collider shared by the entities.
+        entity_class (type): The class of the handles, Entity or one of its subclasses.
+        entities (list): The handle of each row.
+        x (list): The exact horizontal position of each entity.
+        y (list): The exact vertical position of each entity.
+        prev_x (list): The horizontal position of each entity on the previous tick.
+        prev_y (list): The vertical position of each entity on the previous tick.
+        vx (list): The horizontal velocity of each entity, in pixels per second.
+        vy (list): The vertical velocity of each entity, in pixels per second.
+
+    Methods:
+        __init__(self, width, height, entity_class):
+            Initializes an empty table.
+
+        __len__(self):
+            Returns the number of entities.
+
+        __iter__(self):
+            Iterates over the handles, in the order of the rows.
+
+        __getitem__(self, index):
+            Returns the handle of a row.
+
+        spawn(self, x, y, vx, vy, entity):
+            Adds an entity at the given position and returns its handle.
+
+        despawn(self, entity):
+            Removes an entity, moving the last row into its place.
+
+        compact(self, keep):
+            Removes the entities whose flag is False, keeping the order of the others.
+
+        clear(self):
+            Removes every entity.
+
+        move(self, dt):
+            Moves every entity by its velocity.
+
+        translate(self, dx, dy):
+            Moves every entity by the same offset.
+
+        set_velocity(self, vx, vy):
+            Gives every entity the same velocity.
+
+    """
+
+    # the components stored per entity, one list each
+    names = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy')
+
+    def __init__(self, width, height, entity_class=Entity):
+        """Initializes an empty table.
+
+        Args:
+            width (int): The width of the collider shared by the entities.
+            height (int): The height of the collider shared by the entities.
+            entity_class (type): The class of the handles.
+
+        """
+
+        self.width = width
+        self.height = height
+        self.entity_class = entity_class
+        self.entities = []
+        for name in self.names:
+            setattr(self, name, [])
+
+    def __len__(self):
+        """Returns the number of entities."""
+        return len(self.entities)
+
+    def __iter__(self):
+        """Iterates over the handles, in the order of the rows."""
+        return iter(self.entities)
+
+    def __getitem__(self, index):
+        """Returns the handle of a row."""
+        return self.entities[index]
+
+    def spawn(self, x, y, vx=0.0, vy=0.0, entity=None):
+        """Adds an entity at the given position and returns its handle.
+
+        Args:
+            x (float): The horizontal position of the entity.
+            y (float): The vertical position of the entity.
+            vx (float): The horizontal velocity, in pixels per second.
+            vy (float): The vertical velocity, in pixels per second.
+            entity (Entity): A handle despawned from this table to reuse, or
+                None for a new one.
+
+        Returns:
+            Entity: The handle of the entity.
+
+        """
+
+        index = len(self.entities)
+        if entity is None:
+            entity = self.entity_class(self, index)
+        else:
+            entity.index = index
+        self.entities.append(entity)
+
+        self.x.append(x)
+        self.y.append(y)
+        self.prev_x.append(x)
+        self.prev_y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        return entity
+
+    def despawn(self, entity):
+        """Removes an entity, moving the last row into its place.
+
+        Nothing is shifted, so the order of the rows is not kept.
+
+        Args:
+            entity (Entity): An entity of the table.
+
+        Raises:
+            ValueError: If the entity is not in the table.
+
+        """
+
+        entities, index = self.entities, entity.index
+        if not 0 <= index < len(entities) or entities[index] is not entity:
+            raise ValueError("the entity is not in the table")
+
+        last = entities.pop()
+        moved = last is not entity
+        for name in self.names:
+            column = getattr(self, name)
+            value = column.pop()
+            if moved:
+                column[index] = value
+        if moved:
+            entities[index] = last
+            last.index = index
+        entity.index = -1
+
+    def compact(self, keep):
+        """Removes the entities whose flag is False, keeping the order of the others.
+
+        Args:
+            keep (list): A flag per row indicating whether its entity stays.
+
+        Returns:
+            list: The handles of the removed entities.
+
+        """
+
+        for name in self.names:
+            setattr(self, name, list(compress(getattr(self, name), keep)))
+
+        removed = [entity for entity, kept in zip(self.entities, keep) if not kept]
+        for entity in removed:
+            entity.index = -1
+        self.entities = list(compress(self.entities, keep))
+        for index, entity in enumerate(self.entities):
+            entity.index = index
+        return removed
+
+    def clear(self):
+        """Removes every entity.
+
+        """
+
+        for entity in self.entities:
+            entity.index = -1
+        self.entities.clear()
+        for name in self.names:
+            getattr(self, name).clear()
+
+    def move(self, dt):
+        """Moves every entity by its velocity.
+
+        The current positions become the previous ones.
+
+        Args:
+            dt (float): The duration, in seconds, of the simulation tick.
+
+        """
+
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x = [x + vx * dt for x, vx in zip(self.x, self.vx)]
+        self.y = [y + vy * dt for y, vy in zip(self.y, self.vy)]
+
+    def translate(self, dx, dy):
+        """Moves every entity by the same offset.
+
+        The previous positions are left as they are.
+
+        Args:
+            dx (float): The horizontal offset.
+            dy (float): The vertical offset.
+
+        """
+
+        if dx:
+            self.x = [x + dx for x in self.x]
+        if dy:
+            self.y = [y + dy for y in self.y]
+
+    def set_velocity(self, vx, vy):
+        """Gives every entity the same velocity.
+
+        Args:
+            vx (float): The horizontal velocity, in pixels per second.
+            vy (float): The vertical velocity, in pixels per second.
+
+        """
+
+        self.vx = [vx] * len(self.entities)
+        self.vy = [vy] * len(self.entities)
+
+
+class FleetComponents(Components):
+    """The components of the aliens, which are also found by their cell in the fleet lattice.
+
+    The edges of the fleet are those of its extreme aliens. The fleet moves
+    rigidly, so they stay the extreme aliens until one of them is despawned
+    or aliens are added: only then are they searched again.
+
+    Attributes:
+        column (list): The column of each alien in the fleet lattice.
+        row (list): The row of each alien in the fleet lattice.
+        cells (dict): The handle of the alien of each (column, row) cell.
+        extremes (tuple): The aliens with the smallest left, the largest
+            right and the largest bottom edges, or None to search them again.
+
+    Methods:
+        __init__(self, width, height):
+            Initializes an empty fleet.
+
+        spawn(self, x, y, column, row, vx):
+            Adds an alien to a cell of the lattice and returns its handle.
+
+        despawn(self, entity):
+            Removes an alien and frees its cell.
+
+        compact(self, keep):
+            Removes the aliens whose flag is False, keeping the order of the others.
+
+        clear(self):
+            Removes every alien.
+
+        invalidate_edges(self):
+            Makes the next call to edges() search the extreme aliens again.
+
+        edges(self):
+            Returns the left, right and bottom edges of the fleet.
+
+    """
+
+    names = Components.names + ('column', 'row')
+
+    def __init__(self, width, height):
+        """Initializes an empty fleet.
+
+        Args:
+            width (int): The width of an alien.
+            height (int): The height of an alien.
+
+        """
+
+        super(FleetComponents, self).__init__(width, height, AlienEntity)
+        self.cells = {}
+        self.extremes = None
+
+    def spawn(self, x, y, column=0, row=0, vx=0.0):
+        """Adds an alien to a cell of the lattice and returns its handle.
+
+        Args:
+            x (float): The horizontal position of the alien.
+            y (float): The vertical position of the alien.
+            column (int): The column of the alien in the fleet lattice.
+            row (int): The row of the alien in the fleet lattice.
+            vx (float): The horizontal velocity, in pixels per second.
+
+        Returns:
+            AlienEntity: The handle of the alien.
+
+        """
+
+        alien = super(FleetComponents, self).spawn(x, y, vx)
+        self.column.append(column)
+        self.row.append(row)
+        self.cells[(column, row)] = alien
+        self.extremes = None
+        return alien
+
+    def despawn(self, entity):
+        """Removes an alien and frees its cell.
+
+        Args:
+            entity (AlienEntity): An alien of the fleet.
+
+        Raises:
+            ValueError: If the alien is not in the fleet.
+
+        """
+
+        cell = (entity.column, entity.row)
+        super(FleetComponents, self).despawn(entity)
+        del self.cells[cell]
+        if self.extremes is not None and entity in self.extremes:
+            self.extremes = None
+
+    def compact(self, keep):
+        """Removes the aliens whose flag is False, keeping the order of the others.
+
+        Args:
+            keep (list): A flag per row indicating whether its alien stays.
+
+        Returns:
+            list: The handles of the removed aliens.
+
+        """
+
+        removed = super(FleetComponents, self).compact(keep)
+        self.cells = dict(zip(zip(self.column, self.row), self.entities))
+        self.extremes = None
+        return removed
+
+    def clear(self):
+        """Removes every alien.
+
+        """
+
+        super(FleetComponents, self).clear()
+        self.cells.clear()
+        self.extremes = None
+
+    def invalidate_edges(self):
+        """Makes the next call to edges() search the extreme aliens again.
+
+        Needed after the positions were written through the handles.
+
+        """
+
+        self.extremes = None
+
+    def edges(self):
+        """Returns the left, right and bottom edges of the fleet.
+
+        Returns:
+            tuple: The left, right and bottom edges, or None if the fleet is empty.
+
+        """
+
+        entities = self.entities
+        if not entities:
+            return None
+        if self.extremes is None:
+            # rounding keeps the order of the positions
+            x, y = self.x, self.y
+            self.extremes = (entities[x.index(min(x))], entities[x.index(max(x))],
+                             entities[y.index(max(y))])
+
+        left, right, bottom = self.extremes
+        return left.left, right.right, bottom.bottom
+
+
+class NumpyFleetComponents(FleetComponents):
+    """The components of the aliens, stored in NumPy arrays.
+
+    Each component is a view of the first rows of a larger buffer, which
+    grows by doubling, so spawning an alien does not copy the fleet. The
+    fleet moves with one vectorized add per axis, drops with a single add
+    and finds its edges with the min and max of its positions, so a tick of
+    the fleet is a fixed number of NumPy operations whatever its size. The
+    handles read the same positions as with lists, one scalar at a time.
+
+    Attributes:
+        buffers (dict): The buffer of each component.
+
+    Methods:
+        __init__(self, width, height):
+            Initializes an empty fleet.
+
+        resize(self, count):
+            Makes the components views of the first count rows of the buffers.
+
+        spawn(self, x, y, column, row, vx):
+            Adds an alien to a cell of the lattice and returns its handle.
+
+        despawn(self, entity):
+            Removes an alien, moving the last row into its place.
+
+        compact(self, keep):
+            Removes the aliens whose flag is False, keeping the order of the others.
+
+        clear(self):
+            Removes every alien.
+
+        move(self, dt):
+            Moves every alien by its velocity.
+
+        translate(self, dx, dy):
+            Moves every alien by the same offset.
+
+        set_velocity(self, vx, vy):
+            Gives every alien the same velocity.
+
+        edges(self):
+            Returns the left, right and bottom edges of the fleet.
+
+    """
+
+    def __init__(self, width, height):
+        """Initializes an empty fleet.
+
+        Args:
+            width (int): The width of an alien.
+            height (int): The height of an alien.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+
+        """
+
+        if np is None:
+            raise RuntimeError("the 'numpy' fleet backend requires NumPy")
+
+        super(NumpyFleetComponents, self).__init__(width, height)
+        self.buffers = {name: np.zeros(64, dtype=np.int64 if name in ('column', 'row')
+                                       else np.float64)
+                        for name in self.names}
+        self.resize(0)
+
+    def resize(self, count):
+        """Makes the components views of the first count rows of the buffers.
+
+        The buffers are doubled until they hold count rows.
+
+        Args:
+            count (int): The number of aliens.
+
+        """
+
+        for name, buffer in self.buffers.items():
+            if len(buffer) < count:
+                buffer = np.zeros(max(count, 2 * len(buffer)), dtype=buffer.dtype)
+                buffer[:len(self.entities)] = getattr(self, name)
+                self.buffers[name] = buffer
+            setattr(self, name, buffer[:count])
+
+    def spawn(self, x, y, column=0, row=0, vx=0.0):
+        """Adds an alien to a cell of the lattice and returns its handle.
+
+        Args:
+            x (float): The horizontal position of the alien.
+            y (float): The vertical position of the alien.
+            column (int): The column of the alien in the fleet lattice.
+            row (int): The row of the alien in the fleet lattice.
+            vx (float): The horizontal velocity, in pixels per second.
+
+        Returns:
+            AlienEntity: The handle of the alien.
+
+        """
+
+        index = len(self.entities)
+        self.resize(index + 1)
+        for name, value in zip(self.names, (x, y, x, y, vx, 0.0, column, row)):
+            getattr(self, name)[index] = value
+
+        alien = self.entity_class(self, index)
+        self.entities.append(alien)
+        self.cells[(column, row)] = alien
+        return alien
+
+    def despawn(self, entity):
+        """Removes an alien, moving the last row into its place.
+
+        Args:
+            entity (AlienEntity): An alien of the fleet.
+
+        Raises:
+            ValueError: If the alien is not in the fleet.
+
+        """
+
+        entities, index = self.entities, entity.index
+        if not 0 <= index < len(entities) or entities[index] is not entity:
+            raise ValueError("the entity is not in the table")
+
+        del self.cells[(entity.column, entity.row)]
+        last = entities.pop()
+        if last is not entity:
+            for name in self.names:
+                column = getattr(self, name)
+                column[index] = column[-1]
+            entities[index] = last
+            last.index = index
+        entity.index = -1
+        self.resize(len(entities))
+
+    def compact(self, keep):
+        """Removes the aliens whose flag is False, keeping the order of the others.
+
+        Args:
+            keep (list): A flag per row indicating whether its alien stays.
+
+        Returns:
+            list: The handles of the removed aliens.
+
+        """
+
+        keep = np.asarray(keep, dtype=bool)
+        for name in self.names:
+            column = getattr(self, name)
+            kept = column[keep]
+            column[:len(kept)] = kept
+
+        removed = [entity for entity, kept in zip(self.entities, keep) if not kept]
+        for entity in removed:
+            entity.index = -1
+        self.entities = list(compress(self.entities, keep))
+        for index, entity in enumerate(self.entities):
+            entity.index = index
+        self.resize(len(self.entities))
+        self.cells = dict(zip(zip(self.column.tolist(), self.row.tolist()), self.entities))
+        return removed
+
+    def clear(self):
+        """Removes every alien.
+
+        """
+
+        for entity in self.entities:
+            entity.index = -1
+        self.entities.clear()
+        self.cells.clear()
+        self.resize(0)
+
+    def move(self, dt):
+        """Moves every alien by its velocity.
+
+        The current positions become the previous ones.
+
+        Args:
+            dt (float): The duration, in seconds, of the simulation tick.
+
+        """
+
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+    def translate(self, dx, dy):
+        """Moves every alien by the same offset.
+
+        The previous positions are left as they are.
+
+        Args:
+            dx (float): The horizontal offset.
+            dy (float): The vertical offset.
+
+        """
+
+        if dx:
+            self.x += dx
+        if dy:
+            self.y += dy
+
+    def set_velocity(self, vx, vy):
+        """Gives every alien the same velocity.
+
+        Args:
+            vx (float): The horizontal velocity, in pixels per second.
+            vy (float): The vertical velocity, in pixels per second.
+
+        """
+
+        self.vx[:] = vx
+        self.vy[:] = vy
+
+    def edges(self):
+        """Returns the left, right and bottom edges of the fleet.
+
+        Returns:
+            tuple: The left, right and bottom edges, or None if the fleet is empty.
+
+        """
+
+        if not self.entities:
+            return None
+
+        # rounding keeps the order of the positions
+        return (round_coordinate(float(self.x.min())),
+                round_coordinate(float(self.x.max())) + self.width,
+                round_coordinate(float(self.y.max())) + self.height)
@@ -0,0 +1,507 @@
+from src.characters.entities import BulletEntity, round_coordinate
+from src.engine.components import Components, FleetComponents, NumpyFleetComponents
+from src.engine.systems import CollisionSystem, InputSystem, MovementSystem, ScoringSystem
+from src.utils.collisions import (box_overlaps_mask, groupcollide, lattice_groupcollide,
+                                  masks_overlap, numpy_groupcollide, overlapping,
+                                  spatial_groupcollide)
+from src.utils.spatial_hash import SpatialHash
+
+
+class Actions:
+    """The inputs of the player for the next tick.
+
+    Attributes:
+        moving_right (bool): A flag indicating whether the spaceship moves right.
+        moving_left (bool): A flag indicating whether the spaceship moves left.
+        fire (int): The number of shots requested since the last tick.
+
+    """
+
+    def __init__(self):
+        """Initializes the actions with nothing pressed.
+
+        """
+
+        self.moving_right = False
+        self.moving_left = False
+        self.fire = 0
+
+
+class GameCore:
+    """The rules of the game on component tables, without pygame.
+
+    Every front end plays the game through step(): game_functions turns the
+    pygame events into Actions and draws the entities with sprites, and the
+    farm plays bots on it without a display.
+
+    The spaceship, the bullets and the aliens are stored in component
+    tables, one list per component, and a tick runs ordered systems over
+    them: input, then the movement, collision and scoring of the bullets,
+    then those of the fleet. The sprites of the front end render the tables
+    once per drawn frame.
+
+    The fleet is kept on its lattice: the edge and bottom checks read the
+    extreme aliens only, or the min and max of the positions with the
+    'numpy' fleet_backend, and the 'lattice' collision backend only tests a
+    bullet against the aliens of the cells it covers. Fired bullets reuse
+    the handles of a free list, so that a game firing steadily allocates
+    nothing that it keeps.
+
+    Attributes:
+        ai_settings (Settings): An object containing the game settings.
+        stats (GameStats): An object containing the game statistical data.
+        screen_width (int): The width of the game screen.
+        screen_height (int): The height of the game screen.
+        alien_size (tuple): The width and height of an alien.
+        ship_mask (tuple): The opaque pixels of each row of the spaceship, as bits.
+        alien_mask (tuple): The opaque pixels of each row of an alien, as bits.
+        dt (float): The duration, in seconds, of a simulation tick.
+        ships (Components): The component table of the spaceship.
+        ship (Entity): The spaceship; its position is the one of its rect.
+        ship_center (float): The exact horizontal position of the spaceship's center.
+        prev_ship_center (float): The center of the spaceship on the previous tick.
+        bullets (Components): The bullets, in the order they were fired.
+        free_bullets (list): The handles of the bullets that are ready to be fired again.
+        aliens (FleetComponents): The living aliens, also found by their (column, row) cell,
+            in lists or, with the 'numpy' fleet_backend, in NumPy arrays.
+        columns (int): The number of columns of the lattice.
+        rows (int): The number of rows of the lattice.
+        pitch_x (int): The horizontal distance between two columns of the lattice.
+        pitch_y (int): The vertical distance between two rows of the lattice.
+        grid (SpatialHash): The grid of the aliens of the 'spatial_hash' collision backend.
+        collisions (dict): The aliens hit by each bullet on the current tick.
+        ship_collided (bool): A flag indicating whether the fleet reached the spaceship on the current tick.
+        bullet_systems (tuple): The movement, collision and scoring systems of the bullets.
+        alien_systems (tuple): The movement, collision and scoring systems of the fleet.
+        systems (tuple): Every system, in the order a tick runs them.
+        events (dict): The number of kills, ship hits and level ups of the last tick.
+
+    Methods:
+        __init__(self, ai_settings, stats, screen_size, ship_size, alien_size,
+                 ship_mask, alien_mask):
+            Creates the spaceship and an empty fleet.
+
+        start_game(self):
+            Resets the settings, statistics and entities and starts a new game.
+
+        create_fleet(self):
+            Creates a complete fleet of aliens.
+
+        center_ship(self):
+            Centers the spaceship on the screen horizontally.
+
+        spawn_bullet(self, x, y, speed):
+            Spawns a bullet, reusing a handle of the free list if there is one.
+
+        fire(self):
+            Fires a bullet if the limit has not been reached yet.
+
+        clear_bullets(self):
+            Removes every bullet.
+
+        update_bounds(self):
+            Returns the left, right and bottom edges of the fleet.
+
+        query(self, left, top, right, bottom):
+            Returns the aliens of the cells an area may overlap.
+
+        collide(self, left, top, right, bottom):
+            Returns the aliens that overlap an area.
+
+        lowest_alien(self, column):
+            Returns the lowest living alien of a column.
+
+        lowest_aliens(self):
+            Returns the lowest living alien of every column.
+
+        collide_alien_mask(self, left, top, right, bottom, alien):
+            Returns True if an area covers an opaque pixel of an alien.
+
+        collide_bullets(self):
+            Returns the aliens hit by each bullet.
+
+        collide_ship(self):
+            Returns True if an alien touches the spaceship.
+
+        update_bullets(self):
+            Runs the systems of the bullets.
+
+        update_aliens(self):
+            Runs the systems of the fleet.
+
+        ship_hit(self):
+            Responds to the spaceship being hit by an alien.
+
+        step(self, actions):
+            Advances the game by one simulation tick.
+
+    """
+
+    def __init__(self, ai_settings, stats, screen_size, ship_size, alien_size,
+                 ship_mask=None, alien_mask=None):
+        """Creates the spaceship and an empty fleet.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            stats (GameStats): An object containing the game statistical data.
+            screen_size (tuple): The width and height of the game screen.
+            ship_size (tuple): The width and height of the spaceship.
+            alien_size (tuple): The width and height of an alien.
+            ship_mask (tuple): The opaque pixels of each row of the spaceship, as bits.
+            alien_mask (tuple): The opaque pixels of each row of an alien, as bits.
+
+        Raises:
+            ValueError: If collision_mode is 'mask' and a mask is missing.
+            RuntimeError: If fleet_backend is 'numpy' and NumPy is not installed.
+
+        """
+
+        if ai_settings.collision_mode == 'mask' and (ship_mask is None or alien_mask is None):
+            raise ValueError("collision_mode 'mask' needs the masks of the spaceship "
+                             "and of an alien")
+
+        self.ai_settings = ai_settings
+        self.stats = stats
+        self.screen_width, self.screen_height = screen_size
+        self.alien_size = alien_size
+        self.ship_mask = ship_mask
+        self.alien_mask = alien_mask
+        self.dt = 1.0 / ai_settings.sim_tick_rate
+
+        # start the spaceship at the bottom center of the screen
+        ship_width, ship_height = ship_size
+        self.ships = Components(ship_width, ship_height)
+        self.ship_center = self.prev_ship_center = float(self.screen_width // 2)
+        self.ship = self.ships.spawn(self.screen_width // 2 - ship_width // 2,
+                                     self.screen_height - ship_height)
+        self.bullets = Components(ai_settings.bullet_width, ai_settings.bullet_height,
+                                  BulletEntity)
+        self.free_bullets = []
+
+        # create_fleet() leaves one alien of space between two aliens
+        if ai_settings.fleet_backend == 'numpy':
+            self.aliens = NumpyFleetComponents(*alien_size)
+        else:
+            self.aliens = FleetComponents(*alien_size)
+        self.columns = self.rows = 0
+        self.pitch_x = 2 * alien_size[0]
+        self.pitch_y = 2 * alien_size[1]
+        self.grid = None
+
+        # the bullets move and hit the fleet before the fleet moves
+        self.collisions = {}
+        self.ship_collided = False
+        self.bullet_systems = (MovementSystem('bullets'), CollisionSystem('bullets'),
+                               ScoringSystem('bullets'))
+        self.alien_systems = (MovementSystem('aliens'), CollisionSystem('ship'),
+                              ScoringSystem('ship'))
+        self.systems = (InputSystem(),) + self.bullet_systems + self.alien_systems
+
+        self.events = {'kills': 0, 'ship_hits': 0, 'level_ups': 0}
+
+    def start_game(self):
+        """Resets the settings, statistics and entities and starts a new game.
+
+        """
+
+        self.ai_settings.initialize_dynamic_settings()
+        self.stats.reset_stats()
+        self.stats.game_active = True
+
+        self.aliens.clear()
+        self.clear_bullets()
+        self.create_fleet()
+        self.center_ship()
+
+    def create_fleet(self):
+        """Creates a complete fleet of aliens.
+
+        As many aliens as fit are placed in each row, one alien of space
+        apart, and as many rows as fit above the spaceship.
+
+        """
+
+        alien_width, alien_height = self.alien_size
+        number_aliens_x = int((self.screen_width - 2 * alien_width) / (2 * alien_width))
+        number_rows = int((self.screen_height - 3 * alien_height - self.ship.height)
+                          / (2 * alien_height))
+
+        aliens = self.aliens
+        for row_number in range(number_rows):
+            for alien_number in range(number_aliens_x):
+                aliens.spawn(alien_width + 2 * alien_width * alien_number,
+                             alien_height + 2 * alien_height * row_number,
+                             alien_number, row_number)
+        self.columns = max(self.columns, number_aliens_x)
+        self.rows = max(self.rows, number_rows)
+
+    def center_ship(self):
+        """Centers the spaceship on the screen horizontally.
+
+        """
+
+        ship = self.ship
+        self.ship_center = self.prev_ship_center = float(self.screen_width // 2)
+        ship.x = ship.prev_x = round_coordinate(self.ship_center) - ship.width // 2
+
+    def spawn_bullet(self, x, y, speed):
+        """Spawns a bullet, reusing a handle of the free list if there is one.
+
+        Args:
+            x (float): The horizontal position of the bullet.
+            y (float): The vertical position of the bullet.
+            speed (float): The speed, in pixels per second, at which the bullet moves up.
+
+        Returns:
+            BulletEntity: The bullet.
+
+        """
+
+        free_bullets = self.free_bullets
+        return self.bullets.spawn(x, y, 0.0, -speed,
+                                  free_bullets.pop() if free_bullets else None)
+
+    def fire(self):
+        """Fires a bullet if the limit has not been reached yet.
+
+        """
+
+        ai_settings, ship = self.ai_settings, self.ship
+        if len(self.bullets) < ai_settings.bullets_allowed:
+            self.spawn_bullet(ship.x + ship.width // 2 - ai_settings.bullet_width // 2, ship.y,
+                              ai_settings.bullet_speed_factor)
+
+    def clear_bullets(self):
+        """Removes every bullet.
+
+        """
+
+        self.free_bullets.extend(self.bullets)
+        self.bullets.clear()
+
+    def update_bounds(self):
+        """Returns the left, right and bottom edges of the fleet.
+
+        Returns:
+            tuple: The left, right and bottom edges, or None if the fleet is empty.
+
+        """
+
+        return self.aliens.edges()
+
+    def query(self, left, top, right, bottom):
+        """Returns the aliens of the cells an area may overlap.
+
+        The origin of the lattice is computed from any living alien. Each
+        alien rounds its own exact position, so the area is widened by one
+        pixel on every side to never miss an alien that is one pixel off.
+
+        Args:
+            left (int): The left edge of the area.
+            top (int): The top edge of the area.
+            right (int): The right edge of the area.
+            bottom (int): The bottom edge of the area.
+
+        Returns:
+            list: The candidate aliens.
+
+        """
+
+        aliens = self.aliens
+        if not aliens:
+            return []
+        anchor = aliens[0]
+        origin_x = anchor.left - anchor.column * self.pitch_x
+        origin_y = anchor.top - anchor.row * self.pitch_y
+
+        first_column = max((left - 1 - origin_x - anchor.width) // self.pitch_x + 1, 0)
+        last_column = min((right - origin_x) // self.pitch_x, self.columns - 1)
+        first_row = max((top - 1 - origin_y - anchor.height) // self.pitch_y + 1, 0)
+        last_row = min((bottom - origin_y) // self.pitch_y, self.rows - 1)
+
+        cells = aliens.cells
+        candidates = []
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                alien = cells.get((column, row))
+                if alien is not None:
+                    candidates.append(alien)
+        return candidates
+
+    def collide(self, left, top, right, bottom):
+        """Returns the aliens that overlap an area, as pygame.Rect.colliderect() tests them.
+
+        Args:
+            left (int): The left edge of the area.
+            top (int): The top edge of the area.
+            right (int): The right edge of the area.
+            bottom (int): The bottom edge of the area.
+
+        Returns:
+            list: The aliens.
+
+        """
+
+        return overlapping(left, top, right, bottom, self.query(left, top, right, bottom))
+
+    def lowest_alien(self, column):
+        """Returns the lowest living alien of a column.
+
+        Args:
+            column (int): The column of the lattice.
+
+        Returns:
+            AlienEntity: The alien, or None if the column is empty.
+
+        """
+
+        cells = self.aliens.cells
+        for row in range(self.rows - 1, -1, -1):
+            alien = cells.get((column, row))
+            if alien is not None:
+                return alien
+        return None
+
+    def lowest_aliens(self):
+        """Returns the lowest living alien of every column.
+
+        Returns:
+            list: The aliens, leaving out the empty columns.
+
+        """
+
+        aliens = (self.lowest_alien(column) for column in range(self.columns))
+        return [alien for alien in aliens if alien is not None]
+
+    def collide_alien_mask(self, left, top, right, bottom, alien):
+        """Returns True if an area covers an opaque pixel of an alien.
+
+        Args:
+            left (int): The left edge of the area.
+            top (int): The top edge of the area.
+            right (int): The right edge of the area.
+            bottom (int): The bottom edge of the area.
+            alien (AlienEntity): An alien whose rect overlaps the area.
+
+        """
+
+        return box_overlaps_mask(left, top, right, bottom, alien, self.alien_mask)
+
+    def collide_bullets(self):
+        """Returns the aliens hit by each bullet.
+
+        The broadphase is chosen by the collision_backend setting, and with
+        collision_mode 'mask' the bullets must also cover an opaque pixel of
+        the aliens. With collision_sweep, the area each bullet went through
+        since the previous tick is tested instead of its rect, whatever the
+        backend and mode, and each bullet only hits the aliens it met first.
+
+        Returns:
+            dict: The aliens hit by each bullet that hit.
+
+        """
+
+        ai_settings, bullets, aliens = self.ai_settings, self.bullets, self.aliens
+        collided = self.collide_alien_mask if ai_settings.collision_mode == 'mask' else None
+        swept = ai_settings.collision_sweep
+
+        if ai_settings.collision_backend == 'spatial_hash':
+            if self.grid is None:
+                self.grid = SpatialHash(*self.alien_size)
+            return spatial_groupcollide(bullets, aliens, self.grid, collided, swept)
+        if ai_settings.collision_backend == 'numpy':
+            return numpy_groupcollide(bullets.entities, aliens.entities, collided, swept)
+        if ai_settings.collision_backend == 'lattice':
+            return lattice_groupcollide(bullets, self.query, collided, swept)
+        return groupcollide(bullets, aliens, collided, swept)
+
+    def collide_ship(self):
+        """Returns True if an alien touches the spaceship.
+
+        With collision_mode 'mask', the aliens of the cells under the
+        spaceship are tested. Otherwise only the lowest alien of each column
+        is: its rect overlaps the spaceship whenever the rect of an alien
+        above it does, unless it already reached the bottom of the screen,
+        which costs the spaceship as well.
+
+        """
+
+        ship = self.ship
+        left, top = ship.left, ship.top
+        right, bottom = left + ship.width, top + ship.height
+        if self.ai_settings.collision_mode == 'mask':
+            return any(masks_overlap(ship, self.ship_mask, alien, self.alien_mask)
+                       for alien in self.collide(left, top, right, bottom))
+        return bool(overlapping(left, top, right, bottom, self.lowest_aliens()))
+
+    def update_bullets(self):
+        """Runs the systems of the bullets.
+
+        The bullets move, then hit the aliens and are scored. A fast bullet
+        can go through the top row and leave the screen in the same tick, so
+        collisions are checked before the bullets are culled.
+
+        """
+
+        for system in self.bullet_systems:
+            system.update(self)
+
+    def update_aliens(self):
+        """Runs the systems of the fleet.
+
+        The fleet steers and moves, then the spaceship is hit if the fleet
+        reached it or the bottom of the screen.
+
+        """
+
+        for system in self.alien_systems:
+            system.update(self)
+
+    def ship_hit(self):
+        """Responds to the spaceship being hit by an alien.
+
+        """
+
+        stats = self.stats
+        self.events['ship_hits'] += 1
+        if stats.ships_left > 0:
+            stats.ships_left -= 1
+
+            # empty the fleet and the bullets, and start again
+            self.aliens.clear()
+            self.clear_bullets()
+            self.create_fleet()
+            self.center_ship()
+
+            # the game stays still for respawn_delay seconds
+            stats.respawn_ticks = int(round(self.ai_settings.respawn_delay
+                                            * self.ai_settings.sim_tick_rate))
+        else:
+            stats.game_active = False
+
+    def step(self, actions):
+        """Advances the game by one simulation tick.
+
+        The systems run in order, the input system first. While the
+        spaceship respawns nothing moves and the shots are dropped.
+
+        Args:
+            actions (Actions): The inputs of the player for the tick.
+
+        Returns:
+            dict: The number of kills, ship hits and level ups of the tick.
+
+        """
+
+        events = self.events
+        events['kills'] = events['ship_hits'] = events['level_ups'] = 0
+
+        # the game stays still until the spaceship respawns
+        if self.stats.respawn_ticks > 0:
+            self.stats.respawn_ticks -= 1
+            actions.fire = 0
+            return events
+
+        for system in self.systems:
+            system.update(self, actions)
+        return events
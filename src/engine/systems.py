@@ -0,0 +1,273 @@
+from src.characters.entities import round_coordinate
+
+
+class InputSystem:
+    """Fires the shots of the player and steers the spaceship.
+
+    Methods:
+        update(self, core, actions):
+            Applies the actions of the player.
+
+    """
+
+    def update(self, core, actions):
+        """Applies the actions of the player.
+
+        The shots leave from where the spaceship was at the end of the
+        previous tick, and the spaceship only moves towards an edge of the
+        screen it had not reached on the previous tick.
+
+        Args:
+            core (GameCore): The game.
+            actions (Actions): The inputs of the player for the tick.
+
+        """
+
+        for shot in range(actions.fire):
+            core.fire()
+        actions.fire = 0
+
+        ship = core.ship
+        core.prev_ship_center = core.ship_center
+        speed = core.ai_settings.ship_speed_factor
+        if actions.moving_right and ship.x + ship.width < core.screen_width:
+            core.ship_center += speed * core.dt
+        if actions.moving_left and ship.x > 0:
+            core.ship_center -= speed * core.dt
+
+        # the spaceship follows its rounded center
+        ship.prev_x = ship.x
+        ship.x = round_coordinate(core.ship_center) - ship.width // 2
+
+
+class MovementSystem:
+    """Moves every entity of a component table by its velocity.
+
+    Before the fleet moves, it turns around and drops when it touches an
+    edge of the screen.
+
+    Attributes:
+        kind (str): The component table of the core moved by the system,
+            'bullets' or 'aliens'.
+
+    Methods:
+        __init__(self, kind):
+            Initializes the system.
+
+        steer_fleet(self, core):
+            Turns the fleet around and drops it if it touches an edge of the screen.
+
+        update(self, core, actions):
+            Moves the entities.
+
+    """
+
+    def __init__(self, kind):
+        """Initializes the system.
+
+        Args:
+            kind (str): The component table of the core moved by the system.
+
+        """
+
+        self.kind = kind
+
+    def steer_fleet(self, core):
+        """Turns the fleet around and drops it if it touches an edge of the screen.
+
+        Args:
+            core (GameCore): The game.
+
+        """
+
+        ai_settings, aliens = core.ai_settings, core.aliens
+        edges = core.update_bounds()
+        if edges is not None:
+            left, right, bottom = edges
+            if right >= core.screen_width or left <= 0:
+                aliens.translate(0, ai_settings.fleet_drop_speed)
+                ai_settings.fleet_direction *= -1
+        aliens.set_velocity(ai_settings.alien_speed_factor * ai_settings.fleet_direction, 0.0)
+
+    def update(self, core, actions=None):
+        """Moves the entities.
+
+        Args:
+            core (GameCore): The game.
+            actions (Actions): The inputs of the player, unused.
+
+        """
+
+        if self.kind == 'aliens':
+            self.steer_fleet(core)
+        getattr(core, self.kind).move(core.dt)
+
+
+class CollisionSystem:
+    """Finds the collisions of the tick, which the scoring system then applies.
+
+    The 'bullets' system stores the aliens hit by each bullet in
+    core.collisions, with the collision_backend, collision_mode and
+    collision_sweep settings. The 'ship' system sets core.ship_collided when
+    an alien touches the spaceship or reaches the bottom of the screen.
+
+    Attributes:
+        kind (str): The collisions found by the system, 'bullets' or 'ship'.
+
+    Methods:
+        __init__(self, kind):
+            Initializes the system.
+
+        collide_bullets(self, core):
+            Finds the aliens hit by each bullet.
+
+        collide_ship(self, core):
+            Finds whether the fleet reached the spaceship.
+
+        update(self, core, actions):
+            Finds the collisions of the kind.
+
+    """
+
+    def __init__(self, kind):
+        """Initializes the system.
+
+        Args:
+            kind (str): The collisions found by the system.
+
+        """
+
+        self.kind = kind
+
+    def collide_bullets(self, core):
+        """Finds the aliens hit by each bullet.
+
+        Args:
+            core (GameCore): The game.
+
+        """
+
+        bullets = core.bullets
+        core.collisions = {}
+        if bullets and core.aliens:
+            # the bullets still under the fleet cannot hit it
+            left, right, bottom = core.update_bounds()
+            if round_coordinate(min(bullets.y)) < bottom:
+                core.collisions = core.collide_bullets()
+
+    def collide_ship(self, core):
+        """Finds whether the fleet reached the spaceship.
+
+        Args:
+            core (GameCore): The game.
+
+        """
+
+        core.ship_collided = False
+        edges = core.update_bounds()
+        if edges is None:
+            return
+
+        # the spaceship is usually far below the fleet
+        left, right, bottom = edges
+        if bottom > core.ship.y and core.collide_ship():
+            core.ship_collided = True
+        elif bottom >= core.screen_height:
+            core.ship_collided = True
+
+    def update(self, core, actions=None):
+        """Finds the collisions of the kind.
+
+        Args:
+            core (GameCore): The game.
+            actions (Actions): The inputs of the player, unused.
+
+        """
+
+        if self.kind == 'bullets':
+            self.collide_bullets(core)
+        else:
+            self.collide_ship(core)
+
+
+class ScoringSystem:
+    """Applies the collisions found by a collision system.
+
+    The 'bullets' system despawns the aliens that were hit and scores them,
+    despawns the bullets that hit or left the screen, and starts the next
+    level once the fleet is destroyed. The 'ship' system costs a spaceship
+    when the fleet reached it.
+
+    Attributes:
+        kind (str): The collisions applied by the system, 'bullets' or 'ship'.
+
+    Methods:
+        __init__(self, kind):
+            Initializes the system.
+
+        score_bullets(self, core):
+            Applies the hits of the bullets.
+
+        update(self, core, actions):
+            Applies the collisions of the kind.
+
+    """
+
+    def __init__(self, kind):
+        """Initializes the system.
+
+        Args:
+            kind (str): The collisions applied by the system.
+
+        """
+
+        self.kind = kind
+
+    def score_bullets(self, core):
+        """Applies the hits of the bullets.
+
+        Args:
+            core (GameCore): The game.
+
+        """
+
+        ai_settings, stats, events = core.ai_settings, core.stats, core.events
+        bullets, aliens, collisions = core.bullets, core.aliens, core.collisions
+
+        for aliens_hit in collisions.values():
+            for alien in aliens_hit:
+                aliens.despawn(alien)
+            stats.score += ai_settings.alien_points * len(aliens_hit)
+            events['kills'] += len(aliens_hit)
+        if stats.score > stats.high_score:
+            stats.high_score = stats.score
+
+        # the bullets that hit or left the screen go in one pass, and the
+        # others keep the order they were fired in
+        limit = -bullets.height
+        if collisions or (bullets and round_coordinate(min(bullets.y)) <= limit):
+            keep = [bullet not in collisions and round_coordinate(y) > limit
+                    for bullet, y in zip(bullets, bullets.y)]
+            core.free_bullets.extend(bullets.compact(keep))
+
+        if not aliens:
+            # destroys existing bullets and creates a new fleet
+            core.clear_bullets()
+            ai_settings.increase_speed()
+            stats.level += 1
+            events['level_ups'] += 1
+            core.create_fleet()
+
+    def update(self, core, actions=None):
+        """Applies the collisions of the kind.
+
+        Args:
+            core (GameCore): The game.
+            actions (Actions): The inputs of the player, unused.
+
+        """
+
+        if self.kind == 'bullets':
+            self.score_bullets(core)
+        elif core.ship_collided:
+            core.ship_hit()
@@ -0,0 +1,65 @@
+import pygame
+
+
+class BulletRenderer:
+    """A class that draws every live bullet in one batch.
+
+    Attributes:
+        screen (pygame.Surface): The game screen on which the bullets will be displayed.
+        ai_settings (Settings): An object containing the game settings.
+        image (pygame.Surface): The bullet, rendered once in the bullet color.
+
+    Methods:
+        __init__(self, ai_settings, screen):
+            Renders the bullet image.
+
+        draw(self, bullets, alpha):
+            Draws every bullet and returns the areas of the screen that were drawn.
+
+    """
+
+    def __init__(self, ai_settings, screen):
+        """Renders the bullet image.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            screen (pygame.Surface): The game screen on which the bullets will be displayed.
+
+        """
+
+        self.screen = screen
+        self.ai_settings = ai_settings
+
+        self.image = pygame.Surface((ai_settings.bullet_width, ai_settings.bullet_height))
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+        self.image.fill(ai_settings.bullet_color)
+
+    def draw(self, bullets, alpha):
+        """Draws every bullet and returns the areas of the screen that were drawn.
+
+        In 'blits' mode the prerendered image is blitted with a single
+        Surface.blits call; in 'fill' mode the screen is filled once per rect.
+
+        Args:
+            bullets (pygame.sprite.Group): A group of bullet instances.
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            list: The areas of the screen that were drawn.
+
+        """
+
+        if alpha >= 1.0:
+            rects = [bullet.rect for bullet in bullets]
+        else:
+            rects = [self.image.get_rect(topleft=bullet.render_position(alpha))
+                     for bullet in bullets]
+
+        if self.ai_settings.bullet_render_mode == 'fill':
+            fill = self.screen.fill
+            color = self.ai_settings.bullet_color
+            return [fill(color, rect) for rect in rects]
+
+        image = self.image
+        return self.screen.blits([(image, rect) for rect in rects])
@@ -70,7 +70,11 @@ class Button:
     def draw_button(self):
         """Draws a blank button on the screen and then draws the button's message.
 
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+
         """
 
         self.screen.fill(self.button_color, self.rect)
         self.screen.blit(self.msg_image, self.msg_image_rect)
+        return self.rect
@@ -0,0 +1,129 @@
+import pygame
+
+
+class FleetRenderer:
+    """A class that draws the whole alien fleet with a single blit.
+
+    The fleet created by create_fleet() is a regular grid whose aliens all
+    move together, so the grid is composed once into one surface. When an
+    alien is killed only its cell is cleared, and each frame the composite
+    surface is blitted at the current origin of the fleet.
+
+    The aliens are composed over the background color, which is then used as
+    an RLE color key: blitting a large per-pixel alpha surface would cost more
+    than the separate blits it replaces.
+
+    Attributes:
+        screen (pygame.Surface): The game screen on which the fleet will be displayed.
+        ai_settings (Settings): An object containing the game settings.
+        image (pygame.Surface): The composite image of the living aliens.
+        cells (dict): The (column, row) cell of each alien in the composite image.
+        alive (int): The number of aliens drawn in the composite image.
+        cell_width (int): The horizontal distance between two columns of aliens.
+        cell_height (int): The vertical distance between two rows of aliens.
+
+    Methods:
+        __init__(self, ai_settings, screen):
+            Initializes an empty fleet renderer.
+
+        draw(self, aliens, alpha):
+            Draws the fleet and returns the area of the screen that was drawn.
+
+        compose(self, aliens):
+            Composes the image of the whole fleet.
+
+        clear_dead(self, aliens):
+            Clears the cells of the aliens that are no longer in the fleet.
+
+    """
+
+    def __init__(self, ai_settings, screen):
+        """Initializes an empty fleet renderer.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            screen (pygame.Surface): The game screen on which the fleet will be displayed.
+
+        """
+
+        self.screen = screen
+        self.ai_settings = ai_settings
+        self.image = None
+        self.cells = {}
+        self.alive = 0
+        self.cell_width = 0
+        self.cell_height = 0
+
+    def draw(self, aliens, alpha):
+        """Draws the fleet and returns the area of the screen that was drawn.
+
+        Args:
+            aliens (pygame.sprite.Group): A group of alien instances.
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            list: The area of the screen that was drawn, or an empty list.
+
+        """
+
+        anchor = next(iter(aliens), None)
+        if anchor is None:
+            return []
+
+        # a fleet created since the last frame needs a new image
+        if anchor not in self.cells:
+            self.compose(aliens)
+        elif len(aliens) != self.alive:
+            self.clear_dead(aliens)
+
+        column, row = self.cells[anchor]
+        x, y = anchor.render_position(alpha)
+        origin = (x - column * self.cell_width, y - row * self.cell_height)
+        return [self.screen.blit(self.image, origin)]
+
+    def compose(self, aliens):
+        """Composes the image of the whole fleet.
+
+        Args:
+            aliens (pygame.sprite.Group): A group of alien instances.
+
+        """
+
+        sprites = aliens.sprites()
+        alien_rect = sprites[0].rect
+        self.cell_width = 2 * alien_rect.width
+        self.cell_height = 2 * alien_rect.height
+
+        columns = max(alien.column for alien in sprites) + 1
+        rows = max(alien.row for alien in sprites) + 1
+        size = (columns * self.cell_width - alien_rect.width,
+                rows * self.cell_height - alien_rect.height)
+
+        self.image = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+        self.image.fill(self.ai_settings.bg_color)
+
+        self.cells = {}
+        for alien in sprites:
+            self.cells[alien] = (alien.column, alien.row)
+        self.image.blits([(alien.image, (column * self.cell_width, row * self.cell_height))
+                          for alien, (column, row) in self.cells.items()],
+                         doreturn=False)
+        self.image.set_colorkey(self.ai_settings.bg_color, pygame.RLEACCEL)
+        self.alive = len(sprites)
+
+    def clear_dead(self, aliens):
+        """Clears the cells of the aliens that are no longer in the fleet.
+
+        Args:
+            aliens (pygame.sprite.Group): A group of alien instances.
+
+        """
+
+        for alien in [alien for alien in self.cells if not aliens.has(alien)]:
+            column, row = self.cells.pop(alien)
+            cell = alien.rect.copy()
+            cell.topleft = (column * self.cell_width, row * self.cell_height)
+            self.image.fill(self.ai_settings.bg_color, cell)
+        self.alive = len(self.cells)
@@ -0,0 +1,149 @@
+import pygame
+
+
+class GlyphAtlas:
+    """A class that renders the digits once and composes numbers from them.
+
+    The glyphs of equal width share a width class, so str.translate() turns
+    a text into its layout, and the x offset of every glyph of a layout is
+    computed once. A number of the same layout as the one already drawn on
+    an image only costs a blit per changed glyph.
+
+    Attributes:
+        font (pygame.font.Font): The font used for rendering the glyphs.
+        text_color (tuple): The RGB color tuple representing the color of the text.
+        bg_color (tuple): The RGB color tuple representing the background color of the text.
+        height (int): The height of every glyph.
+        glyphs (dict): The rendered image of each character, keyed by the character.
+        widths (dict): The width of each glyph, keyed by the character.
+        classes (dict): The str.translate() table mapping each character to its width class.
+        layouts (dict): The x offsets of the glyphs of each layout, then the total width.
+
+    Methods:
+        __init__(self, font, text_color, bg_color, characters):
+            Renders every character of the atlas.
+
+        layout_offsets(self, text, layout):
+            Computes the x offsets of the glyphs of a layout.
+
+        render(self, text, image, old_text):
+            Composes the text from the glyphs of the atlas.
+
+    """
+
+    def __init__(self, font, text_color, bg_color, characters='0123456789,'):
+        """Renders every character of the atlas.
+
+        Args:
+            font (pygame.font.Font): The font used for rendering the glyphs.
+            text_color (tuple): The RGB color tuple representing the color of the text.
+            bg_color (tuple): The RGB color tuple representing the background color of the text.
+            characters (str): The characters rendered in the atlas.
+
+        """
+
+        self.font = font
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.height = font.get_height()
+
+        self.glyphs = {}
+        self.widths = {}
+        for character in characters:
+            glyph = font.render(character, True, text_color, bg_color)
+            if pygame.display.get_surface() is not None:
+                glyph = glyph.convert()
+            self.glyphs[character] = glyph
+            self.widths[character] = glyph.get_width()
+
+        # the width classes are private use characters, never found in a text
+        widths = sorted(set(self.widths.values()))
+        self.classes = str.maketrans({character: chr(0xE000 + widths.index(width))
+                                      for character, width in self.widths.items()})
+        self.layouts = {}
+
+    def layout_offsets(self, text, layout):
+        """Computes the x offsets of the glyphs of a layout.
+
+        Args:
+            text (str): A text of the layout.
+            layout (str): The text translated into width classes.
+
+        Returns:
+            tuple: The x offset of each glyph, then the total width, or None
+            if a character is missing from the atlas.
+
+        """
+
+        widths = self.widths
+        offsets = [0]
+        for character in text:
+            width = widths.get(character)
+            if width is None:
+                return None
+            offsets.append(offsets[-1] + width)
+
+        offsets = self.layouts[layout] = tuple(offsets)
+        return offsets
+
+    def render(self, text, image=None, old_text=''):
+        """Composes the text from the glyphs of the atlas.
+
+        When the image of the previous text is given and the new text has the
+        same layout, only the glyphs that changed are blitted over it. Text
+        with a character missing from the atlas is rendered by the font.
+
+        Args:
+            text (str): The text to be rendered.
+            image (pygame.Surface): The image previously returned for old_text.
+            old_text (str): The text drawn on image.
+
+        Returns:
+            pygame.Surface: The rendered image of the text.
+
+        """
+
+        layout = text.translate(self.classes)
+        offsets = self.layouts.get(layout)
+        if offsets is None:
+            offsets = self.layout_offsets(text, layout)
+            if offsets is None:
+                return self.font.render(text, True, self.text_color, self.bg_color)
+
+        glyphs = self.glyphs
+        if image is not None and old_text.translate(self.classes) == layout:
+            # the other glyphs are already in place
+            blit = image.blit
+            for x, new_character, old_character in zip(offsets, text, old_text):
+                if new_character != old_character:
+                    blit(glyphs[new_character], (x, 0))
+            return image
+
+        image = pygame.Surface((offsets[-1], self.height))
+        image.blits([(glyphs[character], (x, 0)) for x, character in zip(offsets, text)],
+                    doreturn=False)
+        return image
+
+
+# atlases shared by every user of the same font and colors
+_atlases = {}
+
+
+def get_atlas(font, text_color, bg_color):
+    """Returns the glyph atlas of a font and a pair of colors.
+
+    Args:
+        font (pygame.font.Font): The font used for rendering the glyphs.
+        text_color (tuple): The RGB color tuple representing the color of the text.
+        bg_color (tuple): The RGB color tuple representing the background color of the text.
+
+    Returns:
+        GlyphAtlas: The atlas, rendered on the first request only.
+
+    """
+
+    key = (font, tuple(text_color), tuple(bg_color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, text_color, bg_color)
+    return atlas
@@ -0,0 +1,242 @@
+import pygame
+
+from src.gui.bullet_renderer import BulletRenderer
+from src.gui.fleet_renderer import FleetRenderer
+
+
+class Renderer:
+    """A class that presents each frame either with a full flip or with dirty rectangles.
+
+    In 'flip' mode the whole screen is cleared and flipped every frame. In
+    'dirty' mode only the areas covered by the sprites, bullets and HUD on the
+    previous frame are restored to the background, and only those areas plus
+    the ones drawn on the current frame are sent to the display.
+
+    Attributes:
+        screen (pygame.Surface): The game screen on which the frame is drawn.
+        ai_settings (Settings): An object containing the game settings.
+        screen_area (int): The number of pixels on the screen.
+        last_rects (list): The rectangles drawn on the previous frame.
+        rects (list): The rectangles drawn on the current frame.
+        full_redraw (bool): A flag indicating whether the next frame must be fully redrawn.
+        frames (int): The number of frames presented.
+        flips (int): The number of frames presented with a full flip.
+        fleet_renderer (FleetRenderer): The object that draws the fleet as a single surface.
+        bullet_renderer (BulletRenderer): The object that draws the bullets in one batch.
+
+    Methods:
+        __init__(self, ai_settings, screen):
+            Initializes the renderer.
+
+        begin_frame(self):
+            Restores the background where the previous frame drew.
+
+        draw_ship(self, ship, alpha):
+            Draws the spaceship between the previous and the current tick.
+
+        draw_bullets(self, bullets, alpha):
+            Draws the bullets in the configured bullet render mode.
+
+        draw_aliens(self, aliens, alpha):
+            Draws the alien fleet in the configured fleet render mode.
+
+        add(self, rects):
+            Records the areas drawn on the current frame.
+
+        present(self):
+            Makes the current frame visible on the display.
+
+        invalidate(self):
+            Forces the next frame to be fully redrawn and flipped.
+
+        check_events(self, events):
+            Forces a full redraw when the window was exposed or restored.
+
+        merge_dirty(last_rects, rects):
+            Returns the areas to update for the previous and the current frame.
+
+    """
+
+    # the events after which the display has to be redrawn
+    redraw_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                     pygame.WINDOWSHOWN, pygame.WINDOWSIZECHANGED)
+
+    def __init__(self, ai_settings, screen):
+        """Initializes the renderer.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+            screen (pygame.Surface): The game screen on which the frame is drawn.
+
+        """
+
+        self.screen = screen
+        self.ai_settings = ai_settings
+        self.screen_area = screen.get_width() * screen.get_height()
+
+        self.last_rects = []
+        self.rects = []
+        self.full_redraw = True
+
+        self.frames = 0
+        self.flips = 0
+
+        self.fleet_renderer = FleetRenderer(ai_settings, screen)
+        self.bullet_renderer = BulletRenderer(ai_settings, screen)
+
+    def begin_frame(self):
+        """Restores the background where the previous frame drew.
+
+        """
+
+        self.rects = []
+        if self.ai_settings.render_mode != 'dirty' or self.full_redraw:
+            self.screen.fill(self.ai_settings.bg_color)
+        else:
+            for rect in self.last_rects:
+                self.screen.fill(self.ai_settings.bg_color, rect)
+
+    def draw_ship(self, ship, alpha):
+        """Draws the spaceship between the previous and the current tick.
+
+        Args:
+            ship (Ship): The player's spaceship.
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+
+        """
+
+        if alpha >= 1.0:
+            return ship.blitme()
+        return self.screen.blit(ship.image, ship.render_position(alpha))
+
+    def draw_bullets(self, bullets, alpha):
+        """Draws the bullets in the configured bullet render mode.
+
+        Args:
+            bullets (pygame.sprite.Group): A group of bullet instances.
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            list: The areas of the screen that were drawn.
+
+        """
+
+        if self.ai_settings.bullet_render_mode == 'sprites' and alpha >= 1.0:
+            return [bullet.draw_bullet() for bullet in bullets.sprites()]
+        return self.bullet_renderer.draw(bullets, alpha)
+
+    def draw_aliens(self, aliens, alpha):
+        """Draws the alien fleet in the configured fleet render mode.
+
+        Args:
+            aliens (pygame.sprite.Group): A group of alien instances.
+            alpha (float): 0.0 for the previous tick, 1.0 for the current tick.
+
+        Returns:
+            list: The areas of the screen that were drawn.
+
+        """
+
+        if self.ai_settings.fleet_render_mode == 'composite':
+            return self.fleet_renderer.draw(aliens, alpha)
+        # Group.draw() returns no rects, so the aliens are blitted directly
+        if alpha >= 1.0:
+            return self.screen.blits([(alien.image, alien.rect) for alien in aliens])
+        return self.screen.blits([(alien.image, alien.render_position(alpha))
+                                  for alien in aliens])
+
+    def add(self, rects):
+        """Records the areas drawn on the current frame.
+
+        Args:
+            rects (pygame.Rect or list): The area, or the list of areas, drawn.
+
+        """
+
+        if isinstance(rects, pygame.Rect):
+            self.rects.append(rects)
+        else:
+            self.rects.extend(rects)
+
+    def present(self):
+        """Makes the current frame visible on the display.
+
+        Falls back to a full flip when the dirty area is larger than the
+        dirty_area_threshold fraction of the screen.
+
+        """
+
+        self.frames += 1
+        dirty = self.merge_dirty(self.last_rects, self.rects)
+        self.last_rects = self.rects
+
+        if self.ai_settings.render_mode != 'dirty' or self.full_redraw:
+            self.full_redraw = False
+            self.flips += 1
+            pygame.display.flip()
+            return
+
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        if dirty_area > self.ai_settings.dirty_area_threshold * self.screen_area:
+            self.flips += 1
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+
+    def invalidate(self):
+        """Forces the next frame to be fully redrawn and flipped.
+
+        """
+
+        self.full_redraw = True
+
+    def check_events(self, events):
+        """Forces a full redraw when the window was exposed or restored.
+
+        The display may have lost what the previous frames drew, and the
+        dirty rectangles alone would not restore the rest of it.
+
+        Args:
+            events (list): The events taken from the pygame event queue.
+
+        """
+
+        for event in events:
+            if event.type in self.redraw_events:
+                self.invalidate()
+                return
+
+    @staticmethod
+    def merge_dirty(last_rects, rects):
+        """Returns the areas to update for the previous and the current frame.
+
+        The areas are added in the same order every frame, so an area of the
+        previous frame is merged with the one drawn at its place now: a sprite
+        that moved by a few pixels is then counted once. Two areas are only
+        merged when their union is no larger than both of them.
+
+        Args:
+            last_rects (list): The rectangles drawn on the previous frame.
+            rects (list): The rectangles drawn on the current frame.
+
+        Returns:
+            list: The rectangles covering both frames.
+
+        """
+
+        dirty = []
+        for last, rect in zip(last_rects, rects):
+            union = last.union(rect)
+            if union.width * union.height <= last.width * last.height + rect.width * rect.height:
+                dirty.append(union)
+            else:
+                dirty.append(last)
+                dirty.append(rect)
+
+        number = min(len(last_rects), len(rects))
+        dirty.extend(last_rects[number:])
+        dirty.extend(rects[number:])
+        return dirty
@@ -6,13 +6,38 @@ class Settings:
         screen_height (int): The height of the game screen.
         bg_color (tuple): The RGB color tuple representing the background color of the game screen.
         ship_limit (int): The number of ships the player has before the game ends.
+        respawn_delay (float): The seconds the game stays still after the spaceship is hit.
         bullet_width (int): The width of the bullets fired by the spaceship.
         bullet_height (int): The height of the bullets fired by the spaceship.
         bullet_color (tuple): The RGB color tuple representing the color of the bullets.
         bullets_allowed (int): The maximum number of bullets allowed on the screen simultaneously.
         fleet_drop_speed (int): The speed at which the fleet of aliens moves downward.
+        fleet_backend (str): 'lists' stores the components of the aliens in lists; 'numpy' stores them in NumPy arrays.
         speedup_scale (float): The rate at which the game speed increases.
         score_scale (float): The rate at which the points for each alien increase.
+        render_mode (str): 'flip' redraws the whole screen every frame; 'dirty' updates only the changed areas.
+        dirty_area_threshold (float): The fraction of the screen above which the 'dirty' mode falls back to a flip.
+        fleet_render_mode (str): 'sprites' blits each alien; 'composite' blits the whole fleet as one surface.
+        bullet_render_mode (str): 'sprites' draws each bullet on its own; 'blits' and 'fill' draw them in one batch.
+        score_text_mode (str): 'font' renders the scoreboard numbers with the font; 'atlas' composes them from prerendered digits.
+        fps_limit (int): The maximum number of frames drawn per second; 0 disables the limit.
+        fps_busy_loop (bool): A flag indicating whether the frame limiter busy-waits for a more precise frame rate.
+        idle_wait (bool): A flag indicating whether the Play screen blocks until an event arrives.
+        sim_tick_rate (int): The number of simulation ticks per second, independent of the frame rate.
+        max_catchup_ticks (int): The maximum number of ticks simulated in a single frame.
+        render_interpolation (bool): A flag indicating whether frames are drawn between the last two ticks.
+        collision_mode (str): 'rect' tests bounding rects only; 'mask' also tests the opaque pixels of overlapping rects.
+        collision_sweep (bool): A flag indicating whether bullets are tested along their path since the previous tick.
+        collision_backend (str): 'groupcollide' tests every bullet against every alien; 'spatial_hash' only tests nearby aliens; 'numpy' tests every pair at once with NumPy; 'lattice' only tests the fleet cells under each bullet.
+        headless (bool): A flag indicating whether the game runs on SDL's dummy video driver without pacing or drawing.
+        headless_render_every (int): In headless mode, the number of ticks between two offscreen frames; 0 never draws.
+        headless_max_ticks (int): In headless mode, the number of ticks after which the run stops; 0 runs until game over.
+        record_path (str): The file where the inputs of the game are recorded; None records nothing.
+        replay_path (str): The recording replayed headless instead of playing; None plays the game.
+        replay_hash_every (int): The number of ticks between two state hashes in a recording.
+        ship_speed_factor (float): The speed of the spaceship, in pixels per second.
+        bullet_speed_factor (float): The speed of the bullets, in pixels per second.
+        alien_speed_factor (float): The speed of the fleet, in pixels per second.
 
     Methods:
         __init__(self):
@@ -38,6 +63,7 @@ class Settings:
 
         # ship settings
         self.ship_limit = 3
+        self.respawn_delay = 1.0
 
         # bullet settings
         self.bullet_width = 3
@@ -47,11 +73,44 @@ class Settings:
 
         # alien settings
         self.fleet_drop_speed = 10
+        self.fleet_backend = 'lists'
 
         # speedup settings
         self.speedup_scale = 1.1
         self.score_scale = 1.5
 
+        # render settings
+        self.render_mode = 'flip'
+        self.dirty_area_threshold = 0.5
+        self.fleet_render_mode = 'composite'
+        self.bullet_render_mode = 'blits'
+        self.score_text_mode = 'font'
+
+        # frame pacing settings
+        self.fps_limit = 60
+        self.fps_busy_loop = False
+        self.idle_wait = True
+
+        # simulation settings
+        self.sim_tick_rate = 120
+        self.max_catchup_ticks = 8
+        self.render_interpolation = True
+
+        # collision settings
+        self.collision_mode = 'rect'
+        self.collision_backend = 'lattice'
+        self.collision_sweep = False
+
+        # headless settings
+        self.headless = False
+        self.headless_render_every = 0
+        self.headless_max_ticks = 0
+
+        # recording and replay settings
+        self.record_path = None
+        self.replay_path = None
+        self.replay_hash_every = 120
+
         self.initialize_dynamic_settings()
 
     def initialize_dynamic_settings(self):
@@ -59,9 +118,10 @@ class Settings:
 
         """
 
-        self.ship_speed_factor = 1.5
-        self.bullet_speed_factor = 3
-        self.alien_speed_factor = 1
+        # speeds in pixels per second
+        self.ship_speed_factor = 180.0
+        self.bullet_speed_factor = 360.0
+        self.alien_speed_factor = 120.0
 
         # fleet_direction equal to 1 represents right; -1 represents left.
         self.fleet_direction = 1
@@ -8,6 +8,7 @@ class GameStats:
         level (int): The current game level.
         game_active (bool): A flag indicating whether the game is active (True) or inactive (False).
         high_score (int): The highest score achieved in the game.
+        respawn_ticks (int): The number of ticks left before the game resumes after the spaceship was hit.
 
     Methods:
         __init__(self, ai_settings):
@@ -43,3 +44,4 @@ class GameStats:
         self.ships_left = self.ai_settings.ship_limit
         self.score = 0
         self.level = 1
+        self.respawn_ticks = 0
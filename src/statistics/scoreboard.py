@@ -1,7 +1,10 @@
+from math import ceil
+
 import pygame.font
 from pygame.sprite import Group
 
 from src.characters.ship import Ship
+from src.gui.glyph_atlas import get_atlas
 
 
 class Scoreboard:
@@ -14,18 +17,26 @@ class Scoreboard:
         stats (GameStats): An object containing the game statistical data.
         text_color (tuple): The RGB color tuple representing the color of the text.
         font (pygame.font.Font): The font used for rendering the text.
+        atlas (GlyphAtlas): The prerendered digits used for composing the numbers, or None in 'font' mode.
         score_image (pygame.Surface): The rendered image of the current score.
         score_rect (pygame.Rect): The rectangle representing the position of the score image on the screen.
         high_score_image (pygame.Surface): The rendered image of the high score.
         high_score_rect (pygame.Rect): The rectangle representing the position of the high score image on the screen.
         level_image (pygame.Surface): The rendered image of the current game level.
         level_rect (pygame.Rect): The rectangle representing the position of the level image on the screen.
+        score_str, high_score_str, level_str (str): The texts drawn on the score, high score and level images.
         ships (Group): A group of spaceship instances representing the remaining ships.
+        countdown_image (pygame.Surface): The rendered seconds left before the spaceship respawns.
+        countdown_rect (pygame.Rect): The rectangle representing the position of the countdown on the screen.
+        countdown_str (str): The text drawn on the countdown image.
 
     Methods:
         __init__(self, ai_settings, screen, stats):
             Initializes the attributes of the scoreboard.
 
+        render_number(self, text, image, old_text):
+            Renders a number with the font or with the glyph atlas.
+
         prep_score(self):
             Converts the score into a rendered image.
 
@@ -41,6 +52,9 @@ class Scoreboard:
         prep_ships(self):
             Displays the remaining ships on the screen.
 
+        prep_countdown(self):
+            Converts the seconds left before the spaceship respawns into a rendered image.
+
     """
 
     def __init__(self, ai_settings, screen, stats):
@@ -61,6 +75,15 @@ class Scoreboard:
         # font settings for scoring information
         self.text_color = (30, 30, 30)
         self.font = pygame.font.SysFont(None, 48)
+        self.atlas = None
+        if ai_settings.score_text_mode == 'atlas':
+            self.atlas = get_atlas(self.font, self.text_color, ai_settings.bg_color)
+
+        # the texts drawn on the current images, reused by the atlas
+        self.score_image = self.high_score_image = self.level_image = None
+        self.score_str = self.high_score_str = self.level_str = ''
+        self.countdown_image = self.countdown_rect = None
+        self.countdown_str = ''
 
         # prepare the initial score images
         self.prep_score()
@@ -68,6 +91,23 @@ class Scoreboard:
         self.prep_level()
         self.prep_ships()
 
+    def render_number(self, text, image, old_text):
+        """Renders a number with the font or with the glyph atlas.
+
+        Args:
+            text (str): The number to be rendered.
+            image (pygame.Surface): The image previously rendered for old_text.
+            old_text (str): The number drawn on image.
+
+        Returns:
+            pygame.Surface: The rendered image of the number.
+
+        """
+
+        if self.atlas is not None:
+            return self.atlas.render(text, image, old_text)
+        return self.font.render(text, True, self.text_color, self.ai_settings.bg_color)
+
     def prep_score(self):
         """Converts the score into a rendered image.
 
@@ -75,7 +115,8 @@ class Scoreboard:
 
         rounded_score = int(round(self.stats.score, -1))
         score_str = "{:,}".format(rounded_score)
-        self.score_image = self.font.render(score_str, True, self.text_color, self.ai_settings.bg_color)
+        self.score_image = self.render_number(score_str, self.score_image, self.score_str)
+        self.score_str = score_str
 
         # display the score at the top-right in corner of the screen
         self.score_rect = self.score_image.get_rect()
@@ -89,8 +130,9 @@ class Scoreboard:
 
         high_score = int(round(self.stats.high_score, -1))
         high_score_str = "{:,}".format(high_score)
-        self.high_score_image = self.font.render(high_score_str, True,
-                                                 self.text_color, self.ai_settings.bg_color)
+        self.high_score_image = self.render_number(high_score_str, self.high_score_image,
+                                                   self.high_score_str)
+        self.high_score_str = high_score_str
 
         # center the high score at the top of the screen
         self.high_score_rect = self.high_score_image.get_rect()
@@ -100,22 +142,34 @@ class Scoreboard:
     def show_score(self):
         """Draws the score, high score, level, and remaining ships on the screen.
 
+        Returns:
+            list: The areas of the screen that were drawn.
+
         """
 
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.high_score_image, self.high_score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
+        rects = [
+            self.screen.blit(self.score_image, self.score_rect),
+            self.screen.blit(self.high_score_image, self.high_score_rect),
+            self.screen.blit(self.level_image, self.level_rect),
+        ]
+
+        # draw the remaining ships; Group.draw() returns no rects to erase
+        rects.extend(self.screen.blits([(ship.image, ship.rect) for ship in self.ships]))
 
-        # draw the remaining ships
-        self.ships.draw(self.screen)
+        # count down while the spaceship respawns
+        if self.stats.respawn_ticks > 0:
+            self.prep_countdown()
+            rects.append(self.screen.blit(self.countdown_image, self.countdown_rect))
+        return rects
 
     def prep_level(self):
         """Converts the level into a rendered image.
 
         """
 
-        self.level_image = self.font.render(str(self.stats.level), True,
-                                            self.text_color, self.ai_settings.bg_color)
+        level_str = str(self.stats.level)
+        self.level_image = self.render_number(level_str, self.level_image, self.level_str)
+        self.level_str = level_str
 
         # position the level below the score
         self.level_rect = self.level_image.get_rect()
@@ -133,3 +187,23 @@ class Scoreboard:
             ship.rect.x = 10 + ship_number * ship.rect.width
             ship.rect.y = 10
             self.ships.add(ship)
+
+    def prep_countdown(self):
+        """Converts the seconds left before the spaceship respawns into a rendered image.
+
+        The image is only rendered again when the number of seconds changes.
+
+        """
+
+        seconds = ceil(self.stats.respawn_ticks / self.ai_settings.sim_tick_rate)
+        countdown_str = str(seconds)
+        if countdown_str == self.countdown_str:
+            return
+
+        self.countdown_image = self.render_number(countdown_str, self.countdown_image,
+                                                  self.countdown_str)
+        self.countdown_str = countdown_str
+
+        # center the countdown on the screen
+        self.countdown_rect = self.countdown_image.get_rect()
+        self.countdown_rect.center = self.screen_rect.center
@@ -0,0 +1,159 @@
+import pygame
+
+
+class AssetCache:
+    """A class that loads each game image once and shares it between sprites.
+
+    Attributes:
+        images (dict): The decoded surfaces, keyed by their file path.
+        masks (dict): The collision masks, keyed by file path.
+        mask_rows (dict): The rows of the collision masks as bits, keyed by file path.
+        hits (int): The number of requests served from the cache.
+        misses (int): The number of requests that had to decode a file.
+
+    Methods:
+        __init__(self):
+            Initializes an empty cache.
+
+        load_image(self, path):
+            Returns the shared surface for the image stored at path.
+
+        load_mask(self, path):
+            Returns the shared collision mask of the image stored at path.
+
+        load_mask_rows(self, path):
+            Returns the rows of the collision mask of the image stored at path, as bits.
+
+        size_in_bytes(self):
+            Returns the number of pixel bytes held by the cache.
+
+        report(self):
+            Returns the hit/miss counters and the bytes held by the cache.
+
+        clear(self):
+            Drops every cached surface and resets the counters.
+
+    """
+
+    def __init__(self):
+        """Initializes an empty cache.
+
+        """
+
+        self.images = {}
+        self.masks = {}
+        self.mask_rows = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load_image(self, path):
+        """Returns the shared surface for the image stored at path.
+
+        The file is decoded on the first request only. When a display mode
+        has already been set, the surface is converted to the display format
+        so that blitting it does not require a per-frame conversion.
+
+        Args:
+            path (str): The path of the image file.
+
+        Returns:
+            pygame.Surface: The surface shared by every caller; it must not be
+            drawn on.
+
+        """
+
+        image = self.images.get(path)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.image.load(path)
+
+        # convert_alpha() needs a video mode, so headless callers
+        # keep the decoded surface as it is
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+
+        self.images[path] = image
+        return image
+
+    def load_mask(self, path):
+        """Returns the shared collision mask of the image stored at path.
+
+        The mask is built once from the cached image, so that sprites never
+        call pygame.mask.from_surface() during the game.
+
+        Args:
+            path (str): The path of the image file.
+
+        Returns:
+            pygame.mask.Mask: The mask shared by every caller.
+
+        """
+
+        mask = self.masks.get(path)
+        if mask is None:
+            mask = self.masks[path] = pygame.mask.from_surface(self.load_image(path))
+        return mask
+
+    def load_mask_rows(self, path):
+        """Returns the rows of the collision mask of the image stored at path, as bits.
+
+        The game core tests masks without pygame: bit x of row y is set when
+        the pixel (x, y) of the image is opaque.
+
+        Args:
+            path (str): The path of the image file.
+
+        Returns:
+            tuple: One integer per row of the image.
+
+        """
+
+        rows = self.mask_rows.get(path)
+        if rows is None:
+            mask = self.load_mask(path)
+            width, height = mask.get_size()
+            rows = self.mask_rows[path] = tuple(
+                sum(1 << x for x in range(width) if mask.get_at((x, y)))
+                for y in range(height))
+        return rows
+
+    def size_in_bytes(self):
+        """Returns the number of pixel bytes held by the cache.
+
+        """
+
+        return sum(image.get_bytesize() * image.get_width() * image.get_height()
+                   for image in self.images.values())
+
+    def report(self):
+        """Returns the hit/miss counters and the bytes held by the cache.
+
+        Returns:
+            dict: The keys 'hits', 'misses', 'images' and 'bytes'.
+
+        """
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'images': len(self.images),
+            'bytes': self.size_in_bytes(),
+        }
+
+    def clear(self):
+        """Drops every cached surface and resets the counters.
+
+        """
+
+        self.images.clear()
+        self.masks.clear()
+        self.mask_rows.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# the cache shared by the whole process
+assets = AssetCache()
@@ -0,0 +1,704 @@
+"""Micro-benchmarks for the rendering and simulation paths of the game.
+
+Run them from the repository root, for example:
+
+    python -m src.utils.benchmarks render
+
+Set SDL_VIDEODRIVER=dummy to run them on a machine without a display.
+
+"""
+
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:     # the batch benchmark is optional
+    np = None
+
+from src.gui.settings import Settings
+from src.gui.button import Button
+from src.gui.renderer import Renderer
+from src.statistics.game_stats import GameStats
+from src.statistics.scoreboard import Scoreboard
+from src.characters.ship import Ship
+from src.characters.alien import Alien
+from src.characters.fleet import Fleet
+from src.characters.bullet_pool import BulletPool
+from src.characters.entities import BulletEntity
+from src.utils.assets import assets
+from src.utils.savestate import restore, snapshot
+from src.engine.batch import BatchSimulator, round_half_away
+from src.engine.components import Components, FleetComponents
+from src.engine.core import Actions, GameCore
+
+import src.utils.game_functions as gf
+
+
+def create_game(ai_settings):
+    """Creates the screen and every game object, and starts a game.
+
+    Args:
+        ai_settings (Settings): An object containing the game settings.
+
+    Returns:
+        dict: The game objects, keyed by the names main() uses for them.
+
+    """
+
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (ai_settings.screen_width, ai_settings.screen_height))
+
+    game = {
+        'ai_settings': ai_settings,
+        'screen': screen,
+        'renderer': Renderer(ai_settings, screen),
+        'play_button': Button(ai_settings, screen, "Play"),
+    }
+    game['stats'] = GameStats(ai_settings)
+    game['sb'] = Scoreboard(ai_settings, screen, game['stats'])
+    game['core'] = gf.create_core(ai_settings, game['stats'], screen)
+    game['actions'] = Actions()
+    game['ship'] = Ship(ai_settings, screen)
+    game['aliens'] = Fleet(ai_settings, screen)
+    game['bullets'] = BulletPool(ai_settings, screen)
+
+    game['stats'].game_active = True
+    return game
+
+
+def play_frame(game, frame):
+    """Advances the game by one simulation tick, firing a bullet every few ticks.
+
+    Args:
+        game (dict): The game objects returned by create_game().
+        frame (int): The number of the frame.
+
+    """
+
+    if frame % 10 == 0:
+        game['actions'].fire += 1
+    gf.update_game(game['stats'], game['sb'], game['core'], game['actions'])
+
+
+def draw_frame(game):
+    """Draws and presents one frame.
+
+    Args:
+        game (dict): The game objects returned by create_game().
+
+    """
+
+    gf.update_screen(game['ai_settings'], game['stats'], game['sb'], game['core'],
+                     game['ship'], game['aliens'], game['bullets'], game['play_button'],
+                     game['renderer'], 1.0)
+
+
+def bench_render(frames):
+    """Compares the 'flip' and 'dirty' render modes.
+
+    Args:
+        frames (int): The number of frames drawn in each mode.
+
+    """
+
+    for mode in ('flip', 'dirty'):
+        ai_settings = Settings()
+        ai_settings.render_mode = mode
+        game = create_game(ai_settings)
+
+        elapsed = 0.0
+        for frame in range(frames):
+            play_frame(game, frame)
+            start = perf_counter()
+            draw_frame(game)
+            elapsed += perf_counter() - start
+
+        renderer = game['renderer']
+        print("{:>6}: {:8.1f} us/frame, {} of {} frames flipped".format(
+            mode, elapsed / frames * 1e6, renderer.flips, renderer.frames))
+
+
+def bench_score_text(frames):
+    """Compares the 'font' and 'atlas' score text modes.
+
+    Args:
+        frames (int): The number of score updates in each mode.
+
+    """
+
+    for mode in ('font', 'atlas'):
+        ai_settings = Settings()
+        ai_settings.score_text_mode = mode
+        game = create_game(ai_settings)
+        stats, sb = game['stats'], game['sb']
+
+        start = perf_counter()
+        for frame in range(frames):
+            stats.score += ai_settings.alien_points
+            sb.prep_score()
+        elapsed = perf_counter() - start
+
+        print("{:>6}: {:8.2f} us/update".format(mode, elapsed / frames * 1e6))
+
+
+def bench_bullets(frames):
+    """Compares the bullet render modes with hundreds of bullets on screen.
+
+    Args:
+        frames (int): The number of frames drawn in each mode.
+
+    """
+
+    for mode in ('sprites', 'blits', 'fill'):
+        ai_settings = Settings()
+        ai_settings.bullet_render_mode = mode
+        ai_settings.bullets_allowed = 500
+        game = create_game(ai_settings)
+        core, bullets = game['core'], game['bullets']
+
+        # spread the bullets over the lower half of the screen
+        for number in range(ai_settings.bullets_allowed):
+            core.fire()
+        for number, bullet in enumerate(core.bullets):
+            bullet.x = number * 7 % ai_settings.screen_width
+            bullet.y -= number % 300
+        bullets.sync(core.bullets)
+
+        renderer = game['renderer']
+        start = perf_counter()
+        for frame in range(frames):
+            renderer.draw_bullets(bullets, 1.0)
+        elapsed = perf_counter() - start
+
+        print("{:>7}: {:8.1f} us/frame for {} bullets".format(
+            mode, elapsed / frames * 1e6, len(bullets)))
+
+
+def move_fleet_away(game):
+    """Stops the fleet far above the screen, out of the reach of the bullets.
+
+    Args:
+        game (dict): The game objects returned by create_game().
+
+    """
+
+    ai_settings = game['ai_settings']
+    ai_settings.alien_speed_factor = 0.0
+    for alien in game['core'].aliens:
+        alien.y = alien.prev_y = alien.y - 4 * ai_settings.screen_height
+
+
+def bench_bullet_pool(frames):
+    """Checks that steady-state firing allocates no memory.
+
+    The spaceship fires on every tick while the fleet is out of reach, the
+    bullet sprites are synced with the bullets of the core, and tracemalloc
+    reports what was allocated once the bullets are warm. Tracing starts
+    before the warm-up, so that the numbers of the bullets in flight are
+    traced in both snapshots.
+
+    Args:
+        frames (int): The number of ticks is ten times this number.
+
+    """
+
+    ai_settings = Settings()
+    ai_settings.bullets_allowed = 50
+    game = create_game(ai_settings)
+    stats, sb, core, actions = game['stats'], game['sb'], game['core'], game['actions']
+    bullets = game['bullets']
+    move_fleet_away(game)
+
+    def tick():
+        actions.fire = 1
+        gf.update_game(stats, sb, core, actions)
+        bullets.sync(core.bullets)
+
+    # the first bullets reach the top of the screen
+    tracemalloc.start()
+    for frame in range(ai_settings.screen_height):
+        tick()
+
+    entities, sprites = len(core.bullets) + len(core.free_bullets), len(bullets.sprites_of)
+    before = tracemalloc.take_snapshot()
+    current = tracemalloc.get_traced_memory()[0]
+    for frame in range(10 * frames):
+        tick()
+    retained, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # the blocks still allocated by the code under test
+    sources = [tracemalloc.Filter(True, '*bullet*.py'),
+               tracemalloc.Filter(True, '*core.py'),
+               tracemalloc.Filter(True, '*game_functions.py')]
+    blocks = sum(stat.count_diff for stat in after.filter_traces(sources).compare_to(
+        before.filter_traces(sources), 'filename'))
+
+    print("{} ticks: {} bullets and {} bullet sprites created, {} blocks retained, "
+          "{} bytes retained, peak +{} bytes".format(
+              10 * frames, len(core.bullets) + len(core.free_bullets) - entities,
+              len(bullets.sprites_of) - sprites, blocks, retained - current, peak - current))
+
+
+def traced_bytes(create, number):
+    """Returns the memory allocated per object by a function creating many objects.
+
+    Args:
+        create (callable): A function of the number of objects, returning their container.
+        number (int): The number of objects to create.
+
+    Returns:
+        float: The number of bytes per object, container included.
+
+    """
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    container = create(number)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del container
+    return used / number
+
+
+def bench_entity_memory(frames):
+    """Compares the memory used per alien and per bullet by component tables and by sprites.
+
+    The game core only needs the entities; the sprites drawing them are
+    counted with their entities.
+
+    Args:
+        frames (int): The number of aliens and bullets is ten times this number.
+
+    """
+
+    ai_settings = Settings()
+    screen = create_game(ai_settings)['screen']
+    number = 10 * frames
+
+    width, height = assets.load_image('assets/images/alien.png').get_size()
+
+    def create_alien_entities(number):
+        aliens = FleetComponents(width, height)
+        for index in range(number):
+            aliens.spawn(float(index % 100), index // 100, index % 100, index // 100)
+        return aliens
+
+    def create_alien_sprites(number):
+        aliens = Fleet(ai_settings, screen)
+        for entity in create_alien_entities(number):
+            aliens.add(Alien(ai_settings, screen, entity))
+        return aliens
+
+    def create_bullet_sprites(number):
+        bullets = BulletPool(ai_settings, screen)
+        bullets.sync(create_bullet_entities(number))
+        return bullets
+
+    def create_bullet_entities(number):
+        bullets = Components(ai_settings.bullet_width, ai_settings.bullet_height, BulletEntity)
+        for index in range(number):
+            bullets.spawn(float(index), float(index), 0.0, -ai_settings.bullet_speed_factor)
+        return bullets
+
+    for name, create in (('alien sprites', create_alien_sprites),
+                         ('alien entities', create_alien_entities),
+                         ('bullet sprites', create_bullet_sprites),
+                         ('bullet entities', create_bullet_entities)):
+        print("{:>15}: {:7.1f} bytes each for {}".format(
+            name, traced_bytes(create, number), number))
+
+
+def batch_inputs(number_games, frame):
+    """Returns the inputs of a batch of games on a tick, a different pattern for each game.
+
+    Args:
+        number_games (int): The number of games.
+        frame (int): The number of the tick.
+
+    Returns:
+        tuple: A flag per game for moving right, moving left and firing.
+
+    """
+
+    games = np.arange(number_games)
+    moving_right = frame // (200 + 37 * (games % 11)) % 2 == 0
+    return moving_right, ~moving_right, frame % (5 + games % 7) == 0
+
+
+def bench_batch(frames):
+    """Plays many games in lockstep on the BatchSimulator.
+
+    A few games with different speedup_scale, score_scale and
+    fleet_drop_speed are first played to the end both by the batch and by
+    one GameCore each, and their statistics and fleets are compared after
+    every tick. Then the throughput is measured for growing batches.
+
+    Args:
+        frames (int): The number of ticks played by each batch.
+
+    """
+
+    if np is None:
+        print("requires NumPy")
+        return
+
+    def create_settings(number_games):
+        settings = []
+        for game in range(number_games):
+            ai_settings = Settings()
+            ai_settings.speedup_scale = 1.05 + 0.05 * (game % 4)
+            ai_settings.score_scale = 1.25 + 0.25 * (game % 3)
+            ai_settings.fleet_drop_speed = 5 + 5 * (game % 5)
+            settings.append(ai_settings)
+        return settings
+
+    ship_size = Ship(Settings(), create_game(Settings())['screen']).rect.size
+    alien_size = assets.load_image('assets/images/alien.png').get_size()
+    screen_size = (Settings().screen_width, Settings().screen_height)
+
+    number_games = 12
+    batch = BatchSimulator(create_settings(number_games), screen_size, ship_size, alien_size)
+    batch.start_games()
+    cores = []
+    for ai_settings in create_settings(number_games):
+        core = GameCore(ai_settings, GameStats(ai_settings), screen_size, ship_size, alien_size)
+        core.start_game()
+        cores.append((core, Actions()))
+
+    same, frame = True, 0
+    while same and batch.game_active.any():
+        moving_right, moving_left, fire = batch_inputs(number_games, frame)
+        batch.step(moving_right, moving_left, fire)
+        for game, (core, actions) in enumerate(cores):
+            if not core.stats.game_active:
+                continue
+            actions.moving_right, actions.moving_left = moving_right[game], moving_left[game]
+            actions.fire = int(fire[game])
+            core.step(actions)
+
+            stats = core.stats
+            aliens = sorted((alien.row, alien.column, alien.left, alien.top)
+                            for alien in core.aliens)
+            rows, columns = np.nonzero(batch.alive[game])
+            batch_aliens = sorted(zip(rows.tolist(), columns.tolist(),
+                                      round_half_away(batch.alien_x[game, columns]).tolist(),
+                                      (alien_size[1] + 2 * alien_size[1] * rows
+                                       + batch.fleet_drop[game]).tolist()))
+            same = same and (stats.score, stats.level, stats.ships_left, stats.game_active,
+                             core.ship.left, aliens) == (
+                batch.score[game], batch.level[game], batch.ships_left[game],
+                batch.game_active[game], batch.ship_left[game], batch_aliens)
+        frame += 1
+    print("{} games played to the end in {} ticks: {}".format(
+        number_games, frame, "same state as GameCore on every tick" if same
+        else "DIFFERENT STATE on tick {}".format(frame - 1)))
+
+    for number_games in (1, 100, 1000, 10000):
+        batch = BatchSimulator(create_settings(number_games), screen_size, ship_size, alien_size)
+        batch.start_games()
+        inputs = [batch_inputs(number_games, frame) for frame in range(100)]
+
+        start = perf_counter()
+        for frame in range(frames):
+            batch.step(*inputs[frame % 100])
+        elapsed = perf_counter() - start
+
+        print("{:>6} games: {:8.1f} us/tick, {:10.0f} game-ticks/s, {} still active".format(
+            number_games, elapsed / frames * 1e6, number_games * frames / elapsed,
+            int(batch.game_active.sum())))
+
+
+def create_stress_core(ai_settings, number_aliens, number_bullets, seed=0):
+    """Creates a game core with a large lattice of aliens and bullets scattered over it.
+
+    Args:
+        ai_settings (Settings): An object containing the game settings.
+        number_aliens (int): The number of aliens.
+        number_bullets (int): The number of bullets.
+        seed (int): The seed of the bullet positions.
+
+    Returns:
+        GameCore: The game core.
+
+    """
+
+    columns, rows = 100, number_aliens // 100 + 1
+    width, height = 80 * columns, 45 * rows
+    alien_size = assets.load_image('assets/images/alien.png').get_size()
+    core = GameCore(ai_settings, GameStats(ai_settings), (width, height),
+                    assets.load_image('assets/images/ship.png').get_size(), alien_size,
+                    assets.load_mask_rows('assets/images/ship.png'),
+                    assets.load_mask_rows('assets/images/alien.png'))
+    core.pitch_x, core.pitch_y = 80, 45
+    core.columns, core.rows = columns, rows
+    for number in range(number_aliens):
+        row, column = divmod(number, columns)
+        core.aliens.spawn(80 * column, 45 * row, column, row)
+
+    rng = random.Random(seed)
+    for number in range(number_bullets):
+        core.spawn_bullet(rng.randrange(width), rng.randrange(height),
+                          ai_settings.bullet_speed_factor)
+    return core
+
+
+def collision_signature(ai_settings, number_aliens, number_bullets):
+    """Resolves the collisions of a fresh stress scene with the configured backend.
+
+    Args:
+        ai_settings (Settings): An object containing the game settings.
+        number_aliens (int): The number of aliens.
+        number_bullets (int): The number of bullets.
+
+    Returns:
+        list: The position of each bullet that hit, with the positions of the aliens it
+        hit, in the order the backend resolved them.
+
+    """
+
+    core = create_stress_core(ai_settings, number_aliens, number_bullets)
+    alien_index = {alien: index for index, alien in enumerate(core.aliens)}
+    bullet_index = {bullet: index for index, bullet in enumerate(core.bullets)}
+
+    collisions = core.collide_bullets()
+    return [(bullet_index[bullet], [alien_index[alien] for alien in aliens_hit])
+            for bullet, aliens_hit in collisions.items()]
+
+
+def bench_collisions(frames):
+    """Compares the bullet/alien collision backends at stress-scale counts.
+
+    Each backend is first checked against groupcollide on the same scene.
+
+    Args:
+        frames (int): The number of collision passes for each backend and size.
+
+    """
+
+    frames = max(1, frames // 20)
+    ai_settings = Settings()
+
+    for number_aliens, number_bullets in ((35, 3), (1000, 100), (5000, 500)):
+        ai_settings.collision_backend = 'groupcollide'
+        expected = collision_signature(ai_settings, number_aliens, number_bullets)
+
+        for backend in ('groupcollide', 'spatial_hash', 'numpy', 'lattice'):
+            ai_settings.collision_backend = backend
+            matches = collision_signature(ai_settings, number_aliens,
+                                          number_bullets) == expected
+            core = create_stress_core(ai_settings, number_aliens, number_bullets)
+
+            # the hits are only returned, so every pass resolves the same scene
+            start = perf_counter()
+            for frame in range(frames):
+                core.collide_bullets()
+            elapsed = perf_counter() - start
+
+            print("{:>12}: {:10.1f} us/pass for {} aliens and {} bullets, {}".format(
+                backend, elapsed / frames * 1e6, number_aliens, number_bullets,
+                "same hits as groupcollide" if matches else "DIFFERENT HITS"))
+
+
+def bench_fleet(frames):
+    """Compares the fleet backends moving a stress-scale fleet.
+
+    The spaceship is moved out of reach and the fleet does not drop, so
+    every tick of update_aliens() steers, moves and checks the edges of the
+    whole fleet. Both backends must leave every alien at the same place.
+
+    Args:
+        frames (int): The number of ticks for each backend and size.
+
+    """
+
+    backends = ('lists', 'numpy') if np is not None else ('lists',)
+    for number_aliens in (35, 1000, 10000):
+        positions = []
+        for backend in backends:
+            ai_settings = Settings()
+            ai_settings.fleet_backend = backend
+            ai_settings.fleet_drop_speed = 0
+            core = create_stress_core(ai_settings, number_aliens, 0)
+            core.ship.y = 10 * core.screen_height
+
+            start = perf_counter()
+            for frame in range(frames):
+                core.update_aliens()
+            elapsed = perf_counter() - start
+            positions.append(sorted((alien.left, alien.top) for alien in core.aliens))
+
+            print("{:>5}: {:8.1f} us/tick for {} aliens, {}".format(
+                backend, elapsed / frames * 1e6, number_aliens,
+                "same fleet as lists" if positions[-1] == positions[0] else "DIFFERENT FLEET"))
+
+
+def count_lowest_row(core):
+    """Returns the number of aliens left in the lowest row of the fleet.
+
+    Args:
+        core (GameCore): The game core.
+
+    Returns:
+        int: The number of aliens.
+
+    """
+
+    return sum(1 for column, row in core.aliens.cells if row == core.rows - 1)
+
+
+def bench_savestate(frames):
+    """Times snapshot() and restore() and checks that a restored game plays the same.
+
+    A game is played for frames ticks and snapshotted; the next frames ticks
+    are recorded as snapshots, then played again after restoring the game,
+    and then in a new game restored from the snapshot, and every snapshot
+    must be the same.
+
+    Args:
+        frames (int): The number of ticks played before and after the snapshot.
+
+    """
+
+    def state(game):
+        return game['ai_settings'], game['stats'], game['core'], game['actions']
+
+    def play(game, first, states):
+        actions = game['actions']
+        for frame in range(first, first + frames):
+            actions.moving_right = frame // 400 % 2 == 0
+            actions.moving_left = not actions.moving_right
+            play_frame(game, frame)
+            states.append(snapshot(*state(game)))
+
+    number = 1000
+    game = create_game(Settings())
+    full = snapshot(*state(game))
+
+    start = perf_counter()
+    for repeat in range(number):
+        snapshot(*state(game))
+    snapshot_time = (perf_counter() - start) / number
+    start = perf_counter()
+    for repeat in range(number):
+        restore(full, *state(game))
+    restore_time = (perf_counter() - start) / number
+
+    play(game, 0, [])
+    blob = snapshot(*state(game))
+    recorded, replayed, restored = [], [], []
+    play(game, frames, recorded)
+    restore(blob, *state(game))
+    play(game, frames, replayed)
+
+    other = create_game(Settings())
+    restore(blob, *state(other))
+    play(other, frames, restored)
+
+    # restores the full fleet over the damaged one
+    restore(full, *state(game))
+    same_full = snapshot(*state(game)) == full
+
+    print("{} bytes, snapshot {:.1f} us, restore {:.1f} us for {} aliens; "
+          "rollback {}, new game {}, full fleet {}".format(
+              len(full), snapshot_time * 1e6, restore_time * 1e6, len(game['core'].aliens),
+              "same" if replayed == recorded else "DIFFERENT",
+              "same" if restored == recorded else "DIFFERENT",
+              "same" if same_full else "DIFFERENT"))
+
+
+def bench_sweep(frames):
+    """Fires a bullet under every column of the fleet at level 40 bullet speeds.
+
+    The bullets start from random heights under the fleet and go up until
+    they leave the screen while the fleet stays still, with and without
+    collision_sweep. Every bullet should destroy the lowest alien of its
+    column, and nothing else.
+
+    Args:
+        frames (int): The number of volleys fired with each setting.
+
+    """
+
+    frames = max(1, frames // 100)
+    for sweep in (False, True):
+        ai_settings = Settings()
+        ai_settings.collision_sweep = sweep
+        core = create_game(ai_settings)['core']
+        for level in range(39):
+            ai_settings.increase_speed()
+        alien_width = core.alien_size[0]
+
+        fired = destroyed = lowest = 0
+        elapsed = 0.0
+        for volley in range(frames):
+            rng = random.Random(volley)
+            core.aliens.clear()
+            core.create_fleet()
+            number_aliens, number_lowest = len(core.aliens), count_lowest_row(core)
+
+            for alien_number in range(core.columns):
+                center = alien_width + 2 * alien_width * alien_number + alien_width // 2
+                core.spawn_bullet(center - ai_settings.bullet_width // 2,
+                                  core.ship.y - rng.uniform(0.0, 150.0),
+                                  ai_settings.bullet_speed_factor)
+            fired += core.columns
+
+            start = perf_counter()
+            while core.bullets:
+                core.update_bullets()
+            elapsed += perf_counter() - start
+            destroyed += number_aliens - len(core.aliens)
+            lowest += number_lowest - count_lowest_row(core)
+
+        print("sweep {!s:>5}: {} aliens destroyed by {} bullets, {} in the lowest row, "
+              "at {:.0f} px/tick, {:.1f} us/volley".format(
+                  sweep, destroyed, fired, lowest,
+                  ai_settings.bullet_speed_factor * core.dt, elapsed / frames * 1e6))
+
+
+BENCHMARKS = {
+    'batch': bench_batch,
+    'bullet_pool': bench_bullet_pool,
+    'bullets': bench_bullets,
+    'collisions': bench_collisions,
+    'entity_memory': bench_entity_memory,
+    'fleet': bench_fleet,
+    'render': bench_render,
+    'savestate': bench_savestate,
+    'score_text': bench_score_text,
+    'sweep': bench_sweep,
+}
+
+
+def main():
+    """Runs the benchmarks named on the command line.
+
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help="the benchmarks to run, among {} (default: all)".format(
+                            ', '.join(sorted(BENCHMARKS))))
+    parser.add_argument('--frames', type=int, default=1000,
+                        help="the number of frames or ticks per benchmark")
+    args = parser.parse_args()
+
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error("unknown benchmark: {}".format(name))
+
+    for name in args.names or sorted(BENCHMARKS):
+        print("== {}".format(name))
+        BENCHMARKS[name](args.frames)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+try:
+    import numpy as np
+except ImportError:     # the 'numpy' collision backend is optional
+    np = None
+
+from src.characters.entities import round_coordinate
+
+
+def box_overlaps_mask(left, top, right, bottom, entity, mask):
+    """Returns True if a filled area overlaps an opaque pixel of an entity.
+
+    Args:
+        left (int): The left edge of the area.
+        top (int): The top edge of the area.
+        right (int): The right edge of the area.
+        bottom (int): The bottom edge of the area.
+        entity (Entity): The entity the mask belongs to.
+        mask (tuple): The opaque pixels of each row of the entity, as bits.
+
+    Returns:
+        bool: True if the area covers an opaque pixel of the entity.
+
+    """
+
+    entity_left, entity_top = entity.left, entity.top
+    first_x, last_x = max(left, entity_left), min(right, entity_left + entity.width)
+    first_y, last_y = max(top, entity_top), min(bottom, entity_top + entity.height)
+    if first_x >= last_x or first_y >= last_y:
+        return False
+
+    # the columns of the area, as bits of a row of the mask
+    bits = ((1 << (last_x - first_x)) - 1) << (first_x - entity_left)
+    for y in range(first_y - entity_top, last_y - entity_top):
+        if mask[y] & bits:
+            return True
+    return False
+
+
+def masks_overlap(entity, mask, other, other_mask):
+    """Returns True if the opaque pixels of two entities overlap.
+
+    The result is the one of pygame.mask.Mask.overlap() on the masks of the
+    images the entities are drawn with.
+
+    Args:
+        entity (Entity): An entity.
+        mask (tuple): The opaque pixels of each row of the entity, as bits.
+        other (Entity): The other entity.
+        other_mask (tuple): The opaque pixels of each row of the other entity, as bits.
+
+    Returns:
+        bool: True if the entities have an opaque pixel in common.
+
+    """
+
+    left, top = entity.left, entity.top
+    other_left, other_top = other.left, other.top
+    first_y = max(top, other_top)
+    last_y = min(top + entity.height, other_top + other.height)
+
+    # the rows of the leftmost entity are shifted to the origin of the other one
+    shift = other_left - left
+    for y in range(first_y, last_y):
+        row, other_row = mask[y - top], other_mask[y - other_top]
+        if shift >= 0:
+            if (row >> shift) & other_row:
+                return True
+        elif (other_row >> -shift) & row:
+            return True
+    return False
+
+
+def overlapping(left, top, right, bottom, candidates, collided=None, dead=()):
+    """Returns the candidates that overlap an area.
+
+    Args:
+        left (int): The left edge of the area.
+        top (int): The top edge of the area.
+        right (int): The right edge of the area.
+        bottom (int): The bottom edge of the area.
+        candidates (iterable): The entities to be tested.
+        collided (callable): A test of the area and an entity whose rects
+            overlap, or None for the rect test alone.
+        dead (collection): The entities to be left out.
+
+    Returns:
+        list: The entities whose rect overlaps the area, as
+        pygame.Rect.colliderect() tests them, and that pass collided.
+
+    """
+
+    hits = []
+    for entity in candidates:
+        entity_left, entity_top = entity.left, entity.top
+        if (entity_left < right and left < entity_left + entity.width
+                and entity_top < bottom and top < entity_top + entity.height
+                and entity not in dead
+                and (collided is None or collided(left, top, right, bottom, entity))):
+            hits.append(entity)
+    return hits
+
+
+def bullet_area(bullet, swept=False):
+    """Returns the area a bullet is tested with.
+
+    A fast bullet can move further than the height of an alien in a single
+    tick and skip over it. When swept, the area is the union of the previous
+    and current rects of the bullet, that is the path it went through.
+
+    Args:
+        bullet (BulletEntity): The bullet.
+        swept (bool): A flag indicating whether the path of the bullet is tested.
+
+    Returns:
+        tuple: The left, top, right and bottom edges of the area.
+
+    """
+
+    left, top = bullet.left, bullet.top
+    if swept:
+        previous_top = round_coordinate(bullet.prev_y)
+        return (left, min(top, previous_top), left + bullet.width,
+                max(top, previous_top) + bullet.height)
+    return left, top, left + bullet.width, top + bullet.height
+
+
+def first_contact(hits):
+    """Returns the aliens a bullet going up meets first along its path.
+
+    Args:
+        hits (list): The aliens the path of the bullet overlaps.
+
+    Returns:
+        list: The lowest ones, in the same order.
+
+    """
+
+    contact = max(alien.bottom for alien in hits)
+    return [alien for alien in hits if alien.bottom == contact]
+
+
+def groupcollide(bullets, aliens, collided=None, swept=False):
+    """Returns the aliens hit by each bullet, testing every bullet against every alien.
+
+    Bullets are resolved in order, and each one hits every alien it overlaps
+    that no previous bullet hit, as pygame.sprite.groupcollide() does. When
+    swept, the path of each bullet is tested and the bullet only hits the
+    aliens it met first.
+
+    Args:
+        bullets (list): The bullet entities.
+        aliens (collection): The alien entities.
+        collided (callable): The test passed to overlapping(), or None for the rect test.
+        swept (bool): A flag indicating whether the path of the bullets is tested.
+
+    Returns:
+        dict: The aliens hit by each bullet that hit.
+
+    """
+
+    collisions = {}
+    dead = set()
+    for bullet in bullets:
+        hits = overlapping(*bullet_area(bullet, swept), aliens, collided, dead)
+        if hits:
+            if swept:
+                hits = first_contact(hits)
+            dead.update(hits)
+            collisions[bullet] = hits
+    return collisions
+
+
+def spatial_groupcollide(bullets, aliens, grid, collided=None, swept=False):
+    """Returns the aliens hit by each bullet, using a spatial hash broadphase.
+
+    The aliens are kept in a uniform grid of alien-sized cells, so each
+    bullet is only tested against the aliens of the cells it covers, in the
+    order of the group. The result matches groupcollide(), order included.
+
+    Args:
+        bullets (list): The bullet entities.
+        aliens (collection): The alien entities.
+        grid (SpatialHash): The grid of the aliens, kept between ticks.
+        collided (callable): The test passed to overlapping(), or None for the rect test.
+        swept (bool): A flag indicating whether the path of the bullets is tested.
+
+    Returns:
+        dict: The aliens hit by each bullet that hit.
+
+    """
+
+    collisions = {}
+    dead = set()
+    grid.sync(aliens)
+    for bullet in bullets:
+        area = bullet_area(bullet, swept)
+        candidates = grid.query(*area)
+        if not candidates:
+            continue
+
+        hits = overlapping(*area, candidates, collided, dead)
+        if hits:
+            if swept:
+                hits = first_contact(hits)
+            # the next bullets cannot hit them again
+            dead.update(hits)
+            collisions[bullet] = hits
+    return collisions
+
+
+def lattice_groupcollide(bullets, query, collided=None, swept=False):
+    """Returns the aliens hit by each bullet, looking up the lattice cells of each bullet.
+
+    Each bullet is only tested against the aliens of the fleet cells it
+    covers, found arithmetically by GameCore.query(). The result matches
+    groupcollide().
+
+    Args:
+        bullets (list): The bullet entities.
+        query (callable): A function of an area returning the aliens of the cells it may overlap.
+        collided (callable): The test passed to overlapping(), or None for the rect test.
+        swept (bool): A flag indicating whether the path of the bullets is tested.
+
+    Returns:
+        dict: The aliens hit by each bullet that hit.
+
+    """
+
+    collisions = {}
+    dead = set()
+    for bullet in bullets:
+        area = bullet_area(bullet, swept)
+        hits = overlapping(*area, query(*area), collided, dead)
+        if hits:
+            if swept:
+                hits = first_contact(hits)
+            dead.update(hits)
+            collisions[bullet] = hits
+    return collisions
+
+
+def edge_arrays(entities):
+    """Packs the edges of the entities into four integer arrays.
+
+    Args:
+        entities (list): The entities whose edges are packed.
+
+    Returns:
+        tuple: The left, top, right and bottom coordinate arrays.
+
+    """
+
+    count = len(entities)
+    left = np.fromiter((entity.left for entity in entities), dtype=np.int64, count=count)
+    top = np.fromiter((entity.top for entity in entities), dtype=np.int64, count=count)
+    width = np.fromiter((entity.width for entity in entities), dtype=np.int64, count=count)
+    height = np.fromiter((entity.height for entity in entities), dtype=np.int64, count=count)
+    return left, top, left + width, top + height
+
+
+def numpy_groupcollide(bullets, aliens, collided=None, swept=False):
+    """Returns the aliens hit by each bullet, using a vectorized overlap test.
+
+    Every bullet/alien pair is tested at once with NumPy broadcasting. Hits
+    are then resolved bullet by bullet in order, each bullet hitting every
+    alien not hit yet that it overlaps, so the result matches groupcollide().
+
+    Args:
+        bullets (list): The bullet entities.
+        aliens (list): The alien entities.
+        collided (callable): The test passed to overlapping(), or None for the rect test.
+        swept (bool): A flag indicating whether the path of the bullets is tested.
+
+    Returns:
+        dict: The aliens hit by each bullet that hit.
+
+    """
+
+    if np is None:
+        raise RuntimeError("the 'numpy' collision backend requires NumPy")
+
+    collisions = {}
+    if not bullets or not aliens:
+        return collisions
+
+    bullet_left, bullet_top, bullet_right, bullet_bottom = edge_arrays(bullets)
+    if swept:
+        # the path of each bullet since the previous tick
+        previous_top = np.fromiter((round_coordinate(bullet.prev_y) for bullet in bullets),
+                                   dtype=np.int64, count=len(bullets))
+        height = bullet_bottom - bullet_top
+        bullet_top, bullet_bottom = (np.minimum(bullet_top, previous_top),
+                                     np.maximum(bullet_top, previous_top) + height)
+    alien_left, alien_top, alien_right, alien_bottom = edge_arrays(aliens)
+
+    # the test of pygame.Rect.colliderect() for every pair at once
+    overlaps = ((bullet_left[:, None] < alien_right[None, :])
+                & (alien_left[None, :] < bullet_right[:, None])
+                & (bullet_top[:, None] < alien_bottom[None, :])
+                & (alien_top[None, :] < bullet_bottom[:, None]))
+
+    alive = np.ones(len(aliens), dtype=bool)
+    for index in np.flatnonzero(overlaps.any(axis=1)).tolist():
+        hits = np.flatnonzero(overlaps[index] & alive).tolist()
+        if collided is not None:
+            box = (int(bullet_left[index]), int(bullet_top[index]),
+                   int(bullet_right[index]), int(bullet_bottom[index]))
+            hits = [hit for hit in hits if collided(*box, aliens[hit])]
+        if not hits:
+            continue
+
+        hit_aliens = [aliens[hit] for hit in hits]
+        if swept:
+            hit_aliens = first_contact(hit_aliens)
+            hits = [hit for hit in hits if aliens[hit] in hit_aliens]
+        alive[hits] = False
+        collisions[bullets[index]] = hit_aliens
+    return collisions
@@ -0,0 +1,156 @@
+"""Plays many headless games across processes to compare settings.
+
+Every combination of the given speedup_scale, score_scale and
+fleet_drop_speed values is played by a bot with each seed, for example:
+
+    python -m src.utils.farm --seeds 16 --speedup-scale 1.05 1.1 1.2
+
+Each game runs on the pygame-free GameCore in a worker process; the result
+of every game is printed as soon as it finishes, followed by a summary
+table per combination of settings.
+
+"""
+
+import argparse
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+
+from src.gui.settings import Settings
+from src.statistics.game_stats import GameStats
+from src.engine.core import Actions, GameCore
+from src.utils.assets import assets
+
+
+def play_game(variant, seed, ship_size, alien_size, max_ticks):
+    """Plays a game with a bot until it is over, in a worker process.
+
+    The bot keeps moving in one direction for a random number of ticks and
+    fires at random; it only depends on the seed, so a game can be played
+    again with the same result.
+
+    Args:
+        variant (dict): The settings that differ from the defaults.
+        seed (int): The seed of the bot.
+        ship_size (tuple): The width and height of the spaceship.
+        alien_size (tuple): The width and height of an alien.
+        max_ticks (int): The number of ticks after which the game is stopped.
+
+    Returns:
+        dict: The variant, the seed, the final score, the level reached and the ticks survived.
+
+    """
+
+    ai_settings = Settings()
+    for name, value in variant.items():
+        setattr(ai_settings, name, value)
+    stats = GameStats(ai_settings)
+    core = GameCore(ai_settings, stats, (ai_settings.screen_width, ai_settings.screen_height),
+                    ship_size, alien_size)
+    core.start_game()
+
+    rng = random.Random(seed)
+    actions = Actions()
+    hold = ticks = 0
+    start = perf_counter()
+    while stats.game_active and ticks < max_ticks:
+        if hold == 0:
+            actions.moving_right = rng.random() < 0.5
+            actions.moving_left = not actions.moving_right
+            hold = rng.randrange(30, 300)
+        hold -= 1
+        if rng.random() < 0.125:
+            actions.fire += 1
+        core.step(actions)
+        ticks += 1
+
+    return {'variant': variant, 'seed': seed, 'score': stats.score, 'level': stats.level,
+            'ticks': ticks, 'seconds': perf_counter() - start}
+
+
+def format_variant(variant):
+    """Returns the settings of a variant as text.
+
+    Args:
+        variant (dict): The settings that differ from the defaults.
+
+    """
+
+    return ' '.join("{}={}".format(name, value) for name, value in variant.items())
+
+
+def print_summary(variants, results):
+    """Prints the mean and best results of every variant.
+
+    Args:
+        variants (list): The variants played.
+        results (list): The results returned by play_game().
+
+    """
+
+    print("{:<60} {:>5} {:>14} {:>14} {:>8} {:>10}".format(
+        "settings", "games", "mean score", "max score", "level", "ticks"))
+    for variant in variants:
+        games = [result for result in results if result['variant'] == variant]
+        if not games:
+            continue
+        print("{:<60} {:>5} {:>14.0f} {:>14} {:>8.2f} {:>10.0f}".format(
+            format_variant(variant), len(games),
+            sum(result['score'] for result in games) / len(games),
+            max(result['score'] for result in games),
+            sum(result['level'] for result in games) / len(games),
+            sum(result['ticks'] for result in games) / len(games)))
+
+
+def main():
+    """Plays the games named on the command line and prints their results.
+
+    """
+
+    defaults = Settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seeds', type=int, default=8,
+                        help="the number of games played with each combination of settings")
+    parser.add_argument('--speedup-scale', type=float, nargs='+',
+                        default=[defaults.speedup_scale], metavar='SCALE')
+    parser.add_argument('--score-scale', type=float, nargs='+',
+                        default=[defaults.score_scale], metavar='SCALE')
+    parser.add_argument('--fleet-drop-speed', type=int, nargs='+',
+                        default=[defaults.fleet_drop_speed], metavar='PIXELS')
+    parser.add_argument('--max-ticks', type=int, default=500000,
+                        help="the number of ticks after which a game is stopped")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="the number of worker processes (default: one per core)")
+    args = parser.parse_args()
+
+    variants = [{'speedup_scale': speedup_scale, 'score_scale': score_scale,
+                 'fleet_drop_speed': fleet_drop_speed}
+                for speedup_scale, score_scale, fleet_drop_speed in itertools.product(
+                    args.speedup_scale, args.score_scale, args.fleet_drop_speed)]
+    ship_size = assets.load_image('assets/images/ship.png').get_size()
+    alien_size = assets.load_image('assets/images/alien.png').get_size()
+
+    results = []
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(play_game, variant, seed, ship_size, alien_size,
+                                   args.max_ticks)
+                   for variant in variants for seed in range(args.seeds)]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print("{:<60} seed {:>4}: score {:>10}, level {:>3}, {:>7} ticks in {:.2f} s".format(
+                format_variant(result['variant']), result['seed'], result['score'],
+                result['level'], result['ticks'], result['seconds']), flush=True)
+
+    elapsed = perf_counter() - start
+    ticks = sum(result['ticks'] for result in results)
+    print("{} games, {} ticks in {:.2f} s ({:.0f} ticks/s) on {} workers".format(
+        len(results), ticks, elapsed, ticks / elapsed, args.workers))
+    print_summary(variants, results)
+
+
+if __name__ == '__main__':
+    main()
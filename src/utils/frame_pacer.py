@@ -0,0 +1,117 @@
+import pygame
+
+
+class FramePacer:
+    """A class that limits the frame rate of the main loop and measures its frames.
+
+    Attributes:
+        ai_settings (Settings): An object containing the game settings.
+        clock (pygame.time.Clock): The clock used for limiting the frame rate.
+        frame_time (float): The average time, in milliseconds, between two frames.
+        work_time (float): The average time, in milliseconds, spent working on a frame.
+        frames (int): The number of frames paced.
+
+    Methods:
+        __init__(self, ai_settings):
+            Initializes the frame pacer.
+
+        tick(self):
+            Waits until the next frame is due and returns the elapsed time.
+
+        budget(self):
+            Returns the time, in milliseconds, available for each frame.
+
+        budget_used(self):
+            Returns the fraction of the frame budget spent working.
+
+        wait_events(self):
+            Blocks until something happens and returns the pending events.
+
+    """
+
+    # the weight of the newest frame in the averages
+    smoothing = 0.05
+
+    def __init__(self, ai_settings):
+        """Initializes the frame pacer.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+
+        """
+
+        self.ai_settings = ai_settings
+        self.clock = pygame.time.Clock()
+
+        self.frame_time = 0.0
+        self.work_time = 0.0
+        self.frames = 0
+
+    def tick(self):
+        """Waits until the next frame is due and returns the elapsed time.
+
+        Returns:
+            int: The time, in milliseconds, since the previous call.
+
+        """
+
+        if self.ai_settings.fps_busy_loop:
+            elapsed = self.clock.tick_busy_loop(self.ai_settings.fps_limit)
+        else:
+            elapsed = self.clock.tick(self.ai_settings.fps_limit)
+
+        # get_rawtime() is the part of the frame not spent waiting
+        if self.frames == 0:
+            self.frame_time = float(elapsed)
+            self.work_time = float(self.clock.get_rawtime())
+        else:
+            self.frame_time += self.smoothing * (elapsed - self.frame_time)
+            self.work_time += self.smoothing * (self.clock.get_rawtime() - self.work_time)
+        self.frames += 1
+
+        return elapsed
+
+    def budget(self):
+        """Returns the time, in milliseconds, available for each frame.
+
+        Returns:
+            float: The frame budget, or 0.0 if the frame rate is not limited.
+
+        """
+
+        if self.ai_settings.fps_limit <= 0:
+            return 0.0
+        return 1000.0 / self.ai_settings.fps_limit
+
+    def budget_used(self):
+        """Returns the fraction of the frame budget spent working.
+
+        Returns:
+            float: The average work time divided by the frame budget.
+
+        """
+
+        budget = self.budget()
+        if budget == 0.0:
+            return 0.0
+        return self.work_time / budget
+
+    def wait_events(self):
+        """Blocks until something happens and returns the pending events.
+
+        Mouse motion alone does not wake the loop up, since nothing on the
+        idle screen depends on it.
+
+        Returns:
+            list: The event that woke the loop up followed by the other pending events.
+
+        """
+
+        event = pygame.event.wait()
+        while event.type == pygame.MOUSEMOTION:
+            event = pygame.event.wait()
+        events = [event] + pygame.event.get()
+
+        # the time spent waiting does not belong to any frame
+        self.clock.tick()
+        return events
@@ -0,0 +1,187 @@
+import hashlib
+import json
+
+import pygame
+
+from src.utils.savestate import snapshot
+
+
+# the version of the recording format
+FORMAT = 2
+
+# the settings that change how the game plays, copied into a recording
+RECORDED_SETTINGS = ('screen_width', 'screen_height', 'ship_limit', 'respawn_delay',
+                     'bullet_width', 'bullet_height', 'bullets_allowed', 'fleet_drop_speed',
+                     'speedup_scale', 'score_scale', 'sim_tick_rate',
+                     'collision_mode', 'collision_backend', 'collision_sweep')
+
+
+def state_hash(ai_settings, stats, core, actions):
+    """Returns a short hash of the snapshot of a game.
+
+    Returns:
+        str: The hash, in hexadecimal.
+
+    """
+
+    return hashlib.blake2b(snapshot(ai_settings, stats, core, actions),
+                           digest_size=8).hexdigest()
+
+
+def encode_event(event):
+    """Returns the fields of an event that check_events() acts on.
+
+    Quitting is not recorded: it ends the program, not the game.
+
+    Args:
+        event (pygame.event.Event): An event taken from the pygame event queue.
+
+    Returns:
+        list: The type of the event and its fields, or None if it is not recorded.
+
+    """
+
+    if event.type == pygame.KEYDOWN and event.key != pygame.K_q:
+        return [event.type, event.key]
+    elif event.type == pygame.KEYUP:
+        return [event.type, event.key]
+    elif event.type == pygame.MOUSEBUTTONDOWN:
+        return [event.type, event.pos[0], event.pos[1], event.button]
+    return None
+
+
+def decode_event(fields):
+    """Returns the event encoded by encode_event().
+
+    Args:
+        fields (list): The type of the event and its fields.
+
+    Returns:
+        pygame.event.Event: The event.
+
+    """
+
+    if fields[0] == pygame.MOUSEBUTTONDOWN:
+        return pygame.event.Event(fields[0], pos=(fields[1], fields[2]), button=fields[3])
+    return pygame.event.Event(fields[0], key=fields[1])
+
+
+class InputRecorder:
+    """A class that writes the inputs of a game and hashes of its state to a file.
+
+    The file has one JSON object per line: a header with the settings and a
+    snapshot of the game when the recording starts, then the events passed to
+    check_events() and the state hashes in the order they happened, each one
+    with the number of ticks simulated before it, and a final hash.
+
+    Attributes:
+        file (file): The recording being written.
+        hash_every (int): The number of ticks between two state hashes.
+
+    Methods:
+        __init__(self, path, ai_settings, stats, core, actions):
+            Starts a recording of the game from its current state.
+
+        record_events(self, ticks, events):
+            Writes the events that check_events() is about to act on.
+
+        record_tick(self, ticks, ai_settings, stats, core, actions):
+            Writes a state hash every hash_every ticks.
+
+        close(self, ticks, ai_settings, stats, core, actions):
+            Writes the final state hash and closes the recording.
+
+    """
+
+    def __init__(self, path, ai_settings, stats, core, actions):
+        """Starts a recording of the game from its current state.
+
+        Args:
+            path (str): The path of the recording.
+
+        """
+
+        # every line is flushed, so the recording survives a crash
+        self.file = open(path, 'w', buffering=1)
+        self.hash_every = ai_settings.replay_hash_every
+        self.write({
+            'format': FORMAT,
+            'settings': {name: getattr(ai_settings, name) for name in RECORDED_SETTINGS},
+            'hash_every': self.hash_every,
+            'snapshot': snapshot(ai_settings, stats, core, actions).hex(),
+        })
+
+    def write(self, record):
+        """Writes a record as a line of the recording.
+
+        Args:
+            record (dict): The record.
+
+        """
+
+        self.file.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def record_events(self, ticks, events):
+        """Writes the events that check_events() is about to act on.
+
+        Args:
+            ticks (int): The number of ticks simulated so far.
+            events (list): The events taken from the pygame event queue.
+
+        """
+
+        for event in events:
+            fields = encode_event(event)
+            if fields is not None:
+                self.write({'tick': ticks, 'event': fields})
+
+    def record_tick(self, ticks, ai_settings, stats, core, actions):
+        """Writes a state hash every hash_every ticks.
+
+        Args:
+            ticks (int): The number of ticks simulated so far.
+
+        """
+
+        if self.hash_every and ticks % self.hash_every == 0:
+            self.write({'tick': ticks,
+                        'hash': state_hash(ai_settings, stats, core, actions)})
+
+    def close(self, ticks, ai_settings, stats, core, actions):
+        """Writes the final state hash and closes the recording.
+
+        Args:
+            ticks (int): The number of ticks simulated so far.
+
+        """
+
+        self.write({'tick': ticks,
+                    'end': state_hash(ai_settings, stats, core, actions)})
+        self.file.close()
+
+
+def load_recording(path, ai_settings):
+    """Reads a recording and applies its settings.
+
+    Args:
+        path (str): The path of the recording.
+        ai_settings (Settings): An object containing the game settings.
+
+    Returns:
+        tuple: The snapshot the recording starts from and the list of its records.
+
+    Raises:
+        ValueError: If the file is not a recording of this format.
+
+    """
+
+    with open(path) as file:
+        records = [json.loads(line) for line in file if line.strip()]
+
+    if not records or records[0].get('format') != FORMAT:
+        raise ValueError("{} is not a format {} recording".format(path, FORMAT))
+
+    header = records[0]
+    for name, value in header['settings'].items():
+        setattr(ai_settings, name, value)
+    return bytes.fromhex(header['snapshot']), records[1:]
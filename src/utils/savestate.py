@@ -0,0 +1,154 @@
+import struct
+from array import array
+
+
+# the layout of a snapshot: a header, the dynamic settings, the statistics,
+# the spaceship, then the fleet and the bullets as counted arrays
+MAGIC = b'AISV'
+VERSION = 2
+HEADER = struct.Struct('<4sB')
+SETTINGS = struct.Struct('<dddqq')
+STATS = struct.Struct('<qqqq?q')
+SHIP = struct.Struct('<ddqq??')
+FLEET = struct.Struct('<III')
+COUNT = struct.Struct('<I')
+
+
+def snapshot(ai_settings, stats, core, actions):
+    """Packs the state of a game into bytes.
+
+    The dynamic settings, the statistics, the spaceship, every alien and
+    every bullet of the game core are packed with struct and array, field by
+    field, so that restore() only has to unpack numbers. The aliens are
+    packed in (column, row) order, so that two games in the same state give
+    the same bytes; the bullets are packed in the order they were fired.
+
+    Args:
+        ai_settings (Settings): An object containing the game settings.
+        stats (GameStats): An object containing the game statistical data.
+        core (GameCore): The game.
+        actions (Actions): The inputs of the player, whose movement flags are packed.
+
+    Returns:
+        bytes: The snapshot.
+
+    """
+
+    ship = core.ship
+    parts = [
+        HEADER.pack(MAGIC, VERSION),
+        SETTINGS.pack(ai_settings.ship_speed_factor, ai_settings.bullet_speed_factor,
+                      ai_settings.alien_speed_factor, ai_settings.fleet_direction,
+                      ai_settings.alien_points),
+        STATS.pack(stats.ships_left, stats.score, stats.level, stats.high_score,
+                   stats.game_active, stats.respawn_ticks),
+        SHIP.pack(core.ship_center, core.prev_ship_center, ship.x, ship.prev_x,
+                  actions.moving_right, actions.moving_left),
+    ]
+
+    fleet = [alien for key, alien in sorted(core.aliens.cells.items())]
+    parts.append(FLEET.pack(len(fleet), core.columns, core.rows))
+    for name in ('column', 'row'):
+        parts.append(array('q', [getattr(alien, name) for alien in fleet]).tobytes())
+    for name in ('x', 'prev_x', 'y', 'prev_y'):
+        parts.append(array('d', [getattr(alien, name) for alien in fleet]).tobytes())
+
+    bullets = core.bullets
+    parts.append(COUNT.pack(len(bullets)))
+    for name in ('x', 'y', 'prev_y', 'speed'):
+        parts.append(array('d', [getattr(bullet, name) for bullet in bullets]).tobytes())
+
+    return b''.join(parts)
+
+
+def unpack_arrays(blob, offset, count, typecodes):
+    """Reads consecutive arrays of count items from a snapshot.
+
+    Args:
+        blob (bytes): The snapshot.
+        offset (int): The position of the first array.
+        count (int): The number of items of each array.
+        typecodes (str): The array typecode of each array.
+
+    Returns:
+        tuple: The arrays, then the position after the last one.
+
+    """
+
+    arrays = []
+    for typecode in typecodes:
+        values = array(typecode)
+        size = count * values.itemsize
+        values.frombytes(blob[offset:offset + size])
+        arrays.append(values)
+        offset += size
+    return arrays, offset
+
+
+def restore(blob, ai_settings, stats, core, actions):
+    """Puts a game back in the state of a snapshot.
+
+    When the fleet has the same aliens as the snapshot, they are updated in
+    place, so the sprites drawing them are kept; otherwise the fleet is
+    spawned again from the snapshot, and drawn by new sprites. The bullets
+    reuse the handles of the free list of the core. The scoreboard is not
+    rendered again; call its prep methods afterwards.
+
+    Args:
+        blob (bytes): The snapshot returned by snapshot().
+        ai_settings (Settings): An object containing the game settings.
+        stats (GameStats): An object containing the game statistical data.
+        core (GameCore): The game.
+        actions (Actions): The inputs of the player, whose movement flags are restored.
+
+    Raises:
+        ValueError: If the bytes are not a snapshot of this version.
+
+    """
+
+    magic, version = HEADER.unpack_from(blob, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version {} snapshot".format(VERSION))
+    offset = HEADER.size
+
+    (ai_settings.ship_speed_factor, ai_settings.bullet_speed_factor,
+     ai_settings.alien_speed_factor, ai_settings.fleet_direction,
+     ai_settings.alien_points) = SETTINGS.unpack_from(blob, offset)
+    offset += SETTINGS.size
+
+    (stats.ships_left, stats.score, stats.level, stats.high_score, stats.game_active,
+     stats.respawn_ticks) = STATS.unpack_from(blob, offset)
+    offset += STATS.size
+
+    ship = core.ship
+    (core.ship_center, core.prev_ship_center, ship.x, ship.prev_x, actions.moving_right,
+     actions.moving_left) = SHIP.unpack_from(blob, offset)
+    offset += SHIP.size
+
+    count, core.columns, core.rows = FLEET.unpack_from(blob, offset)
+    offset += FLEET.size
+    (column, row, x, prev_x, y, prev_y), offset = unpack_arrays(
+        blob, offset, count, 'qqdddd')
+
+    keys = list(zip(column, row))
+    aliens = core.aliens
+    cells = aliens.cells
+    if len(cells) != count or not all(key in cells for key in keys):
+        aliens.clear()
+    for index, key in enumerate(keys):
+        alien = cells.get(key)
+        if alien is None:
+            alien = aliens.spawn(x[index], y[index], *key)
+        alien.x, alien.prev_x = x[index], prev_x[index]
+        alien.y, alien.prev_y = y[index], prev_y[index]
+
+    # the extreme aliens may be others in the restored fleet
+    aliens.invalidate_edges()
+
+    count, = COUNT.unpack_from(blob, offset)
+    offset += COUNT.size
+    (x, y, prev_y, speed), offset = unpack_arrays(blob, offset, count, 'dddd')
+    core.clear_bullets()
+    for index in range(count):
+        bullet = core.spawn_bullet(x[index], y[index], speed[index])
+        bullet.prev_y = prev_y[index]
@@ -0,0 +1,73 @@
+class SimulationClock:
+    """A class that turns the real time elapsed between frames into fixed simulation ticks.
+
+    Attributes:
+        ai_settings (Settings): An object containing the game settings.
+        dt (float): The duration, in seconds, of one simulation tick.
+        accumulator (float): The real time, in seconds, not yet simulated.
+        ticks (int): The number of ticks simulated since the clock was created.
+        dropped (float): The real time, in seconds, discarded by the catch-up cap.
+
+    Methods:
+        __init__(self, ai_settings):
+            Initializes the simulation clock.
+
+        advance(self, elapsed):
+            Adds the elapsed real time and returns the number of ticks to simulate.
+
+        alpha(self):
+            Returns how far the real time is between the last two ticks.
+
+    """
+
+    def __init__(self, ai_settings):
+        """Initializes the simulation clock.
+
+        Args:
+            ai_settings (Settings): An object containing the game settings.
+
+        """
+
+        self.ai_settings = ai_settings
+        self.dt = 1.0 / ai_settings.sim_tick_rate
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped = 0.0
+
+    def advance(self, elapsed):
+        """Adds the elapsed real time and returns the number of ticks to simulate.
+
+        When the machine falls behind, at most max_catchup_ticks ticks are
+        simulated and the rest of the backlog is dropped, so that a slow frame
+        cannot make every following frame slower.
+
+        Args:
+            elapsed (float): The real time, in seconds, since the previous call.
+
+        Returns:
+            int: The number of ticks to simulate.
+
+        """
+
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.dt)
+
+        if ticks > self.ai_settings.max_catchup_ticks:
+            ticks = self.ai_settings.max_catchup_ticks
+            backlog = self.accumulator - ticks * self.dt
+            self.dropped += backlog
+            self.accumulator = ticks * self.dt
+
+        self.accumulator -= ticks * self.dt
+        self.ticks += ticks
+        return ticks
+
+    def alpha(self):
+        """Returns how far the real time is between the last two ticks.
+
+        Returns:
+            float: A value between 0.0 (the previous tick) and 1.0 (the current tick).
+
+        """
+
+        return min(self.accumulator / self.dt, 1.0)
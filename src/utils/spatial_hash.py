@@ -0,0 +1,175 @@
+class SpatialHash:
+    """A uniform grid that maps screen cells to the entities covering them.
+
+    The grid is kept up to date incrementally: sync() only moves the entities
+    whose edges entered a different range of cells and forgets the entities
+    that are gone, so most ticks only compare a few integers per entity.
+    Every entity keeps the rank it was first inserted with, and query()
+    returns the candidates in that order, so a broadphase over the grid
+    resolves hits in the same order as a test of the whole group.
+
+    Attributes:
+        cell_width (int): The width of a grid cell.
+        cell_height (int): The height of a grid cell.
+        cells (dict): The entities covering each (column, row) cell, as dict keys.
+        spans (dict): The range of cells covered by each entity, as (left, top, right, bottom).
+        ranks (dict): The insertion rank of each entity.
+        next_rank (int): The rank of the next entity inserted.
+
+    Methods:
+        __init__(self, cell_width, cell_height):
+            Initializes an empty grid.
+
+        span(self, left, top, right, bottom):
+            Returns the range of cells covered by an area.
+
+        insert(self, entity, span, rank=None):
+            Adds the entity to every cell of the span.
+
+        remove(self, entity):
+            Removes the entity from the grid.
+
+        sync(self, entities):
+            Brings the grid up to date with the given entities.
+
+        query(self, left, top, right, bottom):
+            Returns the entities covering the cells covered by an area.
+
+    """
+
+    def __init__(self, cell_width, cell_height):
+        """Initializes an empty grid.
+
+        Args:
+            cell_width (int): The width of a grid cell.
+            cell_height (int): The height of a grid cell.
+
+        """
+
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.cells = {}
+        self.spans = {}
+        self.ranks = {}
+        self.next_rank = 0
+
+    def span(self, left, top, right, bottom):
+        """Returns the range of cells covered by an area.
+
+        Args:
+            left (int): The left edge of the area.
+            top (int): The top edge of the area.
+            right (int): The right edge of the area.
+            bottom (int): The bottom edge of the area.
+
+        Returns:
+            tuple: The first column, first row, last column and last row covered.
+
+        """
+
+        return (left // self.cell_width, top // self.cell_height,
+                (right - 1) // self.cell_width, (bottom - 1) // self.cell_height)
+
+    def insert(self, entity, span, rank=None):
+        """Adds the entity to every cell of the span.
+
+        Args:
+            entity (Entity): The entity to be added.
+            span (tuple): The range of cells covered by the entity.
+            rank (int): The rank of the entity, or None to rank it after every other.
+
+        """
+
+        if rank is None:
+            rank = self.next_rank
+            self.next_rank += 1
+        self.ranks[entity] = rank
+        self.spans[entity] = span
+        left, top, right, bottom = span
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell is None:
+                    cell = self.cells[(column, row)] = {}
+                cell[entity] = None
+
+    def remove(self, entity):
+        """Removes the entity from the grid.
+
+        Args:
+            entity (Entity): The entity to be removed.
+
+        Returns:
+            int: The rank the entity had.
+
+        """
+
+        left, top, right, bottom = self.spans.pop(entity)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells[(column, row)]
+                del cell[entity]
+                if not cell:
+                    del self.cells[(column, row)]
+        return self.ranks.pop(entity)
+
+    def sync(self, entities):
+        """Brings the grid up to date with the given entities.
+
+        Args:
+            entities (collection): The entities the grid must contain.
+
+        """
+
+        spans = self.spans
+        for entity in entities:
+            left, top = entity.left, entity.top
+            span = self.span(left, top, left + entity.width, top + entity.height)
+            old_span = spans.get(entity)
+            if old_span != span:
+                # a moved entity keeps its rank
+                rank = None if old_span is None else self.remove(entity)
+                self.insert(entity, span, rank)
+
+        # forget the entities that are gone
+        if len(spans) != len(entities):
+            alive = set(entities)
+            for entity in [entity for entity in spans if entity not in alive]:
+                self.remove(entity)
+
+    def query(self, left, top, right, bottom):
+        """Returns the entities covering the cells covered by an area.
+
+        The entities are candidates only: they may not overlap the area. They
+        are returned in the order they were inserted in the grid.
+
+        Args:
+            left (int): The left edge of the area.
+            top (int): The top edge of the area.
+            right (int): The right edge of the area.
+            bottom (int): The bottom edge of the area.
+
+        Returns:
+            list: The candidate entities.
+
+        """
+
+        left, top, right, bottom = self.span(left, top, right, bottom)
+        cells = self.cells
+        if left == right and top == bottom:
+            cell = cells.get((left, top))
+            if not cell:
+                return []
+            if len(cell) == 1:
+                return list(cell)
+            return sorted(cell, key=self.ranks.__getitem__)
+
+        candidates = {}
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = cells.get((column, row))
+                if cell:
+                    candidates.update(cell)
+        if len(candidates) < 2:
+            return list(candidates)
+        return sorted(candidates, key=self.ranks.__getitem__)
@@ -0,0 +1,23 @@
+import os
+
+# the tests run without a display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+import pytest
+
+from src.gui.settings import Settings
+
+
+@pytest.fixture
+def ai_settings():
+    """Returns the default settings."""
+    return Settings()
+
+
+@pytest.fixture
+def screen(ai_settings):
+    """Returns the game screen, on SDL's dummy video driver."""
+    pygame.init()
+    return pygame.display.set_mode((ai_settings.screen_width, ai_settings.screen_height))
@@ -0,0 +1,57 @@
+import tracemalloc
+
+from src.characters.bullet_pool import BulletPool
+from src.engine.core import Actions
+from src.statistics.game_stats import GameStats
+from src.statistics.scoreboard import Scoreboard
+
+import src.utils.game_functions as gf
+
+
+def test_steady_firing_creates_and_retains_nothing(ai_settings, screen):
+    ai_settings.bullets_allowed = 50
+    stats = GameStats(ai_settings)
+    sb = Scoreboard(ai_settings, screen, stats)
+    core = gf.create_core(ai_settings, stats, screen)
+    actions = Actions()
+    bullets = BulletPool(ai_settings, screen)
+    stats.game_active = True
+
+    # the fleet stays far above the screen, out of the reach of the bullets
+    ai_settings.alien_speed_factor = 0.0
+    for alien in core.aliens:
+        alien.y = alien.prev_y = alien.y - 4 * ai_settings.screen_height
+
+    def tick():
+        actions.fire = 1
+        gf.update_game(stats, sb, core, actions)
+        bullets.sync(core.bullets)
+
+    tracemalloc.start()
+    try:
+        # the first bullets reach the top of the screen and are recycled
+        for frame in range(ai_settings.screen_height):
+            tick()
+        entities = {id(bullet) for bullet in list(core.bullets) + core.free_bullets}
+        sprites = dict(bullets.sprites_of)
+        before = tracemalloc.take_snapshot()
+
+        for frame in range(2000):
+            tick()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # every bullet fired reused an entity and its sprite
+    assert len(entities) == ai_settings.bullets_allowed
+    assert {id(bullet) for bullet in list(core.bullets) + core.free_bullets} == entities
+    assert bullets.sprites_of == sprites
+    assert all(bullet is sprites[bullet.entity] for bullet in bullets)
+
+    sources = [tracemalloc.Filter(True, '*/src/*/' + name)
+               for name in ('bullet_pool.py', 'bullet.py', 'core.py', 'components.py',
+                            'systems.py', 'game_functions.py')]
+    differences = after.filter_traces(sources).compare_to(before.filter_traces(sources),
+                                                          'filename')
+    assert [(stat.traceback[0].filename, stat.count_diff) for stat in differences
+            if stat.count_diff] == []
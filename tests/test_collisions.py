@@ -0,0 +1,74 @@
+import random
+
+import pygame
+import pytest
+from pygame.sprite import Group, Sprite
+
+from src.engine.components import Components
+from src.utils.collisions import numpy_groupcollide
+
+pytest.importorskip('numpy')
+
+
+class Box(Sprite):
+    """A sprite with the rect of an entity, as the game sprites had."""
+
+    def __init__(self, entity):
+        super(Box, self).__init__()
+        self.entity = entity
+        self.rect = pygame.Rect(0, 0, entity.width, entity.height)
+        self.rect.x = entity.x
+        self.rect.y = entity.y
+
+
+def resolve_both(aliens, bullets):
+    """Resolves a scene with numpy_groupcollide() and with pygame.sprite.groupcollide().
+
+    Returns the two {bullet: [aliens]} mappings, both as entities, and the
+    aliens killed by pygame.
+
+    """
+
+    alien_group, bullet_group = Group(), Group()
+    alien_group.add(*[Box(alien) for alien in aliens])
+    bullet_group.add(*[Box(bullet) for bullet in bullets])
+    alive = set(alien_group)
+
+    expected = pygame.sprite.groupcollide(bullet_group, alien_group, True, True)
+    expected = {bullet.entity: [alien.entity for alien in hits]
+                for bullet, hits in expected.items()}
+    killed = {alien.entity for alien in alive - set(alien_group)}
+    return numpy_groupcollide(bullets, aliens), expected, killed
+
+
+def test_numpy_groupcollide_matches_pygame_on_random_scenes():
+    rng = random.Random(13)
+    for _ in range(100):
+        alien_table, bullet_table = Components(75, 39), Components(3, 15)
+        aliens = [alien_table.spawn(rng.uniform(-40, 600), rng.uniform(-20, 400))
+                  for _ in range(rng.randrange(1, 120))]
+        bullets = [bullet_table.spawn(rng.uniform(-5, 680), rng.uniform(-10, 440))
+                   for _ in range(rng.randrange(1, 40))]
+        found, expected, killed = resolve_both(aliens, bullets)
+
+        # same bullets, in the same order, each with the same aliens in the same order
+        assert list(found.items()) == list(expected.items())
+        assert {alien for hits in found.values() for alien in hits} == killed
+
+
+def test_numpy_groupcollide_matches_pygame_on_half_pixels():
+    # rects round half away from zero, so x.5 positions must land alike
+    alien_table, bullet_table = Components(75, 39), Components(3, 15)
+    aliens = [alien_table.spawn(100.5 + 75 * column, 50.5) for column in range(4)]
+    bullets = [bullet_table.spawn(173.5 + 75 * column, 75.5) for column in range(4)]
+    found, expected, killed = resolve_both(aliens, bullets)
+    assert list(found.items()) == list(expected.items())
+    assert len(killed) == 4
+
+
+def test_first_bullet_wins_a_shared_alien():
+    alien, bullets = Components(75, 39).spawn(100, 100), Components(3, 15)
+    first, second = bullets.spawn(120, 110), bullets.spawn(121, 112)
+    found, expected, killed = resolve_both([alien], [first, second])
+    assert found == expected == {first: [alien]}
+    assert killed == {alien}
@@ -0,0 +1,51 @@
+import pytest
+
+from src.characters.entities import BulletEntity
+from src.engine.components import Components, FleetComponents
+
+
+def test_despawn_moves_the_last_row_into_the_hole():
+    fleet = FleetComponents(75, 39)
+    aliens = [fleet.spawn(80 * column, 45, column, 0) for column in range(4)]
+
+    fleet.despawn(aliens[1])
+    assert list(fleet) == [aliens[0], aliens[3], aliens[2]]
+    assert [alien.index for alien in aliens] == [0, -1, 2, 1]
+    assert (aliens[3].x, aliens[3].column) == (240, 3)
+    assert fleet.cells == {(0, 0): aliens[0], (2, 0): aliens[2], (3, 0): aliens[3]}
+
+    with pytest.raises(ValueError):
+        fleet.despawn(aliens[1])
+
+
+def test_compact_keeps_the_order_and_the_handles():
+    bullets = Components(3, 15, BulletEntity)
+    handles = [bullets.spawn(10 * index, 500, 0.0, -600.0) for index in range(5)]
+    bullets.move(0.5)
+
+    removed = bullets.compact([True, False, True, False, True])
+    assert removed == [handles[1], handles[3]]
+    assert list(bullets) == [handles[0], handles[2], handles[4]]
+    assert [bullet.index for bullet in handles] == [0, -1, 1, -1, 2]
+    assert [(bullet.x, bullet.y, bullet.prev_y, bullet.speed) for bullet in bullets] == [
+        (x, 200.0, 500, 600.0) for x in (0, 20, 40)]
+
+    # a removed handle can be spawned again
+    assert bullets.spawn(1, 2, 0.0, -600.0, removed[0]) is handles[1]
+    assert handles[1].index == 3 and (handles[1].x, handles[1].y) == (1, 2)
+
+
+def test_fleet_edges_follow_the_extreme_aliens():
+    fleet = FleetComponents(75, 39)
+    assert fleet.edges() is None
+    aliens = [fleet.spawn(80 * column + 0.5, 45 * row, column, row)
+              for column in range(3) for row in range(2)]
+    assert fleet.edges() == (1, 236, 84)
+
+    fleet.translate(-1.0, 10)
+    assert fleet.edges() == (-1, 235, 94)
+
+    # the extreme aliens are searched again once one of them is gone
+    for alien in aliens[4:]:
+        fleet.despawn(alien)
+    assert fleet.edges() == (-1, 155, 94)
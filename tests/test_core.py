@@ -0,0 +1,101 @@
+import pytest
+
+from src.engine.components import np
+from src.engine.core import Actions
+from src.gui.settings import Settings
+from src.statistics.game_stats import GameStats
+from src.utils.savestate import snapshot
+
+import src.utils.game_functions as gf
+
+
+def test_hit_spaceship_respawns_centered_and_cannot_fire(ai_settings, screen):
+    stats = GameStats(ai_settings)
+    core = gf.create_core(ai_settings, stats, screen)
+    core.start_game()
+    actions = Actions()
+    center = ai_settings.screen_width // 2 - core.ship.width // 2
+
+    actions.moving_right = True
+    for tick in range(200):
+        core.step(actions)
+    assert core.ship.x > center
+
+    core.ship_hit()
+    assert core.ship.x == core.ship.prev_x == center
+    assert stats.respawn_ticks > 0
+
+    # the shots of the respawn delay are dropped, not fired later
+    while stats.respawn_ticks > 0:
+        actions.fire = 1
+        core.step(actions)
+        assert not core.bullets and actions.fire == 0
+        assert core.ship.x == center
+
+    actions.moving_right = False
+    actions.fire = 1
+    core.step(actions)
+    assert len(core.bullets) == 1
+    assert core.bullets[0].x == center + core.ship.width // 2 - ai_settings.bullet_width // 2
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+def test_numpy_fleet_backend_plays_the_same(screen):
+    games = []
+    for backend in ('lists', 'numpy'):
+        ai_settings = Settings()
+        ai_settings.fleet_backend = backend
+        ai_settings.fleet_drop_speed = 30
+        stats = GameStats(ai_settings)
+        core = gf.create_core(ai_settings, stats, screen)
+        core.start_game()
+        games.append((ai_settings, stats, core, Actions()))
+
+    for tick in range(3000):
+        for game in games:
+            actions = game[3]
+            actions.moving_right = tick // 400 % 2 == 0
+            actions.moving_left = not actions.moving_right
+            actions.fire = int(tick % 10 == 0)
+            game[2].step(actions)
+        assert snapshot(*games[0]) == snapshot(*games[1])
+
+    # the scenario has to destroy aliens and lose a spaceship
+    stats = games[1][1]
+    assert stats.score > 0 and stats.ships_left < games[1][0].ship_limit
+
+
+def test_lowest_aliens_skip_the_destroyed_and_the_empty_columns(ai_settings, screen):
+    core = gf.create_core(ai_settings, GameStats(ai_settings), screen)
+    lowest = core.rows - 1
+    assert [(alien.column, alien.row) for alien in core.lowest_aliens()] == [
+        (column, lowest) for column in range(core.columns)]
+
+    cells = core.aliens.cells
+    core.aliens.despawn(cells[(0, lowest)])
+    for row in range(core.rows):
+        core.aliens.despawn(cells[(1, row)])
+    assert core.lowest_alien(0) is cells[(0, lowest - 1)]
+    assert core.lowest_alien(1) is None
+    assert [(alien.column, alien.row) for alien in core.lowest_aliens()] == [
+        (0, lowest - 1)] + [(column, lowest) for column in range(2, core.columns)]
+
+
+def test_query_widens_the_area_by_one_pixel(ai_settings, screen):
+    core = gf.create_core(ai_settings, GameStats(ai_settings), screen)
+    alien = core.aliens.cells[(1, 1)]
+    left, top, right, bottom = alien.left, alien.top, alien.right, alien.bottom
+    assert (left, top, right, bottom) == (225, 117, 300, 156)
+    assert core.query(left, top, right, bottom) == [alien]
+
+    # an area touching an edge of the alien does not overlap it, but the
+    # alien is a candidate in case it rounds one pixel towards the area
+    for area in ((left - 20, top, left, bottom), (right, top, right + 20, bottom),
+                 (left, top - 20, right, top), (left, bottom, right, bottom + 20)):
+        assert alien in core.query(*area)
+        assert alien not in core.collide(*area)
+
+    # one more pixel away, the cell is not searched
+    for area in ((left - 20, top, left - 1, bottom), (right + 1, top, right + 20, bottom),
+                 (left, top - 20, right, top - 1), (left, bottom + 1, right, bottom + 20)):
+        assert alien not in core.query(*area)
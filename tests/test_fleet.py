@@ -0,0 +1,41 @@
+from src.characters.bullet_pool import BulletPool
+from src.characters.fleet import Fleet
+from src.statistics.game_stats import GameStats
+
+import src.utils.game_functions as gf
+
+
+def test_copy_keeps_the_type_and_the_cells(ai_settings, screen):
+    core = gf.create_core(ai_settings, GameStats(ai_settings), screen)
+    aliens = Fleet(ai_settings, screen)
+    aliens.sync(core.aliens.cells)
+
+    copy = aliens.copy()
+    assert type(copy) is Fleet
+    assert copy.sprites() == aliens.sprites()
+    assert copy.cells == aliens.cells
+
+    # the copy is a group of its own
+    core.aliens.despawn(core.aliens.cells[(0, 0)])
+    copy.sync(core.aliens.cells)
+    assert (0, 0) not in copy.cells
+    assert (0, 0) in aliens.cells
+    assert len(aliens) == len(copy) + 1
+
+
+def test_copy_of_a_bullet_pool_reuses_its_sprites(ai_settings, screen):
+    core = gf.create_core(ai_settings, GameStats(ai_settings), screen)
+    bullets = BulletPool(ai_settings, screen)
+    core.fire()
+    bullets.sync(core.bullets)
+
+    copy = bullets.copy()
+    assert type(copy) is BulletPool
+    assert copy.sprites() == bullets.sprites()
+
+    core.clear_bullets()
+    copy.sync(core.bullets)
+    assert len(copy) == 0 and len(bullets) == 1
+    core.fire()
+    copy.sync(core.bullets)
+    assert copy.sprites() == bullets.sprites()
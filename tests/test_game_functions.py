@@ -0,0 +1,61 @@
+import pygame
+
+from src.characters.bullet_pool import BulletPool
+from src.characters.fleet import Fleet
+from src.characters.ship import Ship
+from src.engine.core import Actions
+from src.gui.button import Button
+from src.gui.renderer import Renderer
+from src.statistics.game_stats import GameStats
+from src.statistics.scoreboard import Scoreboard
+
+import src.utils.game_functions as gf
+
+
+def test_sprites_draw_the_entities_of_the_core(ai_settings, screen):
+    stats = GameStats(ai_settings)
+    sb = Scoreboard(ai_settings, screen, stats)
+    core = gf.create_core(ai_settings, stats, screen)
+    actions = Actions()
+    ship = Ship(ai_settings, screen)
+    aliens = Fleet(ai_settings, screen)
+    bullets = BulletPool(ai_settings, screen)
+    renderer = Renderer(ai_settings, screen)
+    play_button = Button(ai_settings, screen, "Play")
+    gf.start_game(sb, core)
+
+    kills = 0
+    actions.moving_right = True
+    for tick in range(1200):
+        if tick % 10 == 0:
+            actions.fire += 1
+        kills += gf.update_game(stats, sb, core, actions)['kills']
+        gf.update_screen(ai_settings, stats, sb, core, ship, aliens, bullets, play_button,
+                         renderer, 1.0)
+
+        assert ship.rect.topleft == (core.ship.left, core.ship.top)
+        assert {alien.entity for alien in aliens} == set(core.aliens)
+        assert {bullet.entity for bullet in bullets} == set(core.bullets)
+        assert all(alien.rect.topleft == (alien.entity.left, alien.entity.top)
+                   for alien in aliens)
+        assert all(bullet.rect.topleft == (bullet.entity.left, bullet.entity.top)
+                   for bullet in bullets)
+
+    # the scenario has to destroy aliens for the sync to be tested
+    assert kills > 0
+    assert stats.score == kills * ai_settings.alien_points
+
+
+def test_space_bar_fires_on_the_next_tick(ai_settings, screen):
+    stats = GameStats(ai_settings)
+    sb = Scoreboard(ai_settings, screen, stats)
+    core = gf.create_core(ai_settings, stats, screen)
+    actions = Actions()
+    gf.start_game(sb, core)
+
+    space = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    gf.check_events(stats, sb, None, core, actions, [space, space])
+    assert actions.fire == 2 and not core.bullets
+
+    gf.update_game(stats, sb, core, actions)
+    assert actions.fire == 0 and len(core.bullets) == 2
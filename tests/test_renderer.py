@@ -0,0 +1,99 @@
+import pygame
+from pygame.sprite import Group
+
+from src.characters.alien import Alien
+from src.characters.bullet_pool import BulletPool
+from src.characters.fleet import Fleet
+from src.characters.ship import Ship
+from src.engine.components import FleetComponents
+from src.engine.core import Actions
+from src.gui.button import Button
+from src.gui.renderer import Renderer
+from src.statistics.game_stats import GameStats
+from src.statistics.scoreboard import Scoreboard
+
+import src.utils.game_functions as gf
+
+
+def draw_frame(renderer, sb, aliens):
+    renderer.begin_frame()
+    renderer.add(renderer.draw_aliens(aliens, 1.0))
+    renderer.add(sb.show_score())
+    renderer.present()
+
+
+def test_dirty_mode_erases_killed_aliens(ai_settings, screen):
+    ai_settings.render_mode = 'dirty'
+    ai_settings.fleet_render_mode = 'sprites'
+    renderer = Renderer(ai_settings, screen)
+    sb = Scoreboard(ai_settings, screen, GameStats(ai_settings))
+
+    aliens, entities = Group(), FleetComponents(75, 39)
+    for column in range(3):
+        entity = entities.spawn(100 + 150 * column, 200, column)
+        aliens.add(Alien(ai_settings, screen, entity))
+
+    draw_frame(renderer, sb, aliens)
+    assert all(alien.rect in renderer.rects for alien in aliens)
+
+    killed = aliens.sprites()[1]
+    killed.kill()
+    draw_frame(renderer, sb, aliens)
+    draw_frame(renderer, sb, aliens)
+    assert screen.get_at(killed.rect.center)[:3] == ai_settings.bg_color
+
+
+def test_dirty_mode_erases_lost_ship_icons(ai_settings, screen):
+    ai_settings.render_mode = 'dirty'
+    stats = GameStats(ai_settings)
+    renderer = Renderer(ai_settings, screen)
+    sb = Scoreboard(ai_settings, screen, stats)
+
+    draw_frame(renderer, sb, Group())
+    icons = [ship.rect.copy() for ship in sb.ships]
+    assert all(icon in renderer.rects for icon in icons)
+
+    stats.ships_left -= 1
+    sb.prep_ships()
+    draw_frame(renderer, sb, Group())
+    draw_frame(renderer, sb, Group())
+    assert screen.get_at(icons[-1].center)[:3] == ai_settings.bg_color
+
+
+def test_dirty_mode_updates_only_around_a_moving_composite_fleet(ai_settings, screen):
+    ai_settings.render_mode = 'dirty'
+    ai_settings.fleet_render_mode = 'composite'
+    stats = GameStats(ai_settings)
+    sb = Scoreboard(ai_settings, screen, stats)
+    core = gf.create_core(ai_settings, stats, screen)
+    ship = Ship(ai_settings, screen)
+    aliens = Fleet(ai_settings, screen)
+    bullets = BulletPool(ai_settings, screen)
+    renderer = Renderer(ai_settings, screen)
+    play_button = Button(ai_settings, screen, "Play")
+    gf.start_game(sb, core)
+
+    for tick in range(300):
+        gf.update_game(stats, sb, core, Actions())
+        gf.update_screen(ai_settings, stats, sb, core, ship, aliens, bullets, play_button,
+                         renderer, 1.0)
+
+    # the fleet image of both frames is counted once, so only the first frame flips
+    assert renderer.frames == 300
+    assert renderer.flips == 1
+
+
+def test_exposed_window_is_fully_redrawn(ai_settings, screen):
+    ai_settings.render_mode = 'dirty'
+    renderer = Renderer(ai_settings, screen)
+    sb = Scoreboard(ai_settings, screen, GameStats(ai_settings))
+    draw_frame(renderer, sb, Group())
+    assert not renderer.full_redraw
+
+    renderer.check_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)])
+    assert not renderer.full_redraw
+    renderer.check_events([pygame.event.Event(pygame.WINDOWEXPOSED)])
+    assert renderer.full_redraw
+
+    draw_frame(renderer, sb, Group())
+    assert renderer.flips == 2
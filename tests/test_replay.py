@@ -0,0 +1,83 @@
+import json
+
+import pygame
+
+import main
+from src.engine.core import Actions
+from src.gui.button import Button
+from src.gui.settings import Settings
+from src.statistics.game_stats import GameStats
+from src.statistics.scoreboard import Scoreboard
+from src.utils.replay import InputRecorder, load_recording
+
+import src.utils.game_functions as gf
+
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, key=key_code)
+
+
+def new_game(ai_settings, screen):
+    """Returns the objects main() passes to run_replay(), for a game on the Play screen."""
+    stats = GameStats(ai_settings)
+    sb = Scoreboard(ai_settings, screen, stats)
+    play_button = Button(ai_settings, screen, "Play")
+    core = gf.create_core(ai_settings, stats, screen)
+    return ai_settings, stats, sb, play_button, core, Actions()
+
+
+def record_session(path, screen):
+    """Plays a scripted session from the Play screen and records it."""
+    ai_settings = Settings()
+    ai_settings.replay_hash_every = 30
+    game = new_game(ai_settings, screen)
+    ai_settings, stats, sb, play_button, core, actions = game
+
+    script = {
+        0: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=play_button.rect.center, button=1)],
+        45: [key(pygame.KEYDOWN, pygame.K_RIGHT)],
+        100: [key(pygame.KEYDOWN, pygame.K_SPACE)],
+        250: [key(pygame.KEYUP, pygame.K_RIGHT), key(pygame.KEYDOWN, pygame.K_LEFT)],
+        301: [key(pygame.KEYDOWN, pygame.K_SPACE)],
+        410: [key(pygame.KEYUP, pygame.K_LEFT)],
+    }
+    recorder = InputRecorder(path, ai_settings, stats, core, actions)
+    ticks = 0
+    for tick in range(600):
+        events = script.get(tick, [])
+        recorder.record_events(ticks, events)
+        gf.check_events(stats, sb, play_button, core, actions, events)
+        if stats.game_active:
+            gf.update_game(stats, sb, core, actions)
+            ticks += 1
+            recorder.record_tick(ticks, ai_settings, stats, core, actions)
+    recorder.close(ticks, ai_settings, stats, core, actions)
+    assert stats.game_active and ticks == 600
+
+
+def replay(path, screen):
+    ai_settings = Settings()
+    start_state, records = load_recording(str(path), ai_settings)
+    return main.run_replay(*new_game(ai_settings, screen), start_state, records)
+
+
+def test_replay_matches_the_recording(screen, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    record_session(str(path), screen)
+    assert replay(path, screen) is None
+
+
+def test_replay_reports_a_mutated_event_at_the_next_hash(screen, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    record_session(str(path), screen)
+
+    # the spaceship turns left at tick 250 instead of going on to the right
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    index = records.index({'tick': 250, 'event': [pygame.KEYUP, pygame.K_RIGHT]})
+    records[index]['event'] = [pygame.KEYDOWN, pygame.K_RIGHT]
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+    # the hash of tick 240 was taken before the event, the one of tick 270 after it
+    mismatch = replay(path, screen)
+    assert mismatch is not None
+    assert mismatch.endswith("at tick 270")
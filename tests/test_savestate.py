@@ -0,0 +1,79 @@
+import pytest
+
+from src.engine.core import Actions
+from src.gui.settings import Settings
+from src.statistics.game_stats import GameStats
+from src.utils.savestate import restore, snapshot
+
+import src.utils.game_functions as gf
+
+
+def new_game(screen):
+    """Returns the settings, the statistics, the core and the actions of a started game."""
+    ai_settings = Settings()
+    stats = GameStats(ai_settings)
+    core = gf.create_core(ai_settings, stats, screen)
+    core.start_game()
+    return ai_settings, stats, core, Actions()
+
+
+def play(game, first, ticks):
+    """Plays a scripted session and returns the snapshot of every tick."""
+    ai_settings, stats, core, actions = game
+    states = []
+    for tick in range(first, first + ticks):
+        actions.moving_right = tick // 400 % 2 == 0
+        actions.moving_left = not actions.moving_right
+        if tick % 10 == 0:
+            actions.fire += 1
+        core.step(actions)
+        states.append(snapshot(*game))
+    return states
+
+
+def test_restore_then_snapshot_gives_the_same_bytes(screen):
+    game = new_game(screen)
+    for first, ticks in ((0, 1), (1, 700), (701, 1500)):
+        play(game, first, ticks)
+        blob = snapshot(*game)
+        restore(blob, *game)
+        assert snapshot(*game) == blob
+
+    # the scenario has to reach a damaged fleet with bullets in flight
+    ai_settings, stats, core, actions = game
+    assert stats.score > 0 and core.bullets
+
+
+def test_rollback_after_kills_plays_the_same(screen):
+    game = new_game(screen)
+    play(game, 0, 300)
+    ai_settings, stats, core, actions = game
+    blob, score, number_aliens = snapshot(*game), stats.score, len(core.aliens)
+
+    recorded = play(game, 300, 1500)
+    assert stats.score > score and len(core.aliens) < number_aliens
+
+    restore(blob, *game)
+    assert stats.score == score and len(core.aliens) == number_aliens
+    assert play(game, 300, 1500) == recorded
+
+
+def test_restore_into_a_fresh_game_plays_the_same(screen):
+    game = new_game(screen)
+    play(game, 0, 1000)
+    blob = snapshot(*game)
+    recorded = play(game, 1000, 1500)
+
+    # another game, whose dynamic settings and fleet differ
+    other = new_game(screen)
+    other[0].increase_speed()
+    play(other, 0, 50)
+    restore(blob, *other)
+    assert snapshot(*other) == blob
+    assert play(other, 1000, 1500) == recorded
+
+
+def test_restore_rejects_other_bytes(screen):
+    game = new_game(screen)
+    with pytest.raises(ValueError):
+        restore(b'AISV\x01' + snapshot(*game)[5:], *game)
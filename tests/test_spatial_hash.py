@@ -0,0 +1,47 @@
+import random
+
+from src.engine.components import Components
+from src.utils.collisions import groupcollide, spatial_groupcollide
+from src.utils.spatial_hash import SpatialHash
+
+
+def random_scene(rng, number_aliens, number_bullets):
+    alien_table, bullet_table = Components(75, 39), Components(3, 15)
+    aliens = [alien_table.spawn(rng.uniform(0, 600), rng.uniform(0, 400))
+              for _ in range(number_aliens)]
+    bullets = [bullet_table.spawn(rng.uniform(0, 675), rng.uniform(0, 430))
+               for _ in range(number_bullets)]
+    return aliens, bullets
+
+
+def test_query_returns_candidates_in_insertion_order():
+    grid = SpatialHash(75, 39)
+    table = Components(75, 39)
+    aliens = [table.spawn(10 + 5 * index, 10) for index in range(6)]
+    grid.sync(aliens)
+
+    # moving the first aliens to other cells keeps their rank
+    for alien in aliens[:3]:
+        alien.x += 80
+    grid.sync(aliens)
+
+    candidates = grid.query(0, 0, 300, 100)
+    assert candidates == aliens
+    assert grid.query(0, 0, 3, 3) == aliens[3:]
+
+
+def test_spatial_groupcollide_matches_groupcollide_in_order():
+    rng = random.Random(7)
+    for _ in range(50):
+        aliens, bullets = random_scene(rng, 200, 60)
+        grid = SpatialHash(75, 39)
+
+        expected = groupcollide(bullets, aliens)
+        found = spatial_groupcollide(bullets, aliens, grid)
+        assert list(found.items()) == list(expected.items())
+
+        # the grid is left as it was, so the next pass gives the same hits
+        assert list(spatial_groupcollide(bullets, aliens, grid).items()) == list(expected.items())
+
+        # some bullets hit several aliens, so the order is tested
+        assert any(len(hits) > 1 for hits in expected.values())
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from src.statistics.game_stats import GameStats
+from src.utils.collisions import np
+
+import src.utils.game_functions as gf
+
+NUMPY = pytest.param('numpy', marks=pytest.mark.skipif(np is None, reason="NumPy is not installed"))
+
+
+@pytest.mark.parametrize('mode', ['rect', 'mask'])
+@pytest.mark.parametrize('backend', ['groupcollide', 'spatial_hash', NUMPY, 'lattice'])
+def test_fast_bullets_do_not_tunnel_through_the_fleet(ai_settings, screen, backend, mode):
+    ai_settings.collision_backend = backend
+    ai_settings.collision_mode = mode
+    ai_settings.collision_sweep = True
+    core = gf.create_core(ai_settings, GameStats(ai_settings), screen)
+    for level in range(40):
+        ai_settings.increase_speed()
+    alien_width, alien_height = core.alien_size
+
+    # the bullets move further than an alien is tall in a single tick
+    assert ai_settings.bullet_speed_factor * core.dt > 2 * alien_height
+
+    rng = random.Random(40)
+    for volley in range(20):
+        core.aliens.clear()
+        core.create_fleet()
+        for column in range(core.columns):
+            center = alien_width + 2 * alien_width * column + alien_width // 2
+            core.spawn_bullet(center - ai_settings.bullet_width // 2,
+                              core.ship.y - rng.uniform(0.0, 150.0),
+                              ai_settings.bullet_speed_factor)
+
+        while core.bullets:
+            core.update_bullets()
+
+        # every bullet destroyed the lowest alien of its column, and nothing else
+        lowest = core.rows - 1
+        assert sorted(core.aliens.cells) == sorted(
+            (column, row) for column in range(core.columns) for row in range(lowest))